@@ -0,0 +1,107 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import re
+from urllib import parse
+
+import httplib2
+
+import hyou.api
+import hyou.collection
+
+KEY = 'synthetic'
+TITLE = 'Sheet1'
+
+_VALUES_RE = re.compile(
+    r'/spreadsheets/[^/]+/values/[^!]+!([A-Z]+)(\d+):([A-Z]+)(\d+)$')
+
+
+def _parse_column(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+class SyntheticHttp(object):
+    """
+    In-memory http object serving a spreadsheet with one worksheet of
+    `rows` x `cols` cells, like `test.http_mocks.ReplayHttp` serves recorded
+    responses.
+
+    Responses are encoded once and cached, so benchmarks measure the client
+    side only.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self._responses = {}
+        self.last_request_body = None
+
+    def cell(self, row, col):
+        return 'r%dc%d' % (row, col)
+
+    def request(self, uri, method='GET', body=None, *args, **kwargs):
+        self.last_request_body = body
+        path = parse.unquote(parse.urlsplit(uri).path)
+        if method != 'GET':
+            return self._ok(b'{}')
+        content = self._responses.get(path)
+        if content is None:
+            content = self._responses[path] = json.dumps(
+                self._respond(path)).encode('utf-8')
+        return self._ok(content)
+
+    def _respond(self, path):
+        match = _VALUES_RE.search(path)
+        if not match:
+            return {
+                'spreadsheetId': KEY,
+                'properties': {'title': 'Synthetic'},
+                'sheets': [{
+                    'properties': {
+                        'sheetId': 0,
+                        'title': TITLE,
+                        'index': 0,
+                        'sheetType': 'GRID',
+                        'gridProperties': {
+                            'rowCount': self.rows,
+                            'columnCount': self.cols,
+                        },
+                    },
+                }],
+            }
+        start_col = _parse_column(match.group(1))
+        start_row = int(match.group(2)) - 1
+        end_col = _parse_column(match.group(3)) + 1
+        end_row = int(match.group(4))
+        return {
+            'range': path.rsplit('/', 1)[-1],
+            'majorDimension': 'ROWS',
+            'values': [
+                [self.cell(row, col) for col in range(start_col, end_col)]
+                for row in range(start_row, end_row)],
+        }
+
+    @staticmethod
+    def _ok(content):
+        return httplib2.Response({'status': 200}), content
+
+
+def make_worksheet(rows, cols):
+    """Return a worksheet served by a new `SyntheticHttp`."""
+    api = hyou.api.API(SyntheticHttp(rows, cols), discovery=False)
+    return hyou.collection.Collection(api)[KEY][TITLE]
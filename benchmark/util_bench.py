@@ -0,0 +1,43 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import hyou.util
+
+
+@pytest.mark.benchmark(group='util')
+def test_format_range_a1_notation(benchmark):
+    def format_ranges():
+        for start_row in range(0, 10 ** 4, 100):
+            for start_col in range(0, 1000, 100):
+                hyou.util.format_range_a1_notation(
+                    'Sheet \'1\'', start_row, start_row + 100,
+                    start_col, start_col + 100)
+
+    benchmark(format_ranges)
+
+
+@pytest.mark.benchmark(group='lazy-ordered-dictionary')
+@pytest.mark.parametrize('size', [10 ** 3, 10 ** 4, 10 ** 5])
+def test_ensure_enumerated(benchmark, size):
+    def enumerator():
+        for i in range(size):
+            yield ('key%d' % i, i)
+
+    def setup():
+        return (hyou.util.LazyOrderedDictionary(enumerator, None),), {}
+
+    benchmark.pedantic(
+        lambda d: d._ensure_enumerated(), setup=setup, rounds=10)
@@ -0,0 +1,134 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import hyou.storage
+
+from . import synthetic_http
+
+# (rows, cols) of views with 10^4, 10^5 and 10^6 cells.
+SIZES = [(100, 100), (1000, 100), (10000, 100)]
+SIZE_IDS = ['10k', '100k', '1M']
+STORAGES = [hyou.storage.DictStorage, hyou.storage.ColumnarStorage]
+
+
+def _rounds(rows, cols):
+    # Keep each benchmark of the largest views within a few seconds.
+    return max(3, 10 ** 6 // (rows * cols))
+
+
+@pytest.fixture(scope='module', params=SIZES, ids=SIZE_IDS)
+def worksheet(request):
+    return synthetic_http.make_worksheet(*request.param)
+
+
+@pytest.fixture(scope='module')
+def fetched_view(worksheet):
+    view = worksheet.view()
+    view._ensure_cells_fetched()
+    return view
+
+
+@pytest.mark.benchmark(group='view-create')
+def test_create(benchmark, worksheet):
+    benchmark(worksheet.view)
+
+
+@pytest.mark.benchmark(group='view-fetch')
+@pytest.mark.parametrize(
+    'storage', STORAGES, ids=[storage.__name__ for storage in STORAGES])
+def test_fetch(benchmark, worksheet, storage):
+    def setup():
+        # Otherwise rounds are served from cells cached by the first one.
+        worksheet.tile_cache.clear()
+        return (worksheet.view(storage=storage),), {}
+
+    benchmark.pedantic(
+        lambda view: view._ensure_cells_fetched(), setup=setup,
+        rounds=_rounds(worksheet.rows, worksheet.cols))
+
+
+@pytest.mark.benchmark(group='view-getitem')
+def test_getitem(benchmark, fetched_view):
+    rows = range(fetched_view.rows)
+    cols = range(fetched_view.cols)
+
+    def read_all():
+        for i in rows:
+            row = fetched_view[i]
+            for j in cols:
+                row[j]
+
+    benchmark.pedantic(
+        read_all, rounds=_rounds(fetched_view.rows, fetched_view.cols))
+
+
+@pytest.mark.benchmark(group='view-iter')
+def test_iter(benchmark, fetched_view):
+    benchmark.pedantic(
+        lambda: [list(row) for row in fetched_view],
+        rounds=_rounds(fetched_view.rows, fetched_view.cols))
+
+
+@pytest.mark.benchmark(group='view-setitem')
+def test_setitem(benchmark, worksheet):
+    rows = range(worksheet.rows)
+    cols = range(worksheet.cols)
+
+    def setup():
+        return (worksheet.view(),), {}
+
+    def write_all(view):
+        for i in rows:
+            row = view[i]
+            for j in cols:
+                row[j] = 'x'
+
+    benchmark.pedantic(
+        write_all, setup=setup,
+        rounds=_rounds(worksheet.rows, worksheet.cols))
+
+
+@pytest.mark.benchmark(group='view-commit')
+def test_commit(benchmark, worksheet):
+    """Build and send the request body of a commit of all cells."""
+    def setup():
+        view = worksheet.view()
+        for i in range(view.rows):
+            row = view[i]
+            for j in range(view.cols):
+                row[j] = 'x'
+        return (view,), {}
+
+    benchmark.pedantic(
+        lambda view: view.commit(), setup=setup,
+        rounds=_rounds(worksheet.rows, worksheet.cols))
+
+
+@pytest.mark.benchmark(group='list-helpers')
+def test_list_helpers(benchmark):
+    view = synthetic_http.make_worksheet(1, 10 ** 4).view()
+    view._ensure_cells_fetched()
+    row = view[0]
+    values = list(row)
+    last = values[-1]
+
+    def helpers():
+        assert row == values
+        assert last in row
+        assert row.index(last) == len(values) - 1
+        assert row.count(last) == 1
+
+    benchmark(helpers)
@@ -17,6 +17,7 @@ from __future__ import (
 
 from .collection import Collection
 from .spreadsheet import Spreadsheet
+from .typed import TypedValues
 from .util import SCOPES
 from .view import View
 from .worksheet import Worksheet
@@ -30,6 +31,7 @@ __all__ = [
     'Collection',
     'SCOPES',
     'Spreadsheet',
+    'TypedValues',
     'View',
     'Worksheet',
     'login',
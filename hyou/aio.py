@@ -0,0 +1,384 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import contextlib
+import functools
+
+from . import api
+from . import collection
+from . import util
+
+
+class _AsyncBase(object):
+
+    def __init__(self, executor):
+        self._executor = executor
+
+    def _call(self, func, *args, **kwargs):
+        return api.call_async(
+            functools.partial(func, *args, **kwargs), self._executor)
+
+
+class AsyncCollection(_AsyncBase):
+    """
+    asyncio interface to a collection of spreadsheets.
+
+    HTTP requests are run in `executor`, or the default executor of the event
+    loop if it is None. Retries on server errors wait with `asyncio.sleep`, so
+    they never block a thread.
+    """
+
+    def __init__(self, api, executor=None):
+        super(AsyncCollection, self).__init__(executor)
+        self._collection = collection.Collection(api)
+
+    @classmethod
+    def login(cls, json_path=None, json_text=None, discovery=False,
+              cache=None, rate_limiter=None, executor=None):
+        sync_collection = collection.Collection.login(
+            json_path=json_path, json_text=json_text, discovery=discovery,
+            cache=cache, rate_limiter=rate_limiter)
+        return cls(sync_collection._api, executor=executor)
+
+    @property
+    def collection(self):
+        """The underlying blocking `Collection`."""
+        return self._collection
+
+    async def refresh(self):
+        self._collection.refresh()
+
+    async def keys(self):
+        return await self._call(self._collection.keys)
+
+    async def get(self, key):
+        def get_spreadsheet():
+            spreadsheet = self._collection[key]
+            spreadsheet._ensure_entry()
+            return spreadsheet
+        return AsyncSpreadsheet(
+            await self._call(get_spreadsheet), self._executor)
+
+    async def create_spreadsheet(self, title, rows=1000, cols=26):
+        return AsyncSpreadsheet(
+            await self._call(
+                self._collection.create_spreadsheet, title, rows, cols),
+            self._executor)
+
+
+class AsyncSpreadsheet(_AsyncBase):
+    """
+    asyncio interface to a `Spreadsheet`.
+
+    The spreadsheet metadata is always loaded, so worksheets can be looked up
+    without awaiting.
+    """
+
+    def __init__(self, spreadsheet, executor=None):
+        super(AsyncSpreadsheet, self).__init__(executor)
+        self._spreadsheet = spreadsheet
+
+    def __repr__(self):
+        return 'AsyncSpreadsheet(key=%r)' % self.key
+
+    @property
+    def spreadsheet(self):
+        """The underlying blocking `Spreadsheet`."""
+        return self._spreadsheet
+
+    @property
+    def key(self):
+        return self._spreadsheet.key
+
+    @property
+    def url(self):
+        return self._spreadsheet.url
+
+    @property
+    def title(self):
+        return self._spreadsheet.title
+
+    def __getitem__(self, key):
+        return AsyncWorksheet(self._spreadsheet[key], self._executor)
+
+    def __len__(self):
+        return len(self._spreadsheet)
+
+    def __iter__(self):
+        return iter(self._spreadsheet)
+
+    def keys(self):
+        return self._spreadsheet.keys()
+
+    async def refresh(self):
+        await self._call(self._spreadsheet.refresh)
+
+    async def set_title(self, new_title):
+        def set_title():
+            self._spreadsheet.title = new_title
+        await self._call(set_title)
+
+    async def updated(self):
+        return await self._call(lambda: self._spreadsheet.updated)
+
+    @contextlib.asynccontextmanager
+    async def batch(self):
+        """asyncio version of `Spreadsheet.batch`."""
+        spreadsheet = self._spreadsheet
+        if spreadsheet._batch_requests is not None:
+            yield
+            return
+        await self._call(spreadsheet._begin_batch)
+        try:
+            yield
+        except BaseException:
+            if spreadsheet._end_batch():
+                spreadsheet._discard_entry()
+            raise
+        requests = spreadsheet._end_batch()
+        if requests:
+            try:
+                await self._call(spreadsheet.make_batch_request, requests)
+            except BaseException:
+                spreadsheet._discard_entry()
+                raise
+
+    async def fetch_views(self, views):
+        """Fetch cells of multiple `AsyncView`s of this spreadsheet at once."""
+        await self._call(
+            self._spreadsheet.fetch_views, [view.view for view in views])
+
+    async def add_worksheet(self, title, rows=1000, cols=26):
+        return AsyncWorksheet(
+            await self._call(
+                self._spreadsheet.add_worksheet, title, rows, cols),
+            self._executor)
+
+    async def delete_worksheet(self, title):
+        await self._call(self._spreadsheet.delete_worksheet, title)
+
+
+class AsyncWorksheet(_AsyncBase):
+    """asyncio interface to a `Worksheet`."""
+
+    def __init__(self, worksheet, executor=None):
+        super(AsyncWorksheet, self).__init__(executor)
+        self._worksheet = worksheet
+
+    def __repr__(self):
+        return 'AsyncWorksheet(key=%r)' % self.key
+
+    @property
+    def worksheet(self):
+        """The underlying blocking `Worksheet`."""
+        return self._worksheet
+
+    @property
+    def key(self):
+        return self._worksheet.key
+
+    @property
+    def title(self):
+        return self._worksheet.title
+
+    @property
+    def rows(self):
+        return self._worksheet.rows
+
+    @property
+    def cols(self):
+        return self._worksheet.cols
+
+    @property
+    def frozen_rows(self):
+        return self._worksheet.frozen_rows
+
+    @property
+    def frozen_cols(self):
+        return self._worksheet.frozen_cols
+
+    def view(self, *args, **kwargs):
+        return AsyncView(
+            self._worksheet.view(*args, **kwargs), self._executor)
+
+    async def refresh(self):
+        await self._call(self._worksheet.refresh)
+
+    async def set_title(self, new_title):
+        def set_title():
+            self._worksheet.title = new_title
+        await self._call(set_title)
+
+    async def set_size(self, rows, cols):
+        await self._call(self._worksheet.set_size, rows, cols)
+
+    async def set_frozen_size(self, rows, cols):
+        await self._call(self._worksheet.set_frozen_size, rows, cols)
+
+    async def write_frame(self, frame, start_row=0, start_col=0, header=True):
+        await self._call(
+            self._worksheet.write_frame, frame, start_row, start_col, header)
+
+    async def append_rows(self, rows, batch_size=1000):
+        """
+        Append `rows` after the last non-empty row of the worksheet.
+
+        This is the asynchronous version of `Worksheet.append_rows`. `rows`
+        may also be an asynchronous iterable.
+        """
+        if batch_size <= 0:
+            raise ValueError('batch_size must be positive')
+        appended = 0
+        batch = []
+
+        async def append():
+            await api.call_async(
+                functools.partial(self._worksheet._append_batch, batch),
+                self._executor, idempotent=False)
+            return len(batch)
+
+        if hasattr(rows, '__aiter__'):
+            async_rows = rows
+        else:
+            async def async_rows_from(rows):
+                for row in rows:
+                    yield row
+            async_rows = async_rows_from(rows)
+        async for row in async_rows:
+            batch.append([util.normalize_cell_value(value) for value in row])
+            if len(batch) == batch_size:
+                appended += await append()
+                batch = []
+        if batch:
+            appended += await append()
+        return appended
+
+    async def iter_rows(self, chunk_rows=1000, prefetch=1, start_row=None,
+                        end_row=None, start_col=None, end_col=None,
+                        fetch_params=None):
+        """
+        Iterate over rows of the worksheet as lists of cell values.
+
+        This is the asynchronous version of `Worksheet.iter_rows`. Up to
+        `prefetch` following windows are fetched concurrently while the
+        caller processes the current one.
+        """
+        if chunk_rows <= 0:
+            raise ValueError('chunk_rows must be positive')
+        if prefetch < 0:
+            raise ValueError('prefetch must not be negative')
+        start_row, end_row, _ = slice(start_row, end_row).indices(self.rows)
+
+        async def fetch(window_start):
+            window = self._worksheet.view(
+                start_row=window_start,
+                end_row=min(window_start + chunk_rows, end_row),
+                start_col=start_col, end_col=end_col,
+                fetch_params=fetch_params, use_tile_cache=False)
+            await self._call(window._ensure_cells_fetched)
+            return window
+
+        pending = collections.deque()
+        try:
+            for window_start in range(start_row, end_row, chunk_rows):
+                pending.append(asyncio.ensure_future(fetch(window_start)))
+                if len(pending) <= prefetch:
+                    continue
+                for row in await pending.popleft():
+                    yield list(row)
+            while pending:
+                for row in await pending.popleft():
+                    yield list(row)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class AsyncView(_AsyncBase):
+    """
+    asyncio interface to a `View`.
+
+    Reading cells before awaiting `fetch` blocks the event loop to fetch
+    them, so call `fetch` first. Writing cells never blocks.
+    """
+
+    def __init__(self, view, executor=None):
+        super(AsyncView, self).__init__(executor)
+        self._view = view
+
+    def __repr__(self):
+        return 'AsyncView(%r)' % self._view
+
+    @property
+    def view(self):
+        """The underlying blocking `View`."""
+        return self._view
+
+    async def fetch(self):
+        await self._call(self._view._ensure_cells_fetched)
+
+    async def refresh(self):
+        """Discard the cache and uncommitted writes, then fetch cells."""
+        self._view.refresh()
+        await self.fetch()
+
+    async def commit(self, **kwargs):
+        """
+        Send queued writes. Arguments are passed to `View.commit`; note that
+        `progress` is called in a thread of the executor.
+        """
+        await self._call(self._view.commit, **kwargs)
+
+    async def clear(self):
+        await self._call(self._view.clear)
+
+    def __getitem__(self, index):
+        return self._view[index]
+
+    def __setitem__(self, index, new_value):
+        self._view[index] = new_value
+
+    def __len__(self):
+        return len(self._view)
+
+    async def __aiter__(self):
+        await self.fetch()
+        for row in self._view:
+            yield row
+
+    @property
+    def rows(self):
+        return self._view.rows
+
+    @property
+    def cols(self):
+        return self._view.cols
+
+    @property
+    def start_row(self):
+        return self._view.start_row
+
+    @property
+    def end_row(self):
+        return self._view.end_row
+
+    @property
+    def start_col(self):
+        return self._view.start_col
+
+    @property
+    def end_col(self):
+        return self._view.end_col
@@ -13,58 +13,264 @@
 # limitations under the License.
 
 
+import contextlib
+import contextvars
+import datetime
+import email.utils
 import functools
+import logging
 import random
 import socket
 import ssl
+import threading
 import time
 
-import googleapiclient.discovery
-import googleapiclient.errors
-
+from . import instrumentation
+from . import ratelimit
 from . import schema
+from . import util
+
+# googleapiclient and google-auth take a long time to import, so they are
+# imported where they are first needed.
+
+_logger = logging.getLogger(__name__)
 
 SHEETS_API_DISCOVERY_URL = (
     'https://sheets.googleapis.com/$discovery/rest?version=v4')
 
+# name -> (version, schema name, discovery service URL)
+_SERVICES = {
+    'sheets': ('v4', 'sheets_v4', SHEETS_API_DISCOVERY_URL),
+    'drive': ('v2', 'drive_v2', None),
+}
+
 # Maximum amount of time we want to spend retrying failed requests.
 MAX_WAIT_TIME = 200
 
+# Bounds of waits between retries, in seconds.
+BASE_DELAY = 1.0
+MAX_DELAY = 32.0
+
 
-def retry_on_server_error(wrapped_func):
+def retry_on_server_error(wrapped_func=None, idempotent=True):
     """
     Return a decorator to retry API calls which fail with 50x status codes,
-    using an exponential backoff strategy with up to `NUM_RETRIES` retries.
+    using an exponential backoff strategy with decorrelated jitter. Limits of
+    retries can be set with `retry_scope`.
+
+    If `idempotent` is False, the call is retried on server errors and
+    timeouts, after which the request may have been applied, only if
+    enabled by `retry_scope`. It is always retried on rate errors.
     """
+    if wrapped_func is None:
+        return functools.partial(
+            retry_on_server_error, idempotent=idempotent)
+
     @functools.wraps(wrapped_func)
     def wrapper(*args, **kwargs):
         partial_func = functools.partial(wrapped_func, *args, **kwargs)
-        return _do_exp_backoff(partial_func, MAX_WAIT_TIME)
+        outer_operation = getattr(_retry_state, 'operation', None)
+        _retry_state.operation = wrapped_func.__qualname__
+        try:
+            if getattr(_retry_state, 'disabled', False):
+                return partial_func()
+            return _do_exp_backoff(
+                partial_func, _current_max_wait_time(),
+                idempotent=idempotent)
+        finally:
+            _retry_state.operation = outer_operation
 
     return wrapper
 
 
+# Per-thread state of the innermost retried call: `operation` is the name of
+# the decorated function and `backoff` is its _Backoff, reported in request
+# events. Retries are `disabled` in threads running calls for `call_async`,
+# which does the backoff itself without blocking the thread.
+_retry_state = threading.local()
+
+
+def _get_retry_state():
+    """
+    Return (operation, retries, backoff_time) of the current call for
+    request events. The backoff time is reported once, by the first request
+    after it.
+    """
+    operation = getattr(_retry_state, 'operation', None)
+    backoff = getattr(_retry_state, 'backoff', None)
+    if backoff is None:
+        return operation, 0, 0.0
+    backoff_time, backoff.last_backoff = backoff.last_backoff, 0.0
+    return operation, backoff.num_retry, backoff_time
+
+
+# The innermost _RetryScope, or None.
+_retry_scope = contextvars.ContextVar('hyou_retry_scope', default=None)
+
+# Guards retry budgets, as a scope is shared by the threads started for it.
+_retry_budget_lock = threading.Lock()
+
+
+class _RetryScope(object):
+
+    def __init__(self, parent, deadline, max_retries, max_wait_time,
+                 retry_non_idempotent):
+        self.parent = parent
+        self.deadline = deadline
+        self.retries_left = max_retries
+        self.max_wait_time = max_wait_time
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def chain(self):
+        scope = self
+        while scope is not None:
+            yield scope
+            scope = scope.parent
+
+    def remaining_time(self):
+        """Return seconds until the nearest deadline, or None."""
+        deadlines = [
+            scope.deadline for scope in self.chain()
+            if scope.deadline is not None]
+        if not deadlines:
+            return None
+        return min(deadlines) - time.monotonic()
+
+    def take_retry(self):
+        """Consume a retry from the budgets, or return False if exhausted."""
+        scopes = [
+            scope for scope in self.chain() if scope.retries_left is not None]
+        with _retry_budget_lock:
+            if any(scope.retries_left <= 0 for scope in scopes):
+                return False
+            for scope in scopes:
+                scope.retries_left -= 1
+        return True
+
+    def get(self, name, default):
+        for scope in self.chain():
+            value = getattr(scope, name)
+            if value is not None:
+                return value
+        return default
+
+
+@contextlib.contextmanager
+def retry_scope(deadline=None, max_retries=None, max_wait_time=None,
+                retry_non_idempotent=None):
+    """
+    Limit retries of API calls made in the context.
+
+    No retry is started after `deadline` seconds from entering the context,
+    and at most `max_retries` retries are made in total by all calls in the
+    context. `max_wait_time` overrides `MAX_WAIT_TIME` for each call.
+    `retry_non_idempotent` enables retrying non-idempotent calls on server
+    errors. Nested scopes are limited by the deadlines and budgets of outer
+    scopes too.
+
+    The scope applies to the current thread or asyncio task, and threads
+    started by hyou for it.
+    """
+    if deadline is not None:
+        deadline = time.monotonic() + deadline
+    scope = _RetryScope(
+        _retry_scope.get(), deadline, max_retries, max_wait_time,
+        retry_non_idempotent)
+    token = _retry_scope.set(scope)
+    try:
+        yield
+    finally:
+        _retry_scope.reset(token)
+
+
+def _current_max_wait_time():
+    scope = _retry_scope.get()
+    if scope is None:
+        return MAX_WAIT_TIME
+    return scope.get('max_wait_time', MAX_WAIT_TIME)
+
+
+def _parse_retry_after(http_error):
+    """
+    Return the number of seconds to wait requested by the Retry-After header
+    of `http_error`, or None.
+    """
+    try:
+        value = http_error.resp.get('retry-after')
+    except AttributeError:
+        return None
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (date - now).total_seconds())
+
+
 class _Backoff:
     """Helper class to keep state when doing exponential backoff."""
 
-    def __init__(self, max_wait_time):
+    def __init__(self, max_wait_time, scope=None):
         self.max_wait_time = max_wait_time
+        self.scope = scope
         self.num_retry = 0
         self.total_wait_time = 0.0
         self.do_wait = True
+        self.last_wait = BASE_DELAY
+        # The last wait not reported in a request event yet.
+        self.last_backoff = 0.0
 
-    def backoff(self, exc):
-        if self.do_wait:
-            self.num_retry += 1
-            upper_bound = 2 ** self.num_retry
-            backoff = random.random() * upper_bound
-            if self.total_wait_time + backoff > self.max_wait_time:
-                backoff = self.max_wait_time - self.total_wait_time
-                self.do_wait = False
-            time.sleep(backoff)
-            self.total_wait_time += backoff
+    def next_wait(self, exc):
+        """
+        Return the number of seconds to wait before retrying, or raise `exc`
+        if we have waited long enough.
+        """
+        if not self.do_wait:
+            raise exc
+        retry_after = None
+        if hasattr(exc, 'resp'):
+            retry_after = _parse_retry_after(exc)
+        if retry_after is not None:
+            backoff = retry_after
         else:
+            # Decorrelated jitter spreads out retries of concurrent clients
+            # better than full jitter while still growing exponentially.
+            backoff = min(
+                MAX_DELAY, random.uniform(BASE_DELAY, self.last_wait * 3))
+        remaining = self.max_wait_time - self.total_wait_time
+        if self.scope is not None:
+            remaining_time = self.scope.remaining_time()
+            if remaining_time is not None:
+                remaining = min(remaining, remaining_time)
+        do_wait = True
+        wait = backoff
+        if backoff > remaining:
+            if retry_after is not None or remaining <= 0:
+                # The server would reject a retry before the deadline.
+                raise exc
+            wait = remaining
+            do_wait = False
+        # Only a retry which will be made is taken from the budgets.
+        if self.scope is not None and not self.scope.take_retry():
             raise exc
+        if retry_after is None:
+            self.last_wait = backoff
+        self.do_wait = do_wait
+        self.num_retry += 1
+        self.total_wait_time += wait
+        self.last_backoff = wait
+        return wait
+
+    def backoff(self, exc):
+        time.sleep(self.next_wait(exc))
 
 
 def _is_retryable_err(http_error):
@@ -84,40 +290,212 @@ def _is_retryable_err(http_error):
     return False
 
 
-def _do_exp_backoff(func, max_wait_time):
+def _may_retry(exc, idempotent, scope):
+    """
+    Return whether a call failing with retryable `exc` may be retried.
+
+    Rate errors are returned before the request is processed, but after
+    server errors and timeouts a non-idempotent request may have been
+    applied.
+    """
+    if idempotent:
+        return True
+    if getattr(getattr(exc, 'resp', None), 'status', None) == 429:
+        return True
+    return scope is not None and scope.get('retry_non_idempotent', False)
+
+
+def _do_exp_backoff(func, max_wait_time, idempotent=True):
     """
     Call `func` and perform exponential backoff for timouts, server and rate
     errors.
     """
-    backoff = _Backoff(max_wait_time)
+    import googleapiclient.errors
+
+    scope = _retry_scope.get()
+    backoff = _Backoff(max_wait_time, scope)
+    outer_backoff = getattr(_retry_state, 'backoff', None)
+    _retry_state.backoff = backoff
+    try:
+        while True:
+            try:
+                return func()
+            except googleapiclient.errors.HttpError as err:
+                if not (_is_retryable_err(err) and
+                        _may_retry(err, idempotent, scope)):
+                    raise
+                backoff.backoff(err)
+            # Timeouts are raised as `SSLError` in Python < 3.2
+            # https://bugs.python.org/issue10272
+            except (socket.timeout, ssl.SSLError) as exc:
+                if not _may_retry(exc, idempotent, scope):
+                    raise
+                backoff.backoff(exc)
+    finally:
+        _retry_state.backoff = outer_backoff
+
+
+def _call_without_retry(func, backoff=None):
+    _retry_state.disabled = True
+    _retry_state.backoff = backoff
+    try:
+        return func()
+    finally:
+        _retry_state.disabled = False
+        _retry_state.backoff = None
+
+
+async def call_async(func, executor=None, max_wait_time=None,
+                     idempotent=True):
+    """
+    Call blocking `func` in `executor` and perform exponential backoff like
+    `retry_on_server_error`, but wait with `asyncio.sleep` instead of blocking
+    a thread. Retries inside `func` are disabled.
+    """
+    import asyncio
+
+    import googleapiclient.errors
+
+    if max_wait_time is None:
+        max_wait_time = _current_max_wait_time()
+    loop = asyncio.get_running_loop()
+    scope = _retry_scope.get()
+    backoff = _Backoff(max_wait_time, scope)
     while True:
         try:
-            return func()
+            # run_in_executor does not copy the context, which carries
+            # retry_scope to threads started by `func`.
+            return await loop.run_in_executor(
+                executor, functools.partial(
+                    contextvars.copy_context().run, _call_without_retry,
+                    func, backoff))
         except googleapiclient.errors.HttpError as err:
-            if _is_retryable_err(err):
-                backoff.backoff(err)
-            else:
+            if not (_is_retryable_err(err) and
+                    _may_retry(err, idempotent, scope)):
                 raise
-        # Timeouts are raised as `SSLError` in Python < 3.2
-        # https://bugs.python.org/issue10272
+            await asyncio.sleep(backoff.next_wait(err))
         except (socket.timeout, ssl.SSLError) as exc:
-            backoff.backoff(exc)
+            if not _may_retry(exc, idempotent, scope):
+                raise
+            await asyncio.sleep(backoff.next_wait(exc))
+
+
+class _ThreadLocalHttp(object):
+    """Authorized http object which uses a separate connection per thread.
+
+    httplib2.Http is not thread-safe, so sharing one between threads (e.g.
+    for background prefetching) corrupts connections. This object creates
+    an AuthorizedHttp for each thread on first use.
+    """
+
+    def __init__(self, credentials):
+        import google.auth.credentials
+
+        self.credentials = google.auth.credentials.with_scopes_if_required(
+            credentials, util.SCOPES)
+        self._local = threading.local()
+
+    def request(self, *args, **kwargs):
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import google_auth_httplib2
+            import googleapiclient.http
+
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=googleapiclient.http.build_http())
+        return http.request(*args, **kwargs)
 
 
 class API:
+    """
+    Holds the Sheets and Drive services.
 
-    @retry_on_server_error
-    def __init__(self, http=None, credentials=None, discovery=False):
+    Each service is built when it is first accessed, so processes that never
+    use Drive do not pay for building it.
+    """
+
+    def __init__(self, http=None, credentials=None, discovery=False,
+                 cache=None, rate_limiter=None):
+        """
+        If `http` is given, it is shared by all threads and must be
+        thread-safe if hyou objects are used from multiple threads. Objects
+        built from `credentials` are safe to use from multiple threads.
+
+        If `cache` (e.g. a `hyou.cache.DirectoryCache`) is given, spreadsheet
+        metadata and cell values are stored in it and reused as long as the
+        spreadsheet has not been modified.
+
+        If `rate_limiter` (e.g. a `hyou.ratelimit.RateLimiter`) is given,
+        Sheets API requests are paced by it. Drive API requests are not,
+        since its quotas are much higher.
+
+        A `hyou.instrumentation.RequestEvent` is passed to listeners added
+        with `add_listener` after each request, and aggregated in `metrics`.
+        """
         if not (http or credentials):
             raise ValueError('Either http or credentials have to be provided')
-        if discovery:
-            self.sheets = googleapiclient.discovery.build(
-                'sheets', 'v4', http=http, credentials=credentials,
-                discoveryServiceUrl=SHEETS_API_DISCOVERY_URL)
-            self.drive = googleapiclient.discovery.build(
-                'drive', 'v2', http=http, credentials=credentials)
-        else:
-            self.sheets = googleapiclient.discovery.build_from_document(
-                schema.SHEETS_V4, http=http, credentials=credentials)
-            self.drive = googleapiclient.discovery.build_from_document(
-                schema.DRIVE_V2, http=http, credentials=credentials)
+        if not http:
+            http = _ThreadLocalHttp(credentials)
+        self._http = http
+        self._discovery = discovery
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.metrics = instrumentation.Metrics()
+        self._listeners = [self.metrics]
+        self._services = {}
+        self._services_lock = threading.Lock()
+
+    def add_listener(self, listener):
+        """Call `listener` with a `RequestEvent` after each request."""
+        self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener):
+        self._listeners = [
+            other for other in self._listeners if other is not listener]
+
+    def _emit(self, event):
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                # Failing to report must not fail the request.
+                _logger.exception('Request event listener failed')
+
+    @property
+    def sheets(self):
+        return self._get_service('sheets')
+
+    @property
+    def drive(self):
+        return self._get_service('drive')
+
+    def _get_service(self, name):
+        service = self._services.get(name)
+        if service is None:
+            with self._services_lock:
+                service = self._services.get(name)
+                if service is None:
+                    service = self._services[name] = self._build_service(
+                        name)
+        return service
+
+    @retry_on_server_error
+    def _build_service(self, name):
+        import googleapiclient.discovery
+
+        version, schema_name, discovery_url = _SERVICES[name]
+        http = self._http
+        if name == 'sheets' and self.rate_limiter is not None:
+            http = ratelimit._RateLimitedHttp(http, self.rate_limiter)
+        request_builder = instrumentation.make_request_builder(
+            self._emit, _get_retry_state)
+        if self._discovery:
+            kwargs = {}
+            if discovery_url:
+                kwargs['discoveryServiceUrl'] = discovery_url
+            return googleapiclient.discovery.build(
+                name, version, http=http, requestBuilder=request_builder,
+                **kwargs)
+        return googleapiclient.discovery.build_from_document(
+            schema.load(schema_name), http=http,
+            requestBuilder=request_builder)
@@ -0,0 +1,60 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+class DirectoryCache(object):
+    """Persistent cache of API responses stored as JSON files in a directory.
+
+    Each entry is stored with a version, which is the modification time of
+    the spreadsheet it was fetched from. Entries are returned only if their
+    version matches, so stale entries are never used. Entries are never
+    evicted; remove the directory to reclaim space.
+
+    Writes are atomic, so a directory can be shared by multiple processes.
+    """
+
+    def __init__(self, path):
+        self._path = os.path.expanduser(path)
+        os.makedirs(self._path, exist_ok=True)
+
+    def get(self, key, version):
+        """Returns the value stored for `key` at `version`, or None."""
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get('key') != key or record.get('version') != version:
+            return None
+        return record['value']
+
+    def put(self, key, version, value):
+        record = {'key': key, 'version': version, 'value': value}
+        fd, temp_path = tempfile.mkstemp(dir=self._path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, separators=(',', ':'))
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _entry_path(self, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self._path, '%s.json' % digest)
@@ -27,12 +27,15 @@ class Collection(util.LazyOrderedDictionary):
         self._api = api
 
     @classmethod
-    def login(cls, json_path=None, json_text=None, discovery=False):
+    def login(cls, json_path=None, json_text=None, discovery=False,
+              cache=None, rate_limiter=None):
         if json_text is None:
             with open(json_path, 'r') as f:
                 json_text = f.read()
         credentials = util.parse_credentials(json_text)
-        return cls(api.API(credentials=credentials, discovery=discovery))
+        return cls(api.API(
+            credentials=credentials, discovery=discovery, cache=cache,
+            rate_limiter=rate_limiter))
 
     @api.retry_on_server_error
     def create_spreadsheet(self, title, rows=1000, cols=26):
@@ -47,20 +50,35 @@ class Collection(util.LazyOrderedDictionary):
         spreadsheet[0].set_size(rows, cols)
         return spreadsheet
 
-    @api.retry_on_server_error
     def _spreadsheet_enumerator(self):
-        response = self._api.drive.files().list(
+        page_token = None
+        while True:
+            response = self._list_spreadsheets(page_token)
+            for item in response.get('items', []):
+                key = item['id']
+                yield (key, spreadsheet.Spreadsheet(self._api, key, None))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+
+    @api.retry_on_server_error
+    def _list_spreadsheets(self, page_token):
+        params = {}
+        if page_token:
+            params['pageToken'] = page_token
+        return self._api.drive.files().list(
             maxResults=1000,
             q=('mimeType="application/vnd.google-apps.spreadsheet" and '
                'trashed = false'),
-            fields='items/id').execute()
-        for item in response['items']:
-            key = item['id']
-            yield (key, spreadsheet.Spreadsheet(self._api, key, None))
+            fields='nextPageToken,items/id',
+            **params).execute()
 
-    @api.retry_on_server_error
     def _spreadsheet_constructor(self, key):
-        entry = self._api.sheets.spreadsheets().get(
-            spreadsheetId=key, includeGridData=False).execute()
+        modified_date = None
+        if self._api.cache is not None:
+            modified_date = spreadsheet.get_modified_date(self._api, key)
+        entry = spreadsheet.get_entry(
+            self._api, key, modified_date=modified_date)
         return spreadsheet.Spreadsheet(
-            self._api, entry['spreadsheetId'], entry)
+            self._api, entry['spreadsheetId'], entry,
+            modified_date=modified_date)
@@ -15,3 +15,19 @@
 
 class HyouRuntimeError(RuntimeError):
     pass
+
+
+class HyouCommitError(HyouRuntimeError):
+    """
+    Raised when some chunks of a commit failed.
+
+    `errors` is a list of (ranges, exception) of the failed chunks, where
+    `ranges` is a list of A1 notations. Cells of the failed chunks are kept
+    queued, so the commit can be retried.
+    """
+
+    def __init__(self, message, errors, committed_cells, failed_cells):
+        super(HyouCommitError, self).__init__(message)
+        self.errors = errors
+        self.committed_cells = committed_cells
+        self.failed_cells = failed_cells
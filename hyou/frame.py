@@ -0,0 +1,144 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conversion between cell values and pandas DataFrames or Arrow tables.
+
+pandas and pyarrow are optional dependencies and imported on first use.
+Tables are built column by column from the cell storage of views, bypassing
+`ViewRow` objects and the write queue.
+"""
+
+from . import util
+
+_BOOLEANS = {'TRUE': True, 'FALSE': False}
+
+
+def split_header(columns, header, start_col):
+    """
+    Return (names, columns) of a table built from `columns` of cell values.
+
+    If `header` is true, the first row holds the column names. Otherwise,
+    and for blank header cells, columns are named by their letters.
+    """
+    if header:
+        names = [
+            str(column[0]) if column and column[0] != '' else None
+            for column in columns]
+        columns = [column[1:] for column in columns]
+    else:
+        names = [None] * len(columns)
+    names = [
+        util.format_column_address(start_col + j) if name is None else name
+        for j, name in enumerate(names)]
+    return names, columns
+
+
+def to_pandas(names, columns, infer_dtypes):
+    import pandas
+
+    frame = pandas.DataFrame(dict(enumerate(columns)))
+    if infer_dtypes:
+        for j in range(len(columns)):
+            frame[j] = _infer_series(pandas, frame[j])
+    # Assigned at last as names may be duplicated.
+    frame.columns = names
+    return frame
+
+
+def _infer_series(pandas, series):
+    blank = series == ''
+    if blank.all():
+        return series
+    series = series.mask(blank)
+    # Checked first, as booleans of unformatted values are also numeric.
+    values = series.dropna()
+    if pandas.api.types.infer_dtype(values, skipna=True) == 'boolean':
+        return series.map({True: True, False: False})
+    if values.isin(list(_BOOLEANS)).all():
+        return series.map(_BOOLEANS)
+    try:
+        return pandas.to_numeric(series)
+    except (ValueError, TypeError):
+        pass
+    return series.where(~blank, '')
+
+
+def to_arrow(names, columns, infer_dtypes):
+    import pyarrow
+
+    return pyarrow.Table.from_arrays(
+        [_to_arrow_array(pyarrow, column, infer_dtypes) for column in columns],
+        names=names)
+
+
+def _to_arrow_array(pyarrow, column, infer_dtypes):
+    import pyarrow.compute
+
+    try:
+        array = pyarrow.array(column)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # Mixed types, e.g. numbers and blanks of unformatted values.
+        if infer_dtypes:
+            try:
+                return pyarrow.array(
+                    [None if value == '' else value for value in column])
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                pass
+        return pyarrow.array([str(value) for value in column])
+    if not (infer_dtypes and pyarrow.types.is_string(array.type)):
+        return array
+    valid = pyarrow.compute.not_equal(array, '')
+    if not pyarrow.compute.any(valid).as_py():
+        return array
+    values = pyarrow.compute.if_else(
+        valid, array, pyarrow.scalar(None, pyarrow.string()))
+    for value_type in (pyarrow.int64(), pyarrow.float64()):
+        try:
+            return pyarrow.compute.cast(values, value_type)
+        except pyarrow.ArrowInvalid:
+            pass
+    if pyarrow.compute.all(pyarrow.compute.is_in(
+            pyarrow.compute.drop_null(values),
+            value_set=pyarrow.array(list(_BOOLEANS)))).as_py():
+        return pyarrow.compute.equal(values, 'TRUE')
+    return array
+
+
+def to_values(frame, header):
+    """
+    Return a list of rows of cell values of a pandas DataFrame or a
+    pyarrow Table, with the column names as the first row if `header` is
+    true. Missing values are converted to blanks.
+    """
+    if hasattr(frame, 'column_names'):
+        names = frame.column_names
+        columns = [column.to_pylist() for column in frame.columns]
+    else:
+        names = frame.columns
+        columns = []
+        for j in range(len(names)):
+            series = frame.iloc[:, j].astype(object)
+            columns.append(series.where(series.notna(), None).tolist())
+    values = [[_to_cell_value(value) for value in row]
+              for row in zip(*columns)]
+    if header:
+        values.insert(0, [str(name) for name in names])
+    return values
+
+
+def _to_cell_value(value):
+    if isinstance(value, float) and value != value:
+        # NaN can not be encoded in JSON.
+        return ''
+    return util.normalize_cell_value(value)
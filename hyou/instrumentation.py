@@ -0,0 +1,165 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import re
+import threading
+import time
+
+_KEY_RE = re.compile(r'/(?:spreadsheets|files)/([^/?:]+)')
+
+
+class RequestEvent(collections.namedtuple('RequestEvent', [
+        'method', 'http_method', 'spreadsheet_key', 'operation', 'status',
+        'latency', 'decode_time', 'request_bytes', 'response_bytes',
+        'retries', 'backoff_time', 'error'])):
+    """
+    Event emitted for each HTTP request made by an `API`.
+
+    - `method`: API method ID, e.g. "sheets.spreadsheets.values.get".
+    - `http_method`: HTTP method, e.g. "GET".
+    - `spreadsheet_key`: Key of the spreadsheet requested, or None.
+    - `operation`: hyou function making the request, e.g.
+      "View._ensure_cells_fetched", or None.
+    - `status`: HTTP status code, or None if no response was received.
+    - `latency`: Seconds spent in the request, including `decode_time`.
+    - `decode_time`: Seconds spent parsing the response.
+    - `request_bytes`, `response_bytes`: Sizes of the bodies.
+    - `retries`: Number of retries of the call before this request.
+    - `backoff_time`: Seconds slept by the backoff right before this request.
+      The sum over all requests is the total time slept.
+    - `error`: Exception raised by the request, or None.
+    """
+    __slots__ = ()
+
+
+class Metrics(object):
+    """
+    Aggregate counters of requests by API method.
+
+    Every `API` has one as `API.metrics`. It can also be added as a listener
+    to aggregate events of multiple APIs.
+    """
+
+    COUNTERS = (
+        'requests', 'errors', 'retries', 'latency', 'decode_time',
+        'request_bytes', 'response_bytes', 'backoff_time')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def __call__(self, event):
+        with self._lock:
+            counters = self._counters.get(event.method)
+            if counters is None:
+                counters = self._counters[event.method] = dict.fromkeys(
+                    self.COUNTERS, 0)
+            counters['requests'] += 1
+            if event.error is not None:
+                counters['errors'] += 1
+            if event.retries:
+                counters['retries'] += 1
+            counters['latency'] += event.latency
+            counters['decode_time'] += event.decode_time
+            counters['request_bytes'] += event.request_bytes
+            counters['response_bytes'] += event.response_bytes
+            counters['backoff_time'] += event.backoff_time
+
+    def snapshot(self):
+        """Return a dict mapping API method IDs to dicts of counters."""
+        with self._lock:
+            return {
+                method: dict(counters)
+                for method, counters in self._counters.items()}
+
+    def total(self):
+        """Return a dict of counters summed over all API methods."""
+        total = dict.fromkeys(self.COUNTERS, 0)
+        for counters in self.snapshot().values():
+            for name, value in counters.items():
+                total[name] += value
+        return total
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return len(body)
+
+
+def make_request_builder(emit, get_retry_state):
+    """
+    Return a `googleapiclient.http.HttpRequest` subclass which calls `emit`
+    with a `RequestEvent` after each request.
+
+    `get_retry_state` returns (operation, retries, backoff_time) of the
+    current call.
+    """
+    import googleapiclient.errors
+    import googleapiclient.http
+
+    class InstrumentedHttpRequest(googleapiclient.http.HttpRequest):
+
+        def execute(self, http=None, num_retries=0):
+            postproc = self.postproc
+            stats = {'status': None, 'response_bytes': 0, 'decode_time': 0.0}
+
+            def measured_postproc(resp, content):
+                stats['status'] = resp.status
+                stats['response_bytes'] = _body_size(content)
+                decode_start = time.monotonic()
+                try:
+                    return postproc(resp, content)
+                finally:
+                    stats['decode_time'] = time.monotonic() - decode_start
+
+            self.postproc = measured_postproc
+            error = None
+            start = time.monotonic()
+            try:
+                return super(InstrumentedHttpRequest, self).execute(
+                    http=http, num_retries=num_retries)
+            except Exception as exc:
+                error = exc
+                if isinstance(exc, googleapiclient.errors.HttpError):
+                    stats['status'] = exc.resp.status
+                    stats['response_bytes'] = _body_size(exc.content)
+                raise
+            finally:
+                latency = time.monotonic() - start
+                self.postproc = postproc
+                match = _KEY_RE.search(self.uri)
+                operation, retries, backoff_time = get_retry_state()
+                emit(RequestEvent(
+                    method=self.methodId,
+                    http_method=self.method,
+                    spreadsheet_key=match.group(1) if match else None,
+                    operation=operation,
+                    status=stats['status'],
+                    latency=latency,
+                    decode_time=stats['decode_time'],
+                    request_bytes=_body_size(self.body),
+                    response_bytes=stats['response_bytes'],
+                    retries=retries,
+                    backoff_time=backoff_time,
+                    error=error))
+
+    return InstrumentedHttpRequest
@@ -0,0 +1,166 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+# Default quotas of the Sheets API, in requests per minute.
+# See https://developers.google.com/sheets/api/limits
+USER_REQUESTS_PER_MINUTE = 60
+PROJECT_REQUESTS_PER_MINUTE = 300
+
+READ = 'read'
+WRITE = 'write'
+
+# Quotas are enforced over sliding windows of this many seconds.
+_WINDOW = 60.0
+# Extra spacing absorbing delays between acquiring and sending a request.
+_WINDOW_MARGIN = 0.5
+
+
+def _take_token(state, now, rate, capacity):
+    """
+    Take a token from a bucket in `state`, a (tokens, updated) pair.
+
+    The number of tokens may become negative, reserving a future token.
+    Returns the new state and the number of seconds to wait until the
+    token is available.
+    """
+    if state is None:
+        tokens = capacity
+    else:
+        tokens, updated = state
+        tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    tokens -= 1
+    return (tokens, now), max(0.0, -tokens / rate)
+
+
+def _take_slot(times, now, quota):
+    """
+    Return the earliest time not before `now` at which a request fits in
+    the quota, given `times` of previous requests in ascending order.
+
+    Requests are scheduled in order, and any window of `_WINDOW` seconds
+    holds at most `quota` of them.
+    """
+    start = now
+    if times:
+        start = max(start, times[-1])
+    if len(times) >= quota:
+        start = max(start, times[-quota] + _WINDOW + _WINDOW_MARGIN)
+    return start
+
+
+class RateLimiter(object):
+    """
+    Rate limiter pacing requests to stay within quotas.
+
+    Like the Sheets API quotas, reads (GET requests) and writes are limited
+    separately over sliding windows of a minute, and each request counts
+    against both the per-user quota and the per-project quota. Requests are
+    delayed until they fit in the quotas instead of being rejected by the
+    server with 429.
+
+    A limiter is shared by all threads using it. If `path` is given, bucket
+    states are stored in that file, so processes on the same host using the
+    same project and user can share quotas. This requires `fcntl`.
+    """
+
+    def __init__(self, user_per_minute=USER_REQUESTS_PER_MINUTE,
+                 project_per_minute=PROJECT_REQUESTS_PER_MINUTE,
+                 burst=None, path=None):
+        """
+        If `burst` is given, requests are also smoothed by token buckets, so
+        at most `burst` requests are made at once and others are spread over
+        the minute. Otherwise a whole quota may be used at once.
+        """
+        self._buckets = []
+        for scope, per_minute in (('user', user_per_minute),
+                                  ('project', project_per_minute)):
+            if per_minute is None:
+                continue
+            if per_minute <= 0:
+                raise ValueError('Quotas must be positive')
+            self._buckets.append((scope, per_minute, burst))
+        if path is not None:
+            import fcntl  # noqa: F401  Fail early where it is unavailable.
+            path = os.path.expanduser(path)
+        self._path = path
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, kind):
+        """Wait until a request of `kind` (READ or WRITE) can be made."""
+        with self._lock:
+            with self._load_states() as states:
+                now = time.time() if self._path else time.monotonic()
+                start = now
+                for scope, per_minute, burst in self._buckets:
+                    name = '%s/%s' % (scope, kind)
+                    if burst is not None:
+                        states[name], bucket_wait = _take_token(
+                            states.get(name), now, per_minute / _WINDOW,
+                            min(burst, per_minute))
+                        start = max(start, now + bucket_wait)
+                    start = max(start, _take_slot(
+                        states.get(name + '/window', []), now, per_minute))
+                for scope, per_minute, _ in self._buckets:
+                    name = '%s/%s/window' % (scope, kind)
+                    # Older requests no longer affect scheduling.
+                    states[name] = (
+                        states.get(name, []) + [start])[-per_minute:]
+                wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+
+    @contextlib.contextmanager
+    def _load_states(self):
+        if self._path is None:
+            yield self._states
+            return
+        import fcntl
+
+        with open(self._path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    states = json.loads(f.read())
+                except ValueError:
+                    states = {}
+                yield states
+                f.seek(0)
+                f.truncate()
+                json.dump(states, f)
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class _RateLimitedHttp(object):
+    """Http object which acquires tokens from a rate limiter on requests."""
+
+    def __init__(self, http, limiter):
+        self._http = http
+        self._limiter = limiter
+
+    def request(self, uri, method='GET', body=None, *args, **kwargs):
+        self._limiter.acquire(READ if method == 'GET' else WRITE)
+        return self._http.request(uri, method, body, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._http, name)
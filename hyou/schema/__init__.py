@@ -12,13 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from __future__ import (
-    absolute_import, division, print_function, unicode_literals)
+import functools
+import json
+import os
+
+_SCHEMA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_SCHEMA_NAMES = {
+    'DRIVE_V2': 'drive_v2',
+    'SHEETS_V4': 'sheets_v4',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """
+    Return the discovery document `name` (e.g. 'sheets_v4').
+
+    Documents are stored as JSON, which parses much faster than importing
+    equivalent Python literals, and are parsed at most once per process.
+    """
+    with open(os.path.join(_SCHEMA_DIR, '%s.json' % name),
+              encoding='utf-8') as f:
+        return json.load(f)
+
+
+def __getattr__(name):
+    if name in _SCHEMA_NAMES:
+        return load(_SCHEMA_NAMES[name])
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
-from .sheets_v4 import SCHEMA as SHEETS_V4
-from .drive_v2 import SCHEMA as DRIVE_V2
 
 __all__ = [
     'DRIVE_V2',
     'SHEETS_V4',
+    'load',
 ]
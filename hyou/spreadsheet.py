@@ -15,36 +15,141 @@
 from __future__ import (
     absolute_import, division, print_function, unicode_literals)
 
+import collections
+import contextlib
+import copy
 import datetime
+import random
 
 from . import api
+from . import exception
 from . import util
 from . import worksheet
 
 
 SHEET_TYPE_GRID = 'GRID'
 
+# Fields of spreadsheet entries used by hyou. Requesting only these keeps
+# responses small for spreadsheets with many sheets, conditional formats,
+# named ranges etc.
+ENTRY_FIELDS = 'spreadsheetId,properties,sheets.properties'
+
+
+@api.retry_on_server_error
+def get_modified_date(api, key):
+    """Return the last modification time of a spreadsheet as a string."""
+    response = api.drive.files().get(
+        fileId=key, fields='modifiedDate').execute()
+    return response['modifiedDate']
+
+
+@api.retry_on_server_error
+def get_entry(api, key, modified_date=None, fields=ENTRY_FIELDS):
+    """
+    Return the metadata entry of a spreadsheet.
+
+    Only `fields` of the entry are fetched. Pass None to fetch the full
+    entry.
+
+    If `api` has a cache, the entry is revalidated against the modification
+    time of the spreadsheet (fetched unless `modified_date` is given) and
+    fetched only if it is stale.
+    """
+    if api.cache is None:
+        return _fetch_entry(api, key, fields)
+    if modified_date is None:
+        modified_date = get_modified_date(api, key)
+    cache_key = 'spreadsheet:%s:%s' % (key, fields or '*')
+    entry = api.cache.get(cache_key, modified_date)
+    if entry is None:
+        entry = _fetch_entry(api, key, fields)
+        api.cache.put(cache_key, modified_date, entry)
+    return entry
+
+
+def _fetch_entry(api, key, fields):
+    kwargs = {}
+    if fields:
+        kwargs['fields'] = fields
+    return api.sheets.spreadsheets().get(
+        spreadsheetId=key, includeGridData=False, **kwargs).execute()
+
+
+def _merge_properties(properties, new_properties):
+    for name, value in new_properties.items():
+        if isinstance(value, dict):
+            _merge_properties(properties.setdefault(name, {}), value)
+        else:
+            properties[name] = value
+
+
+def _find_sheet_entry(entry, sheet_id):
+    for sheet_entry in entry['sheets']:
+        if sheet_entry['properties']['sheetId'] == sheet_id:
+            return sheet_entry
+    raise exception.HyouRuntimeError('The sheet has been removed.')
+
+
+def _apply_request(entry, method, params):
+    """Apply a structural change request to a spreadsheet entry in place."""
+    if method == 'updateSpreadsheetProperties':
+        _merge_properties(entry['properties'], params['properties'])
+    elif method == 'updateSheetProperties':
+        properties = dict(params['properties'])
+        sheet_entry = _find_sheet_entry(entry, properties.pop('sheetId'))
+        _merge_properties(sheet_entry['properties'], properties)
+    elif method == 'addSheet':
+        properties = copy.deepcopy(params['properties'])
+        properties.setdefault('index', len(entry['sheets']))
+        properties.setdefault('sheetType', SHEET_TYPE_GRID)
+        entry['sheets'].append({'properties': properties})
+    elif method == 'deleteSheet':
+        entry['sheets'].remove(_find_sheet_entry(entry, params['sheetId']))
+    else:
+        raise ValueError('Unsupported request in batch: %s' % method)
+
 
 class Spreadsheet(util.LazyOrderedDictionary):
 
-    def __init__(self, api, key, entry):
+    def __init__(self, api, key, entry, modified_date=None):
         super(Spreadsheet, self).__init__(self._worksheet_enumerator, None)
         self._api = api
         self._key = key
         self._entry = entry
-        self._updated = None
+        self._modified_date = modified_date
+        # Requests deferred by batch(), or None if not in a batch.
+        self._batch_requests = None
+        # TileCache of each worksheet by sheet ID. Worksheet objects are
+        # recreated on refresh, so their cells are kept here to be
+        # invalidated for all of them.
+        self._tile_caches = {}
 
     def __repr__(self):
         return 'Spreadsheet(key=%r)' % self.key
 
-    @api.retry_on_server_error
-    def refresh(self, entry=None):
+    def refresh(self, entry=None, full_entry=False):
+        """
+        Reload the metadata of the spreadsheet.
+
+        Only the fields used by hyou are fetched unless `full_entry` is True.
+        """
+        self._modified_date = None
         if entry is not None:
             self._entry = entry
         else:
-            self._entry = self._api.sheets.spreadsheets().get(
-                spreadsheetId=self.key, includeGridData=False).execute()
-        self._updated = None
+            if self._api.cache is not None:
+                self._modified_date = get_modified_date(self._api, self.key)
+            self._entry = get_entry(
+                self._api, self.key, modified_date=self._modified_date,
+                fields=None if full_entry else ENTRY_FIELDS)
+            # Like Worksheet.refresh, reloading drops cached cells.
+            self._tile_caches.clear()
+        sheet_ids = set(
+            sheet_entry['properties']['sheetId']
+            for sheet_entry in self._entry.get('sheets', []))
+        for sheet_id in list(self._tile_caches):
+            if sheet_id not in sheet_ids:
+                del self._tile_caches[sheet_id]
         super(Spreadsheet, self).refresh()
 
     def add_worksheet(self, title, rows=1000, cols=26):
@@ -69,6 +174,84 @@ class Spreadsheet(util.LazyOrderedDictionary):
             {'sheetId': worksheet.key})
         self.refresh(new_entry)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Defer structural changes to the spreadsheet and its worksheets.
+
+        Within the context, changes like `add_worksheet`, `delete_worksheet`,
+        `Worksheet.set_size` and title changes are applied to the local
+        metadata immediately, and sent as a single batchUpdate request on
+        exit. If the context exits with an exception, or the request fails,
+        the changes are discarded and the metadata is reloaded on next
+        access. Worksheet objects held across the batch keep the discarded
+        changes until they are refreshed.
+        """
+        if self._batch_requests is not None:
+            # Nested batches are merged into the outermost one.
+            yield
+            return
+        self._begin_batch()
+        try:
+            yield
+        except BaseException:
+            if self._end_batch():
+                self._discard_entry()
+            raise
+        requests = self._end_batch()
+        if requests:
+            try:
+                self.make_batch_request(requests)
+            except BaseException:
+                self._discard_entry()
+                raise
+
+    def _begin_batch(self):
+        self._ensure_entry()
+        self._batch_requests = []
+
+    def _end_batch(self):
+        requests, self._batch_requests = self._batch_requests, None
+        return requests
+
+    def _discard_entry(self):
+        self._entry = None
+        self._modified_date = None
+        super(Spreadsheet, self).refresh()
+
+    def fetch_views(self, views):
+        """
+        Fetch cells of multiple views of this spreadsheet at once.
+
+        Views are grouped by their fetch parameters and each group is fetched
+        with a single values().batchGet request. Views whose cells have been
+        fetched already are skipped.
+        """
+        groups = collections.OrderedDict()
+        for view in views:
+            if view._worksheet._spreadsheet is not self:
+                raise ValueError(
+                    '%r does not belong to %r' % (view._worksheet, self))
+            if view._cells_fetched or view._load_shared_cells():
+                continue
+            cache_version = view._get_cache_version()
+            if view._load_cached_cells(cache_version):
+                continue
+            params_key = tuple(sorted(view._fetch_params.items()))
+            groups.setdefault(params_key, []).append((view, cache_version))
+        for params_key, group in groups.items():
+            self._batch_fetch_views(group, dict(params_key))
+
+    @api.retry_on_server_error
+    def _batch_fetch_views(self, views, fetch_params):
+        response = self._api.sheets.spreadsheets().values().batchGet(
+            spreadsheetId=self.key,
+            ranges=[view._format_range() for view, _ in views],
+            **fetch_params).execute()
+        for (view, cache_version), value_range in zip(
+                views, response['valueRanges']):
+            view._load_cells(value_range, cache_version)
+
     @property
     def key(self):
         return self._key
@@ -95,13 +278,17 @@ class Spreadsheet(util.LazyOrderedDictionary):
         self.refresh(new_entry)
 
     @property
-    @api.retry_on_server_error
     def updated(self):
-        if not self._updated:
-            response = self._api.drive.files().get(fileId=self.key).execute()
-            self._updated = datetime.datetime.strptime(
-                response['modifiedDate'], '%Y-%m-%dT%H:%M:%S.%fZ')
-        return self._updated
+        return datetime.datetime.strptime(
+            self._get_modified_date(), '%Y-%m-%dT%H:%M:%S.%fZ')
+
+    def _get_modified_date(self):
+        if self._modified_date is None:
+            self._modified_date = get_modified_date(self._api, self.key)
+        return self._modified_date
+
+    def _mark_modified(self):
+        self._modified_date = None
 
     def _ensure_entry(self):
         if self._entry is None:
@@ -116,22 +303,61 @@ class Spreadsheet(util.LazyOrderedDictionary):
             aworksheet = worksheet.Worksheet(self, self._api, sheet_entry)
             yield (aworksheet.title, aworksheet)
 
-    @api.retry_on_server_error
     def _make_single_batch_request(self, method, params):
+        if self._batch_requests is None:
+            return self._send_single_batch_request(method, params)
+        if method == 'addSheet':
+            # Assign the ID here so that the new sheet can be referenced by
+            # later requests in the batch.
+            params = copy.deepcopy(params)
+            params['properties']['sheetId'] = self._new_sheet_id()
+        new_entry = copy.deepcopy(self._entry)
+        _apply_request(new_entry, method, params)
+        self._batch_requests.append({method: params})
+        # Later changes in the batch build on this entry, including ones
+        # made through worksheets.
+        self.refresh(new_entry)
+        return new_entry
+
+    def _new_sheet_id(self):
+        used_ids = set(
+            sheet_entry['properties']['sheetId']
+            for sheet_entry in self._entry['sheets'])
+        while True:
+            sheet_id = random.randrange(1, 2 ** 31)
+            if sheet_id not in used_ids:
+                return sheet_id
+
+    @api.retry_on_server_error
+    def _send_single_batch_request(self, method, params):
         request = {
             'requests': [{method: params}],
             'include_spreadsheet_in_response': True,
         }
         response = self._api.sheets.spreadsheets().batchUpdate(
-            spreadsheetId=self.key, body=request).execute()
+            spreadsheetId=self.key, body=request,
+            fields='updatedSpreadsheet(%s)' % ENTRY_FIELDS).execute()
         return response['updatedSpreadsheet']
 
-    @api.retry_on_server_error
     def make_batch_request(self, requests):
+        """
+        Send raw batchUpdate `requests` and reload the metadata.
+
+        Within `batch`, the requests are deferred to the end of the batch
+        and their effects are not visible until then.
+        """
+        if self._batch_requests is not None:
+            self._batch_requests.extend(requests)
+            return
+        self._send_batch_request(requests)
+
+    @api.retry_on_server_error
+    def _send_batch_request(self, requests):
         request = {
             'requests': requests,
             'include_spreadsheet_in_response': True,
         }
         response = self._api.sheets.spreadsheets().batchUpdate(
-            spreadsheetId=self.key, body=request).execute()
+            spreadsheetId=self.key, body=request,
+            fields='updatedSpreadsheet(%s)' % ENTRY_FIELDS).execute()
         self.refresh(response['updatedSpreadsheet'])
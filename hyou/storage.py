@@ -0,0 +1,139 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+
+_MISSING = object()
+
+
+class DictStorage(object):
+    """Sparse storage keeping cells in a dict keyed by (row, col).
+
+    This is the default storage. It is cheap for small or sparsely accessed
+    ranges.
+    """
+
+    def __init__(self, start_row, end_row, start_col, end_col):
+        self._start_row = start_row
+        self._end_row = end_row
+        self._start_col = start_col
+        self._end_col = end_col
+        self._values = {}
+
+    def clear(self):
+        self._values.clear()
+
+    def load(self, values):
+        """Replaces all cells with `values` returned by values().get.
+
+        `values` is a list of rows starting at the top-left corner of the
+        range. Rows may be shorter than the range.
+        """
+        self._values = {}
+        for i, row in enumerate(values):
+            index_row = self._start_row + i
+            for j, value in enumerate(row):
+                self._values[(index_row, self._start_col + j)] = value
+
+    def get(self, row, col, default=None):
+        return self._values.get((row, col), default)
+
+    def set(self, row, col, value):
+        self._values[(row, col)] = value
+
+    def get_row(self, row, start_col, end_col, default=None):
+        get = self._values.get
+        return [get((row, col), default) for col in range(start_col, end_col)]
+
+    def get_columns(self, default=None):
+        """Returns all cells in the range as a list of column lists."""
+        get = self._values.get
+        rows = range(self._start_row, self._end_row)
+        return [
+            [get((row, col), default) for row in rows]
+            for col in range(self._start_col, self._end_col)]
+
+
+class ColumnarStorage(object):
+    """Dense storage keeping cells in one list per column.
+
+    Absent cells are marked with a sentinel, so no per-cell key objects are
+    allocated and a lookup is two list indexings. Columns are allocated on
+    first use. Prefer this storage for large, densely populated ranges.
+    """
+
+    def __init__(self, start_row, end_row, start_col, end_col):
+        self._start_row = start_row
+        self._start_col = start_col
+        self._rows = end_row - start_row
+        self._columns = [None] * (end_col - start_col)
+
+    def clear(self):
+        self._columns = [None] * len(self._columns)
+
+    def load(self, values):
+        """Replaces all cells with `values` returned by values().get.
+
+        `values` is a list of rows starting at the top-left corner of the
+        range. Rows may be shorter than the range.
+        """
+        self.clear()
+        padding = [_MISSING] * (self._rows - len(values))
+        # zip_longest transposes the ragged rows to columns in C.
+        for j, column in enumerate(
+                itertools.zip_longest(*values, fillvalue=_MISSING)):
+            self._columns[j] = list(column) + padding
+
+    def get(self, row, col, default=None):
+        column = self._columns[col - self._start_col]
+        if column is None:
+            return default
+        value = column[row - self._start_row]
+        if value is _MISSING:
+            return default
+        return value
+
+    def set(self, row, col, value):
+        j = col - self._start_col
+        column = self._columns[j]
+        if column is None:
+            column = self._columns[j] = [_MISSING] * self._rows
+        column[row - self._start_row] = value
+
+    def get_row(self, row, start_col, end_col, default=None):
+        i = row - self._start_row
+        result = []
+        for column in self._columns[
+                start_col - self._start_col:end_col - self._start_col]:
+            value = _MISSING if column is None else column[i]
+            result.append(default if value is _MISSING else value)
+        return result
+
+    def get_columns(self, default=None):
+        """Returns all cells in the range as a list of column lists.
+
+        Columns without absent cells are returned as copies made in C.
+        """
+        result = []
+        for column in self._columns:
+            if column is None:
+                result.append([default] * self._rows)
+            elif _MISSING in column:
+                result.append([
+                    default if value is _MISSING else value
+                    for value in column])
+            else:
+                result.append(list(column))
+        return result
@@ -0,0 +1,195 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import sys
+import threading
+
+DEFAULT_MAX_CELLS = 10 ** 6
+
+# Size of a reference to a value in a list.
+_POINTER_SIZE = 8
+
+
+def tile_bounds(row, col, tile_size, rows, cols):
+    """
+    Return (start_row, end_row, start_col, end_col) of the tile containing
+    the cell at (`row`, `col`), clipped to a grid of `rows` x `cols`.
+    """
+    tile_rows, tile_cols = tile_size
+    start_row = row - row % tile_rows
+    start_col = col - col % tile_cols
+    return (
+        start_row, min(start_row + tile_rows, rows),
+        start_col, min(start_col + tile_cols, cols))
+
+
+def _contains(outer, inner):
+    return (outer[0] <= inner[0] and inner[1] <= outer[1] and
+            outer[2] <= inner[2] and inner[3] <= outer[3])
+
+
+def _slice(values, outer, inner):
+    """Slice `values` in the range `outer` to the range `inner`."""
+    start_col = inner[2] - outer[2]
+    end_col = inner[3] - outer[2]
+    return [
+        row[start_col:end_col]
+        for row in values[inner[0] - outer[0]:inner[1] - outer[0]]]
+
+
+def _estimate_bytes(values):
+    size = sys.getsizeof(values)
+    for row in values:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value) + _POINTER_SIZE
+    return size
+
+
+class TileCache(object):
+    """
+    LRU cache of tiles of cell values of a worksheet.
+
+    A tile is a rectangle of cell values fetched by a view, as a list of rows
+    returned by values().get, and is keyed by (fetch parameters, bounds).
+    Views in tile mode fetch fixed-size tiles, and other views cache their
+    whole range as a tile. A lookup is served by any tile containing the
+    range.
+
+    The least recently used tiles are evicted when the total number of cells
+    exceeds `max_cells`, or the estimated memory usage exceeds `max_bytes`.
+    Either limit can be None. Tiles larger than the limits are not cached.
+    Memory usage is estimated only if `max_bytes` is set, as it takes time
+    proportional to the number of cells.
+
+    A cache is safe to use from multiple threads.
+    """
+
+    def __init__(self, max_cells=DEFAULT_MAX_CELLS, max_bytes=None):
+        self.max_cells = max_cells
+        self.max_bytes = max_bytes
+        # key -> (values, cells, bytes)
+        self._tiles = collections.OrderedDict()
+        self._cells = 0
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def __contains__(self, key):
+        return key in self._tiles
+
+    @property
+    def cells(self):
+        """The number of cells cached."""
+        return self._cells
+
+    @property
+    def bytes(self):
+        """
+        The estimated memory usage of cached values, counting tiles put
+        while `max_bytes` was set only.
+        """
+        return self._bytes
+
+    def stats(self):
+        """Return a dict of statistics of the cache."""
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'tiles': len(self._tiles),
+                'cells': self._cells,
+                'bytes': self._bytes,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def get(self, key):
+        """
+        Return the values in the range of `key`, a (fetch parameters,
+        bounds) pair, or None if no tile contains the range.
+
+        Values are returned as a list of rows which may be shorter than the
+        range, like values().get responses.
+        """
+        params_key, bounds = key
+        with self._lock:
+            entry = self._tiles.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._tiles.move_to_end(key)
+                return entry[0]
+            for tile_key, entry in self._tiles.items():
+                if (tile_key[0] == params_key and
+                        _contains(tile_key[1], bounds)):
+                    break
+            else:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._tiles.move_to_end(tile_key)
+            return _slice(entry[0], tile_key[1], bounds)
+
+    def put(self, key, values):
+        bounds = key[1]
+        cells = (bounds[1] - bounds[0]) * (bounds[3] - bounds[2])
+        # Caching a tile over a limit would evict everything else.
+        if self.max_cells is not None and cells > self.max_cells:
+            return
+        size = 0
+        if self.max_bytes is not None:
+            size = _estimate_bytes(values)
+            if size > self.max_bytes:
+                return
+        with self._lock:
+            self._remove(key)
+            self._tiles[key] = (values, cells, size)
+            self._cells += cells
+            self._bytes += size
+            while ((self.max_cells is not None and
+                    self._cells > self.max_cells) or
+                   (self.max_bytes is not None and
+                    self._bytes > self.max_bytes)):
+                self._remove(next(iter(self._tiles)))
+                self._evictions += 1
+
+    def discard(self, start_row, end_row, start_col, end_col):
+        """Remove tiles overlapping the range."""
+        with self._lock:
+            for key in list(self._tiles):
+                bounds = key[1]
+                if (bounds[0] < end_row and start_row < bounds[1] and
+                        bounds[2] < end_col and start_col < bounds[3]):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
+            self._cells = 0
+            self._bytes = 0
+
+    def _remove(self, key):
+        entry = self._tiles.pop(key, None)
+        if entry is not None:
+            self._cells -= entry[1]
+            self._bytes -= entry[2]
@@ -0,0 +1,147 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fetching cells as native Python values.
+
+With `UNFORMATTED_VALUE`, the API returns numbers and booleans as JSON
+numbers and booleans, and with `SERIAL_NUMBER`, dates and times as numbers
+of days since 1899-12-30. Columns declared in a schema are decoded to their
+types column by column right after fetching, so reads never convert values.
+"""
+
+import datetime
+import json
+
+from . import util
+
+# Day 0 of serial numbers of dates.
+_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def _decode_int(value):
+    result = int(value)
+    if result != value:
+        raise ValueError('%r is not an integer' % (value,))
+    return result
+
+
+def _decode_float(value):
+    if not isinstance(value, (int, float)):
+        raise ValueError('%r is not a number' % (value,))
+    return float(value)
+
+
+def _decode_bool(value):
+    if not isinstance(value, (int, float)):
+        raise ValueError('%r is not a boolean' % (value,))
+    return bool(value)
+
+
+def _decode_str(value):
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    return str(value)
+
+
+def _decode_datetime(value):
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError('%r is not a date' % (value,))
+    return _EPOCH + datetime.timedelta(days=value)
+
+
+def _decode_date(value):
+    return _decode_datetime(value).date()
+
+
+_DECODERS = {
+    int: _decode_int,
+    float: _decode_float,
+    bool: _decode_bool,
+    str: _decode_str,
+    datetime.datetime: _decode_datetime,
+    datetime.date: _decode_date,
+}
+
+
+class TypedValues(object):
+    """
+    Fetch mode returning cells as native Python values.
+
+    Pass it as `fetch_params` of `Worksheet.view()` or
+    `Worksheet.iter_rows()`. Numbers and booleans are returned as int, float
+    and bool instead of formatted strings, and blank cells as ''.
+
+    `schema` optionally maps columns, either by index or by letters like
+    'A', to int, float, bool, str, datetime.datetime or datetime.date.
+    Cells of those columns are converted to the type. Dates and times must
+    be declared to be decoded, as they are otherwise returned as serial
+    numbers. ValueError is raised if a cell can not be converted.
+    """
+
+    PARAMS = {
+        'valueRenderOption': 'UNFORMATTED_VALUE',
+        'dateTimeRenderOption': 'SERIAL_NUMBER',
+    }
+
+    def __init__(self, schema=None):
+        self._schema = {}
+        for column, value_type in (schema or {}).items():
+            if value_type not in _DECODERS:
+                raise ValueError('Unsupported type: %r' % (value_type,))
+            if not isinstance(column, int):
+                column = util.parse_column_address(column)
+            self._schema[column] = value_type
+        # Distinguishes cached cells decoded with different schemas.
+        self._key = json.dumps(sorted(
+            (column, value_type.__module__ + '.' + value_type.__name__)
+            for column, value_type in self._schema.items()))
+
+    def __repr__(self):
+        return 'TypedValues(%r)' % self.schema
+
+    @property
+    def params(self):
+        """Parameters of values().get."""
+        return dict(self.PARAMS)
+
+    @property
+    def schema(self):
+        """The schema as a dict of column indexes to types."""
+        return dict(self._schema)
+
+    def decode(self, values, start_col, end_col):
+        """
+        Return `values`, a list of rows of the range starting at `start_col`
+        as returned by values().get, with columns in the schema decoded.
+        """
+        columns = [
+            (col - start_col, _DECODERS[value_type], value_type)
+            for col, value_type in sorted(self._schema.items())
+            if start_col <= col < end_col]
+        if not columns or not values:
+            return values
+        # Copied as responses may be kept by the cache of the API.
+        values = [list(row) for row in values]
+        for j, decode, value_type in columns:
+            for row in values:
+                if j < len(row) and row[j] != '':
+                    try:
+                        row[j] = decode(row[j])
+                    except (ValueError, TypeError, OverflowError):
+                        raise ValueError(
+                            'Can not decode %r in column %s as %s' % (
+                                row[j],
+                                util.format_column_address(start_col + j),
+                                value_type.__name__))
+        return values
@@ -13,12 +13,10 @@
 # limitations under the License.
 
 
+import collections
 import json
 import string
 
-import google.oauth2.credentials
-import google.oauth2.service_account
-
 
 SCOPES = (
     'https://spreadsheets.google.com/feeds',
@@ -41,17 +39,47 @@ def format_column_address(index_column):
     return ''.join(reversed(letters))
 
 
+def parse_column_address(address):
+    """Inverse of `format_column_address`, e.g. 'AA' -> 26."""
+    if not (address and address.isalpha() and address.isascii()):
+        raise ValueError('Invalid column address: %r' % (address,))
+    index_column = 0
+    for letter in address.upper():
+        index_column = index_column * 26 + ord(letter) - ord('A') + 1
+    return index_column - 1
+
+
+def format_sheet_a1_notation(worksheet_title):
+    return '\'%s\'' % worksheet_title.replace('\'', '\'\'')
+
+
 def format_range_a1_notation(
         worksheet_title, start_row, end_row, start_col, end_col):
-    return '\'%s\'!%s%d:%s%d' % (
-        worksheet_title.replace('\'', '\'\''),
+    return '%s!%s%d:%s%d' % (
+        format_sheet_a1_notation(worksheet_title),
         format_column_address(start_col),
         start_row + 1,
         format_column_address(end_col - 1),
         end_row)
 
 
+def normalize_cell_value(value):
+    """Convert `value` to a cell value to be sent to the API."""
+    if value is None:
+        return ''
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, bytes):
+        # May raise UnicodeDecodeError.
+        return value.decode('ascii')
+    return str(value)
+
+
 def parse_credentials(json_text):
+    # google-auth is slow to import, so it is imported on first use.
+    import google.oauth2.credentials
+    import google.oauth2.service_account
+
     json_data = json.loads(json_text)
     if '_module' in json_data:
         return google.oauth2.credentials.Credentials.from_authorized_user_info(
@@ -66,6 +94,13 @@ def parse_credentials(json_text):
 
 
 class LazyOrderedDictionary(object):
+    """Ordered dictionary populated lazily by an enumerator and a constructor.
+
+    `enumerator` returns an iterable of (key, value) pairs. It is consumed
+    incrementally, so looking up early entries or stopping an iteration early
+    does not wait for the whole enumeration. `constructor`, if given, builds
+    a value for a key without enumerating.
+    """
 
     def __init__(self, enumerator, constructor):
         self._enumerator = enumerator
@@ -73,11 +108,17 @@ class LazyOrderedDictionary(object):
         self._cache_list = []   # [(key, value)]
         self._cache_index = {}  # key -> index of _cache_list
         self._enumerated = False
+        # Iterator of the enumeration in progress.
+        self._enumeration = None
+        # Constructed entries not enumerated yet while enumerating.
+        self._unplaced = collections.OrderedDict()
 
     def refresh(self):
         del self._cache_list[:]
         self._cache_index.clear()
         self._enumerated = False
+        self._enumeration = None
+        self._unplaced.clear()
 
     def __len__(self):
         self._ensure_enumerated()
@@ -87,8 +128,7 @@ class LazyOrderedDictionary(object):
         return self.iterkeys()
 
     def iterkeys(self):
-        self._ensure_enumerated()
-        for key, _ in self._cache_list:
+        for key, _ in self.iteritems():
             yield key
 
     def itervalues(self):
@@ -96,9 +136,10 @@ class LazyOrderedDictionary(object):
             yield value
 
     def iteritems(self):
-        self._ensure_enumerated()
-        for key, value in self._cache_list:
-            yield (key, value)
+        index = 0
+        while self._ensure_index(index):
+            yield self._cache_list[index]
+            index += 1
 
     def keys(self):
         return list(self.iterkeys())
@@ -111,20 +152,27 @@ class LazyOrderedDictionary(object):
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            self._ensure_enumerated()
+            if key < 0:
+                self._ensure_enumerated()
+            else:
+                self._ensure_index(key)
             return self._cache_list[key][1]
         index = self._cache_index.get(key)
         if index is not None:
             return self._cache_list[index][1]
+        if key in self._unplaced:
+            return self._unplaced[key]
         if self._constructor:
             value = self._constructor(key)
             if value is None:
                 raise KeyError(key)
-            index = len(self._cache_list)
-            self._cache_index[key] = index
-            self._cache_list.append((key, value))
+            if self._enumeration is not None:
+                self._unplaced[key] = value
+            else:
+                self._append(key, value)
             return value
-        self._ensure_enumerated()
+        while key not in self._cache_index and self._enumerate_next():
+            pass
         index = self._cache_index.get(key)
         if index is None:
             raise KeyError(key)
@@ -136,25 +184,52 @@ class LazyOrderedDictionary(object):
         except KeyError:
             return default
 
+    def _append(self, key, value):
+        self._cache_index[key] = len(self._cache_list)
+        self._cache_list.append((key, value))
+
     def _ensure_enumerated(self):
+        while self._enumerate_next():
+            pass
+
+    def _ensure_index(self, index):
+        """Enumerates until `index` is available. Returns if it is."""
+        if not self._enumerated and self._enumeration is None:
+            self._start_enumeration()
+        while len(self._cache_list) <= index and self._enumerate_next():
+            pass
+        return index < len(self._cache_list)
+
+    def _enumerate_next(self):
+        """Enumerates one entry. Returns False if enumeration is complete."""
         if self._enumerated:
-            return
-        # Save partially constructed entries.
-        saves = self._cache_list[:]
-        # Initialize cache with the enumerator.
+            return False
+        if self._enumeration is None:
+            self._start_enumeration()
+        try:
+            key, value = next(self._enumeration)
+        except StopIteration:
+            # Entries not enumerated are placed at the end.
+            for key, value in self._unplaced.items():
+                self._append(key, value)
+            self._unplaced.clear()
+            self._enumeration = None
+            self._enumerated = True
+            return False
+        except BaseException:
+            # Restart the enumeration next time.
+            self._enumeration = None
+            raise
+        self._append(key, self._unplaced.pop(key, value))
+        return True
+
+    def _start_enumeration(self):
+        # Entries constructed or enumerated so far are placed when they are
+        # enumerated.
+        self._unplaced.update(self._cache_list)
         del self._cache_list[:]
         self._cache_index.clear()
-        for key, value in self._enumerator():
-            self._cache_index[key] = len(self._cache_list)
-            self._cache_list.append((key, value))
-        # Restore saved entries.
-        for key, value in saves:
-            index = self._cache_index.get(key)
-            if index is None:
-                index = len(self._cache_list)
-                self._cache_list.append((None, None))
-            self._cache_list[index] = (key, value)
-        self._enumerated = True
+        self._enumeration = iter(self._enumerator())
 
 
 class CustomMutableFixedList(object):
@@ -167,6 +242,8 @@ class CustomMutableFixedList(object):
     - __len__
     """
 
+    __slots__ = ()
+
     def __bool__(self):
         return len(self) > 0
 
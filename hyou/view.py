@@ -13,51 +13,305 @@
 # limitations under the License.
 
 
+import concurrent.futures
+import contextvars
+import json
+import threading
+
 from . import api
+from . import exception
+from . import frame
+from . import storage as storage_lib
+from . import tile
+from . import typed
 from . import util
+from . import writebehind
+
+# Bounds of a chunk of a commit sent in a single values().batchUpdate. The
+# Sheets API recommends request payloads of at most 2MB.
+COMMIT_CHUNK_CELLS = 50000
+COMMIT_CHUNK_BYTES = 2 * 1024 * 1024
+COMMIT_MAX_WORKERS = 4
+
+# Estimated bytes of a ValueRange in a request except for its values.
+_VALUE_RANGE_OVERHEAD = 100
 
 
 class View(util.CustomMutableFixedList):
 
+    __slots__ = (
+        '_worksheet', '_api', '_start_row', '_end_row', '_start_col',
+        '_end_col', '_cells', '_cells_fetched', '_queued_updates',
+        '_fetch_params', '_decoder', '_params_key', '_tile_size', '_lock',
+        '_commit_lock', '_write_behind', '_use_tile_cache')
+
     def __init__(self, worksheet, api, start_row, end_row, start_col, end_col,
-                 fetch_params=None):
+                 fetch_params=None, storage=None, tile_size=None,
+                 use_tile_cache=True):
         self._worksheet = worksheet
         self._api = api
         self._start_row = start_row
         self._end_row = end_row
         self._start_col = start_col
         self._end_col = end_col
-        self._view_rows = [
-            ViewRow(self, row, start_col, end_col)
-            for row in range(start_row, end_row)]
-        self._input_value_map = {}
+        self._cells = (storage or storage_lib.DictStorage)(
+            start_row, end_row, start_col, end_col)
         self._cells_fetched = False
-        self._queued_updates = []
+        # Uncommitted writes as {row: {col: value}}. Cells fetched or
+        # committed are kept in `_cells`, so that writes of unchanged values
+        # can be dropped.
+        self._queued_updates = {}
+        # A `typed.TypedValues` decoding fetched cells, or None.
+        self._decoder = None
+        if isinstance(fetch_params, typed.TypedValues):
+            self._decoder = fetch_params
+            fetch_params = fetch_params.params
         self._fetch_params = fetch_params or {}
+        self._params_key = json.dumps(self._fetch_params, sort_keys=True)
+        if self._decoder is not None:
+            self._params_key += self._decoder._key
+        # (rows, cols) of tiles to fetch cells in, or None to fetch the whole
+        # range at once. In tile mode, `_cells` holds committed cells only
+        # unless the whole range is fetched.
+        self._tile_size = tile_size
+        # Whether cells are shared with other views through the tile cache of
+        # the worksheet. Always true in tile mode.
+        self._use_tile_cache = use_tile_cache
+        # Guards `_queued_updates`, which may be mutated by a write-behind
+        # flusher while other threads keep writing.
+        self._lock = threading.Lock()
+        # Serializes commits.
+        self._commit_lock = threading.Lock()
+        self._write_behind = None
 
     def refresh(self):
-        self._input_value_map.clear()
-        self._cells_fetched = False
-        del self._queued_updates[:]
+        with self._lock:
+            self._cells.clear()
+            self._cells_fetched = False
+            self._queued_updates.clear()
+        self._worksheet._discard_tiles(*self._bounds())
 
     @api.retry_on_server_error
     def _ensure_cells_fetched(self):
         if self._cells_fetched:
             return
-        range_str = util.format_range_a1_notation(
-            self._worksheet.title, self._start_row, self._end_row,
-            self._start_col, self._end_col)
+        if self._load_shared_cells():
+            return
+        cache_version = self._get_cache_version()
+        if self._load_cached_cells(cache_version):
+            return
         response = self._api.sheets.spreadsheets().values().get(
             spreadsheetId=self._worksheet._spreadsheet.key,
-            range=range_str,
+            range=self._format_range(),
             **self._fetch_params).execute()
-        self._input_value_map = {}
-        for i, row in enumerate(response.get('values', [])):
-            index_row = self._start_row + i
-            for j, value in enumerate(row):
-                index_col = self._start_col + j
-                self._input_value_map.setdefault((index_row, index_col), value)
+        self._load_cells(response, cache_version)
+
+    def _read_cell(self, row, col):
+        """Return the value of a cell missing in `_cells`."""
+        if self._tile_size is None or self._cells_fetched:
+            self._ensure_cells_fetched()
+            return self._cells.get(row, col, '')
+        values, bounds = self._get_tile(row, col)
+        i = row - bounds[0]
+        j = col - bounds[2]
+        if i < len(values) and j < len(values[i]):
+            return values[i][j]
+        return ''
+
+    def _read_row(self, row, start_col, end_col):
+        result = self._read_stored_row(row, start_col, end_col)
+        queued = self._queued_updates.get(row)
+        if queued:
+            with self._lock:
+                queued = list(queued.items())
+            for col, value in queued:
+                if start_col <= col < end_col:
+                    result[col - start_col] = value
+        return result
+
+    def _read_stored_row(self, row, start_col, end_col):
+        if self._tile_size is None or self._cells_fetched:
+            self._ensure_cells_fetched()
+            return self._cells.get_row(row, start_col, end_col, '')
+        result = self._cells.get_row(row, start_col, end_col)
+        col = start_col
+        while col < end_col:
+            values, bounds = self._get_tile(row, col)
+            i = row - bounds[0]
+            tile_row = values[i] if i < len(values) else []
+            end = min(bounds[3], end_col) - start_col
+            for k in range(col - start_col, end):
+                if result[k] is None:
+                    j = start_col + k - bounds[2]
+                    result[k] = tile_row[j] if j < len(tile_row) else ''
+            col = bounds[3]
+        return result
+
+    @api.retry_on_server_error
+    def _get_tile(self, row, col):
+        """
+        Return (values, bounds) of the tile containing a cell, fetching it
+        into the tile cache of the worksheet if missing.
+        """
+        worksheet = self._worksheet
+        # Clipped to the view as well as the worksheet, so that a tile always
+        # contains the cell even if the worksheet has shrunk.
+        bounds = tile.tile_bounds(
+            row, col, self._tile_size, max(worksheet.rows, self._end_row),
+            max(worksheet.cols, self._end_col))
+        key = (self._params_key, bounds)
+        tile_cache = worksheet.tile_cache
+        values = tile_cache.get(key)
+        if values is None:
+            response = self._api.sheets.spreadsheets().values().get(
+                spreadsheetId=worksheet._spreadsheet.key,
+                range=util.format_range_a1_notation(worksheet.title, *bounds),
+                **self._fetch_params).execute()
+            values = self._decode(
+                response.get('values', []), bounds[2], bounds[3])
+            tile_cache.put(key, values)
+        elif key not in tile_cache:
+            # Sliced from a larger tile. Cache it so that following reads
+            # in the tile are exact hits.
+            tile_cache.put(key, values)
+        return values, bounds
+
+    def _format_range(self):
+        return util.format_range_a1_notation(
+            self._worksheet.title, self._start_row, self._end_row,
+            self._start_col, self._end_col)
+
+    def _decode(self, values, start_col, end_col):
+        if self._decoder is None:
+            return values
+        return self._decoder.decode(values, start_col, end_col)
+
+    def _load_cells(self, value_range, cache_version=None):
+        values = self._decode(
+            value_range.get('values', []), self._start_col, self._end_col)
+        self._cells.load(values)
+        self._cells_fetched = True
+        if self._use_tile_cache:
+            self._worksheet.tile_cache.put(
+                (self._params_key, self._bounds()), values)
+        if cache_version is not None:
+            self._api.cache.put(self._cache_key(), cache_version, value_range)
+
+    def _load_shared_cells(self):
+        """
+        Load cells from the tile cache of the worksheet. Return if it did.
+        """
+        if not self._use_tile_cache:
+            return False
+        values = self._worksheet.tile_cache.get(
+            (self._params_key, self._bounds()))
+        if values is None:
+            return False
+        self._cells.load(values)
         self._cells_fetched = True
+        return True
+
+    def _bounds(self):
+        return (self._start_row, self._end_row, self._start_col, self._end_col)
+
+    def _get_cache_version(self):
+        """
+        Return the version to look up the cache of the API with, or None if
+        the API has no cache. It must be taken before fetching cells.
+        """
+        if self._api.cache is None:
+            return None
+        return self._worksheet._spreadsheet._get_modified_date()
+
+    def _load_cached_cells(self, cache_version):
+        """Load cells from the cache of the API. Return if it did."""
+        if cache_version is None:
+            return False
+        value_range = self._api.cache.get(self._cache_key(), cache_version)
+        if value_range is None:
+            return False
+        self._load_cells(value_range)
+        return True
+
+    def _cache_key(self):
+        return 'values:%s:%s:%s' % (
+            self._worksheet._spreadsheet.key, self._format_range(),
+            self._params_key)
+
+    def to_pandas(self, header=False, infer_dtypes=True):
+        """
+        Return the cells of this view as a pandas DataFrame.
+
+        If `header` is True, the first row is used as column names. Columns
+        are otherwise named by their letters. If `infer_dtypes` is True,
+        columns of numbers or booleans are converted to numeric or boolean
+        dtypes and their blank cells to NaN.
+        """
+        return frame.to_pandas(*self._get_table(header), infer_dtypes)
+
+    def to_arrow(self, header=False, infer_dtypes=True):
+        """
+        Return the cells of this view as a pyarrow Table.
+
+        Arguments are the same as `to_pandas`. Blank cells in inferred
+        columns become nulls.
+        """
+        return frame.to_arrow(*self._get_table(header), infer_dtypes)
+
+    def _get_table(self, header):
+        self._ensure_cells_fetched()
+        columns = self._cells.get_columns('')
+        for row, col, value in self._get_queued_updates():
+            columns[col - self._start_col][row - self._start_row] = value
+        return frame.split_header(columns, header, self._start_col)
+
+    def _get_queued_updates(self):
+        """Return queued writes as a list of (row, col, value)."""
+        with self._lock:
+            return [
+                (row, col, value)
+                for row, queued in self._queued_updates.items()
+                for col, value in queued.items()]
+
+    def _queue_update(self, row, col, value):
+        write_behind = self._write_behind
+        if write_behind is not None:
+            write_behind._raise_error()
+        stored = self._cells.get(row, col)
+        if stored is None and self._cells_fetched:
+            stored = ''
+        with self._lock:
+            # Types are compared too, as 1 == 1.0 == True.
+            if stored is not None and (
+                    type(stored) is type(value) and stored == value):
+                # The cell is known to have the value already.
+                queued = self._queued_updates.get(row)
+                if queued is not None:
+                    queued.pop(col, None)
+                    if not queued:
+                        del self._queued_updates[row]
+                return
+            self._queued_updates.setdefault(row, {})[col] = value
+        if write_behind is not None:
+            write_behind._add(_estimate_value_bytes(value))
+
+    def write_behind(self, max_cells=writebehind.DEFAULT_MAX_CELLS,
+                     max_bytes=writebehind.DEFAULT_MAX_BYTES,
+                     max_age=writebehind.DEFAULT_MAX_AGE):
+        """
+        Start committing queued writes in the background.
+
+        Returns a `writebehind.WriteBehind`, which flushes writes when
+        `max_cells` cells or about `max_bytes` bytes have been written since
+        the last flush, or when the oldest of them is `max_age` seconds old.
+        Close it to commit the remaining writes.
+        """
+        if self._write_behind is not None:
+            raise exception.HyouRuntimeError(
+                'Write-behind is already enabled')
+        self._write_behind = writebehind.WriteBehind(
+            self, max_cells=max_cells, max_bytes=max_bytes, max_age=max_age)
+        return self._write_behind
 
     @api.retry_on_server_error
     def clear(self):
@@ -69,27 +323,91 @@ class View(util.CustomMutableFixedList):
         """
         params = {
             'spreadsheetId': self._worksheet._spreadsheet.key,
-            'range': util.format_range_a1_notation(
-                self._worksheet.title, self._start_row, self._end_row + 1,
-                self._start_col, self._end_col + 1
-            )
+            'range': self._format_range(),
         }
         self._api.sheets.spreadsheets().values().clear(**params).execute()
+        self._worksheet._spreadsheet._mark_modified()
         self.refresh()
 
-    @api.retry_on_server_error
-    def commit(self):
-        if not self._queued_updates:
+    def commit(self, progress=None, max_workers=COMMIT_MAX_WORKERS,
+               chunk_cells=COMMIT_CHUNK_CELLS, chunk_bytes=COMMIT_CHUNK_BYTES):
+        """
+        Send queued writes.
+
+        Writes are split into chunks of at most `chunk_cells` cells and
+        about `chunk_bytes` bytes, each sent in its own request and retried
+        on its own. Up to `max_workers` chunks are sent concurrently. If
+        given, `progress(committed_cells, total_cells)` is called after each
+        chunk is committed.
+
+        If some chunks fail after retries, the others are still committed
+        and `exception.HyouCommitError` is raised, keeping writes of failed
+        chunks queued. A single chunk raises its error as is.
+
+        Commits of a view are serialized, and writes made while committing
+        are left queued.
+        """
+        with self._commit_lock:
+            self._commit(progress, max_workers, chunk_cells, chunk_bytes)
+
+    def _commit(self, progress, max_workers, chunk_cells, chunk_bytes):
+        updates = self._get_queued_updates()
+        if not updates:
             return
+        chunks = _chunk_rects(
+            _coalesce_updates(updates), chunk_cells, chunk_bytes)
+        total_cells = len(updates)
+        if len(chunks) == 1:
+            self._commit_chunk(chunks[0])
+            self._finish_chunk(chunks[0])
+            if progress is not None:
+                progress(total_cells, total_cells)
+            return
+
+        committed_cells = 0
+        errors = []
+        futures = {}
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(chunks))))
+        try:
+            for chunk in chunks:
+                # Run in a copy of the context to apply retry_scope.
+                futures[executor.submit(
+                    contextvars.copy_context().run, self._commit_chunk,
+                    chunk)] = chunk
+            for future in concurrent.futures.as_completed(futures):
+                chunk = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    errors.append((
+                        [self._format_rect(rect) for rect in chunk], exc))
+                    continue
+                self._finish_chunk(chunk)
+                committed_cells += _count_cells(chunk)
+                if progress is not None:
+                    progress(committed_cells, total_cells)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        if errors:
+            raise exception.HyouCommitError(
+                '%d of %d chunks failed to commit' % (
+                    len(errors), len(chunks)),
+                errors, committed_cells,
+                total_cells - committed_cells) from errors[0][1]
+
+    @api.retry_on_server_error
+    def _commit_chunk(self, chunk):
         request = {
             'data': [
                 {
-                    'range': util.format_range_a1_notation(
-                        self._worksheet.title, row, row + 1, col, col + 1),
+                    'range': self._format_rect(rect),
                     'majorDimension': 'ROWS',
-                    'values': [[value]],
+                    'values': rect[4],
                 }
-                for row, col, value in self._queued_updates
+                for rect in chunk
             ],
             'valueInputOption': 'USER_ENTERED',
             'includeValuesInResponse': False,
@@ -97,10 +415,53 @@ class View(util.CustomMutableFixedList):
         self._api.sheets.spreadsheets().values().batchUpdate(
             spreadsheetId=self._worksheet._spreadsheet.key,
             body=request).execute()
-        del self._queued_updates[:]
+
+    def _finish_chunk(self, chunk):
+        """Move committed cells of `chunk` from the queue to `_cells`."""
+        self._worksheet._spreadsheet._mark_modified()
+        self._worksheet._discard_tiles(*self._bounds())
+        with self._lock:
+            for start_row, end_row, start_col, end_col, values in chunk:
+                for row, row_values in zip(range(start_row, end_row), values):
+                    queued = self._queued_updates.get(row)
+                    for col, value in zip(
+                            range(start_col, end_col), row_values):
+                        self._cells.set(row, col, value)
+                        # Keep the cell queued if it has been written again.
+                        if queued is not None and queued.get(col) is value:
+                            del queued[col]
+                    if queued is not None and not queued:
+                        del self._queued_updates[row]
+
+    def _format_rect(self, rect):
+        return util.format_range_a1_notation(
+            self._worksheet.title, *rect[:4])
+
+    def sort(self, key=None, reverse=False):
+        # Rows are copied as they are overwritten while being reordered.
+        for i, new_value in enumerate(sorted(
+                (list(row) for row in self), key=key, reverse=reverse)):
+            self[i] = new_value
+
+    def reverse(self):
+        for i, new_value in enumerate(reversed([list(row) for row in self])):
+            self[i] = new_value
 
     def __getitem__(self, index):
-        return self._view_rows[index]
+        # Rows are created on demand, so creating a view is O(1).
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            return [self._make_row(i) for i in range(start, stop, step)]
+        util.check_type(index, int)
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError('Row %d is out of range.' % index)
+        return self._make_row(index)
+
+    def _make_row(self, index):
+        return ViewRow(
+            self, self._start_row + index, self._start_col, self._end_col)
 
     def __setitem__(self, index, new_value):
         if isinstance(index, slice):
@@ -116,16 +477,17 @@ class View(util.CustomMutableFixedList):
             for i, new_value_one in zip(range(start, stop), new_value):
                 self[i] = new_value_one
             return
-        self._view_rows[index][:] = new_value
+        self[index][:] = new_value
 
     def __len__(self):
         return self.rows
 
     def __iter__(self):
-        return iter(self._view_rows)
+        for index in range(len(self)):
+            yield self._make_row(index)
 
     def __repr__(self):
-        return 'View(%r)' % self._view_rows
+        return 'View(%r)' % list(self)
 
     @property
     def rows(self):
@@ -152,8 +514,150 @@ class View(util.CustomMutableFixedList):
         return self._end_col
 
 
+def _coalesce_updates(updates):
+    """Merges queued cell updates into as few rectangles as possible.
+
+    `updates` is a sequence of (row, col, value) tuples where later updates
+    to the same cell win. Adjacent cells in a row are first joined into
+    column runs, then runs spanning the same columns on consecutive rows are
+    stacked into a single rectangle.
+
+    Returns a list of (start_row, end_row, start_col, end_col, values)
+    tuples sorted by position, where `values` is a list of rows.
+    """
+    cells = {}
+    for row, col, value in updates:
+        cells[(row, col)] = value
+
+    rects = []
+    open_rects = {}  # (start_col, end_col) -> the latest rect of the span
+    run = None  # [row, start_col, end_col, values]
+    for row, col in sorted(cells):
+        value = cells[(row, col)]
+        if run is not None and run[0] == row and run[2] == col:
+            run[2] = col + 1
+            run[3].append(value)
+            continue
+        if run is not None:
+            _add_run(rects, open_rects, *run)
+        run = [row, col, col + 1, [value]]
+    if run is not None:
+        _add_run(rects, open_rects, *run)
+    return [tuple(rect) for rect in rects]
+
+
+def _count_cells(rects):
+    return sum(
+        (end_row - start_row) * (end_col - start_col)
+        for start_row, end_row, start_col, end_col, _ in rects)
+
+
+def _chunk_rects(rects, max_cells, max_bytes):
+    """Groups rectangles of updates into chunks bounded by cells and bytes.
+
+    Rectangles exceeding the bounds are split by rows, and rows exceeding
+    the bounds by columns. The size of a rectangle is estimated from the
+    JSON encoding of its values.
+
+    Returns a list of chunks, which are lists of rectangles.
+    """
+    chunks = []
+    chunk = []
+    chunk_cells = chunk_bytes = 0
+    for rect in rects:
+        for piece, cells, size in _split_rect(rect, max_cells, max_bytes):
+            if chunk and (chunk_cells + cells > max_cells or
+                          chunk_bytes + size > max_bytes):
+                chunks.append(chunk)
+                chunk = []
+                chunk_cells = chunk_bytes = 0
+            chunk.append(piece)
+            chunk_cells += cells
+            chunk_bytes += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _split_rect(rect, max_cells, max_bytes):
+    """Yields (rect, cells, bytes) of pieces of `rect` within the bounds."""
+    start_row, end_row, start_col, end_col, values = rect
+    width = end_col - start_col
+    piece_start = start_row
+    piece_cells = 0
+    piece_bytes = _VALUE_RANGE_OVERHEAD
+    for row, row_values in zip(range(start_row, end_row), values):
+        row_bytes = len(json.dumps(row_values))
+        if (width > max_cells or
+                _VALUE_RANGE_OVERHEAD + row_bytes > max_bytes):
+            # The row alone exceeds the bounds.
+            if piece_start < row:
+                yield ((piece_start, row, start_col, end_col,
+                        values[piece_start - start_row:row - start_row]),
+                       piece_cells, piece_bytes)
+            for piece in _split_row(
+                    row, start_col, row_values, max_cells, max_bytes):
+                yield piece
+            piece_start = row + 1
+            piece_cells = 0
+            piece_bytes = _VALUE_RANGE_OVERHEAD
+            continue
+        if piece_start < row and (
+                piece_cells + width > max_cells or
+                piece_bytes + row_bytes > max_bytes):
+            yield ((piece_start, row, start_col, end_col,
+                    values[piece_start - start_row:row - start_row]),
+                   piece_cells, piece_bytes)
+            piece_start = row
+            piece_cells = 0
+            piece_bytes = _VALUE_RANGE_OVERHEAD
+        piece_cells += width
+        piece_bytes += row_bytes
+    if piece_start < end_row:
+        yield ((piece_start, end_row, start_col, end_col,
+                values[piece_start - start_row:]),
+               piece_cells, piece_bytes)
+
+
+def _split_row(row, start_col, row_values, max_cells, max_bytes):
+    piece = []
+    piece_bytes = _VALUE_RANGE_OVERHEAD
+    for value in row_values:
+        value_bytes = _estimate_value_bytes(value)
+        if piece and (len(piece) + 1 > max_cells or
+                      piece_bytes + value_bytes > max_bytes):
+            yield ((row, row + 1, start_col, start_col + len(piece),
+                    [piece]), len(piece), piece_bytes)
+            start_col += len(piece)
+            piece = []
+            piece_bytes = _VALUE_RANGE_OVERHEAD
+        piece.append(value)
+        piece_bytes += value_bytes
+    if piece:
+        yield ((row, row + 1, start_col, start_col + len(piece), [piece]),
+               len(piece), piece_bytes)
+
+
+def _estimate_value_bytes(value):
+    """Estimate bytes of `value` in the JSON encoding of a row."""
+    return len(json.dumps(value)) + 1
+
+
+def _add_run(rects, open_rects, row, start_col, end_col, values):
+    rect = open_rects.get((start_col, end_col))
+    if rect is not None and rect[1] == row:
+        rect[1] = row + 1
+        rect[4].append(values)
+        return
+    rect = [row, row + 1, start_col, end_col, [values]]
+    rects.append(rect)
+    open_rects[(start_col, end_col)] = rect
+
+
 class ViewRow(util.CustomMutableFixedList):
 
+    __slots__ = ('_view', '_row', '_start_col', '_end_col')
+
     def __init__(self, view, row, start_col, end_col):
         self._view = view
         self._row = row
@@ -177,9 +681,16 @@ class ViewRow(util.CustomMutableFixedList):
             col = self._start_col + index
         if not (self._start_col <= col < self._end_col):
             raise IndexError('Column %d is out of range.' % col)
-        if (self._row, col) not in self._view._input_value_map:
-            self._view._ensure_cells_fetched()
-        return self._view._input_value_map.get((self._row, col), '')
+        queued = self._view._queued_updates.get(self._row)
+        if queued is not None:
+            # Looked up at once as a flusher may remove it concurrently.
+            value = queued.get(col)
+            if value is not None:
+                return value
+        value = self._view._cells.get(self._row, col)
+        if value is None:
+            value = self._view._read_cell(self._row, col)
+        return value
 
     def __setitem__(self, index, new_value):
         if isinstance(index, slice):
@@ -202,27 +713,15 @@ class ViewRow(util.CustomMutableFixedList):
             col = self._start_col + index
         if not (self._start_col <= col < self._end_col):
             raise IndexError('Column %d is out of range.' % col)
-        if new_value is None:
-            new_value = ''
-        elif isinstance(new_value, int):
-            pass
-        elif isinstance(new_value, float):
-            pass
-        elif isinstance(new_value, bytes):
-            # May raise UnicodeDecodeError.
-            new_value = new_value.decode('ascii')
-        else:
-            new_value = str(new_value)
-        self._view._input_value_map[(self._row, col)] = new_value
-        self._view._queued_updates.append((self._row, col, new_value))
+        self._view._queue_update(
+            self._row, col, util.normalize_cell_value(new_value))
 
     def __len__(self):
         return self._end_col - self._start_col
 
     def __iter__(self):
-        self._view._ensure_cells_fetched()
-        for col in range(self._start_col, self._end_col):
-            yield self._view._input_value_map.get((self._row, col), '')
+        return iter(self._view._read_row(
+            self._row, self._start_col, self._end_col))
 
     def __repr__(self):
         return repr(list(self))
@@ -13,7 +13,14 @@
 # limitations under the License.
 
 
+import collections
+import concurrent.futures
+import contextvars
+
+from . import api
 from . import exception
+from . import frame as frame_lib
+from . import tile
 from . import util
 from . import view
 
@@ -28,22 +35,75 @@ class Worksheet:
     def __repr__(self):
         return 'Worksheet(key=%r)' % self.key
 
-    def refresh(self, entry=None):
+    def refresh(self, entry=None, full_entry=False):
+        """
+        Reload the metadata of the worksheet.
+
+        Only the properties of this sheet are fetched unless `full_entry` is
+        True, in which case the full sheet entry (without cell data) is
+        fetched.
+        """
         if entry is not None:
             self._entry = entry
         else:
-            spreadsheet_entry = self._api.sheets.spreadsheets().get(
+            self._entry = self._fetch_entry(
+                'sheets' if full_entry else 'sheets.properties')
+        self._discard_tiles()
+
+    @api.retry_on_server_error
+    def _fetch_entry(self, fields):
+        import googleapiclient.errors
+
+        spreadsheets = self._api.sheets.spreadsheets()
+        # Ask only for this sheet by its title. The range fails to parse if
+        # the sheet has been renamed, in which case all sheets are fetched.
+        try:
+            spreadsheet_entry = spreadsheets.get(
                 spreadsheetId=self._spreadsheet.key,
-                includeGridData=False).execute()
-            for entry in spreadsheet_entry['sheets']:
-                if entry['properties']['sheetId'] == self.key:
-                    self._entry = entry
-                    break
-            else:
-                raise exception.HyouRuntimeError('The sheet has been removed.')
+                ranges=util.format_sheet_a1_notation(self.title),
+                includeGridData=False, fields=fields).execute()
+        except googleapiclient.errors.HttpError as err:
+            if err.resp.status != 400:
+                raise
+            spreadsheet_entry = {}
+        for entry in spreadsheet_entry.get('sheets', []):
+            if entry['properties']['sheetId'] == self.key:
+                return entry
+        spreadsheet_entry = spreadsheets.get(
+            spreadsheetId=self._spreadsheet.key,
+            includeGridData=False, fields=fields).execute()
+        for entry in spreadsheet_entry.get('sheets', []):
+            if entry['properties']['sheetId'] == self.key:
+                return entry
+        raise exception.HyouRuntimeError('The sheet has been removed.')
 
     def view(self, start_row=None, end_row=None,
-             start_col=None, end_col=None, fetch_params=None):
+             start_col=None, end_col=None, fetch_params=None, storage=None,
+             tile_size=None, use_tile_cache=True):
+        """
+        Return a `View` of a range of the worksheet.
+
+        By default, the whole range is fetched on the first read. If
+        `tile_size` is given as (rows, cols), cells are fetched in tiles of
+        that size on demand instead.
+
+        Fetched cells are kept in `tile_cache` shared by views of this
+        worksheet, so a new view may return cells fetched earlier without
+        seeing changes made by other clients since then. Set
+        `use_tile_cache` to False to always fetch fresh cells for the view
+        and not to share them.
+
+        `fetch_params` is a dict of parameters of values().get, or a
+        `typed.TypedValues` to fetch cells as native Python values.
+        """
+        if tile_size is not None:
+            if not use_tile_cache:
+                raise ValueError('Tile mode requires the tile cache')
+            tile_rows, tile_cols = tile_size
+            util.check_type(tile_rows, int)
+            util.check_type(tile_cols, int)
+            if not (tile_rows > 0 and tile_cols > 0):
+                raise ValueError('tile_size must be positive')
         start_row, end_row, _ = slice(start_row, end_row).indices(self.rows)
         start_col, end_col, _ = slice(start_col, end_col).indices(self.cols)
         if start_row > end_row:
@@ -54,9 +114,176 @@ class Worksheet:
             self, self._api,
             start_row=start_row, end_row=end_row,
             start_col=start_col, end_col=end_col,
-            fetch_params=fetch_params
+            fetch_params=fetch_params, storage=storage, tile_size=tile_size,
+            use_tile_cache=use_tile_cache
         )
 
+    @property
+    def tile_cache(self):
+        """
+        The `tile.TileCache` of cells fetched by views of this worksheet.
+
+        It is kept by the spreadsheet per sheet ID, so it is shared with
+        `Worksheet` objects of the same sheet obtained before or after a
+        refresh of the spreadsheet. It is created with the default budget on
+        first use, and can be replaced to change the budget.
+        """
+        tile_caches = self._spreadsheet._tile_caches
+        tile_cache = tile_caches.get(self.key)
+        if tile_cache is None:
+            tile_cache = tile_caches[self.key] = tile.TileCache()
+        return tile_cache
+
+    @tile_cache.setter
+    def tile_cache(self, tile_cache):
+        self._spreadsheet._tile_caches[self.key] = tile_cache
+
+    def _discard_tiles(self, start_row=0, end_row=None, start_col=0,
+                       end_col=None):
+        """Discard cached tiles overlapping a range modified."""
+        tile_cache = self._spreadsheet._tile_caches.get(self.key)
+        if tile_cache is None:
+            return
+        if end_row is None and end_col is None:
+            tile_cache.clear()
+            return
+        tile_cache.discard(start_row, end_row, start_col, end_col)
+
+    def iter_rows(self, chunk_rows=1000, prefetch=1, start_row=None,
+                  end_row=None, start_col=None, end_col=None,
+                  fetch_params=None):
+        """
+        Iterate over rows of the worksheet as lists of cell values.
+
+        Rows are fetched in windows of `chunk_rows` rows. Up to `prefetch`
+        following windows are fetched in a background thread while the
+        caller processes the current one, so at most `prefetch + 1` windows
+        are held in memory at a time. Set `prefetch` to 0 to fetch windows
+        synchronously. Windows are not kept in `tile_cache`.
+        """
+        util.check_type(chunk_rows, int)
+        util.check_type(prefetch, int)
+        if chunk_rows <= 0:
+            raise ValueError('chunk_rows must be positive')
+        if prefetch < 0:
+            raise ValueError('prefetch must not be negative')
+        start_row, end_row, _ = slice(start_row, end_row).indices(self.rows)
+        start_col, end_col, _ = slice(start_col, end_col).indices(self.cols)
+        if start_col > end_col:
+            start_col = end_col
+
+        def fetch(window_start):
+            window = self.view(
+                start_row=window_start,
+                end_row=min(window_start + chunk_rows, end_row),
+                start_col=start_col, end_col=end_col,
+                fetch_params=fetch_params, use_tile_cache=False)
+            window._ensure_cells_fetched()
+            return window
+
+        window_starts = iter(range(start_row, end_row, chunk_rows))
+        if prefetch == 0:
+            for window_start in window_starts:
+                for row in fetch(window_start):
+                    yield list(row)
+            return
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        pending = collections.deque()
+        try:
+            while True:
+                while len(pending) <= prefetch:
+                    window_start = next(window_starts, None)
+                    if window_start is None:
+                        break
+                    # Run in a copy of the context to apply retry_scope.
+                    pending.append(executor.submit(
+                        contextvars.copy_context().run, fetch, window_start))
+                if not pending:
+                    break
+                for row in pending.popleft().result():
+                    yield list(row)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def append_rows(self, rows, batch_size=1000):
+        """
+        Append `rows`, an iterable of lists of cell values, after the last
+        non-empty row of the worksheet.
+
+        Rows are inserted with values().append requests of up to
+        `batch_size` rows each, consuming `rows` lazily, so any iterable can
+        be streamed. The row count of the worksheet is updated locally.
+        Returns the number of rows appended.
+        """
+        util.check_type(batch_size, int)
+        if batch_size <= 0:
+            raise ValueError('batch_size must be positive')
+        appended = 0
+        batch = []
+        for row in rows:
+            batch.append([util.normalize_cell_value(value) for value in row])
+            if len(batch) == batch_size:
+                self._append_batch(batch)
+                appended += len(batch)
+                batch = []
+        if batch:
+            self._append_batch(batch)
+            appended += len(batch)
+        return appended
+
+    # Appending is not idempotent: a retried request may duplicate rows.
+    @api.retry_on_server_error(idempotent=False)
+    def _append_batch(self, batch):
+        self._api.sheets.spreadsheets().values().append(
+            spreadsheetId=self._spreadsheet.key,
+            range=util.format_sheet_a1_notation(self.title),
+            valueInputOption='USER_ENTERED',
+            insertDataOption='INSERT_ROWS',
+            body={'majorDimension': 'ROWS', 'values': batch},
+            fields='updates(updatedRange)').execute()
+        # INSERT_ROWS always adds new rows to the grid.
+        self._entry['properties']['gridProperties']['rowCount'] += len(batch)
+        self._spreadsheet._mark_modified()
+        # Inserted rows shift cells below them.
+        self._discard_tiles()
+
+    def write_frame(self, frame, start_row=0, start_col=0, header=True):
+        """
+        Write a pandas DataFrame or a pyarrow Table to the worksheet with a
+        single values().update request.
+
+        The column names are written as the first row if `header` is True.
+        Missing values are written as blanks. The worksheet is enlarged if
+        the table does not fit.
+        """
+        util.check_type(start_row, int)
+        util.check_type(start_col, int)
+        if not (start_row >= 0 and start_col >= 0):
+            raise ValueError('Negative position is not allowed')
+        values = frame_lib.to_values(frame, header)
+        if not values or not values[0]:
+            return
+        end_row = start_row + len(values)
+        end_col = start_col + len(values[0])
+        if end_row > self.rows or end_col > self.cols:
+            self.set_size(max(self.rows, end_row), max(self.cols, end_col))
+        self._update_values(start_row, end_row, start_col, end_col, values)
+
+    @api.retry_on_server_error
+    def _update_values(self, start_row, end_row, start_col, end_col, values):
+        self._api.sheets.spreadsheets().values().update(
+            spreadsheetId=self._spreadsheet.key,
+            range=util.format_range_a1_notation(
+                self.title, start_row, end_row, start_col, end_col),
+            valueInputOption='USER_ENTERED',
+            body={'majorDimension': 'ROWS', 'values': values},
+            fields='updatedCells').execute()
+        self._spreadsheet._mark_modified()
+        self._discard_tiles(start_row, end_row, start_col, end_col)
+
     def set_size(self, rows, cols):
         util.check_type(rows, int)
         util.check_type(cols, int)
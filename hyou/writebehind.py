@@ -0,0 +1,176 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextvars
+import threading
+import time
+
+from . import exception
+
+# Default thresholds of writes since the last flush to trigger a flush.
+DEFAULT_MAX_CELLS = 10000
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_MAX_AGE = 5.0
+
+
+class WriteBehind(object):
+    """
+    Background flusher committing queued writes of a view.
+
+    A flush is triggered when the writes since the last flush reach
+    `max_cells` cells or about `max_bytes` bytes, or when the oldest of them
+    is `max_age` seconds old. Any threshold can be None to disable it.
+    Writes to the view continue while a flush is in progress, and are
+    committed by the next flush.
+
+    If a flush fails, the failed writes stay queued and automatic flushes
+    are paused until the error is raised from the next write to the view,
+    `flush()` or `close()`.
+
+    Created by `View.write_behind()`. Call `close()`, or use it as a context
+    manager, to commit the remaining writes and stop the flusher.
+    """
+
+    def __init__(self, view, max_cells=DEFAULT_MAX_CELLS,
+                 max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        for threshold in (max_cells, max_bytes, max_age):
+            if threshold is not None and threshold <= 0:
+                raise ValueError('Thresholds must be positive')
+        self._view = view
+        self.max_cells = max_cells
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._cond = threading.Condition()
+        # Writes since the last flush.
+        self._cells = 0
+        self._bytes = 0
+        self._first_write_time = None
+        # Generations of flushes requested by flush() and completed.
+        self._requested = 0
+        self._completed = 0
+        self._error = None
+        self._closed = False
+        # Run in a copy of the context to apply retry_scope.
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run, args=(self._run,),
+            name='hyou-write-behind', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def flush(self):
+        """
+        Commit all writes queued so far, waiting for the flush to complete.
+        """
+        with self._cond:
+            if self._closed:
+                raise exception.HyouRuntimeError('Write-behind is closed')
+            self._requested += 1
+            generation = self._requested
+            self._cond.notify_all()
+            while self._completed < generation:
+                self._cond.wait()
+            self._raise_error_locked()
+
+    def close(self):
+        """
+        Commit the remaining writes and stop the flusher. Writes to the view
+        after closing are queued until `View.commit()` is called.
+        """
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            self._thread.join()
+            self._view._write_behind = None
+
+    def _raise_error(self):
+        """Raise the error of the last flush if it has not been raised."""
+        if self._error is not None:
+            with self._cond:
+                self._raise_error_locked()
+
+    def _raise_error_locked(self):
+        error = self._error
+        if error is not None:
+            self._error = None
+            # Automatic flushes may resume.
+            self._cond.notify_all()
+            raise error
+
+    def _add(self, size):
+        """Record a write of `size` bytes to the view."""
+        with self._cond:
+            if self._first_write_time is None:
+                self._first_write_time = time.monotonic()
+                if self.max_age is not None:
+                    self._cond.notify_all()
+            self._cells += 1
+            self._bytes += size
+            if ((self.max_cells is not None and
+                 self._cells >= self.max_cells) or
+                    (self.max_bytes is not None and
+                     self._bytes >= self.max_bytes)):
+                self._cond.notify_all()
+
+    def _wait_time(self):
+        """
+        Return the number of seconds until an automatic flush is due, or
+        None if no flush will be due without further writes.
+        """
+        if self._error is not None or self._first_write_time is None:
+            return None
+        if ((self.max_cells is not None and self._cells >= self.max_cells) or
+                (self.max_bytes is not None and
+                 self._bytes >= self.max_bytes)):
+            return 0
+        if self.max_age is None:
+            return None
+        return self._first_write_time + self.max_age - time.monotonic()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._requested == self._completed:
+                    if self._closed:
+                        return
+                    timeout = self._wait_time()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._cond.wait(timeout)
+                generation = self._requested
+                self._cells = self._bytes = 0
+                self._first_write_time = None
+            error = None
+            try:
+                self._view.commit()
+            except Exception as exc:
+                error = exc
+            with self._cond:
+                # A successful flush has committed writes of failed ones.
+                self._error = error
+                self._completed = generation
+                self._cond.notify_all()
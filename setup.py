@@ -37,10 +37,15 @@ setuptools.setup(
     long_description=read_file('README.txt'),
     url='https://github.com/google/hyou/',
     packages=['hyou', 'hyou.schema'],
+    package_data={'hyou.schema': ['*.json']},
     scripts=[
         'tools/generate_oauth2_credentials.py',
     ],
     install_requires=REQUIRED,
+    extras_require={
+        'arrow': ['pyarrow'],
+        'pandas': ['pandas'],
+    },
     python_requires='>=3.8',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,272 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from unittest import mock
+
+import googleapiclient.errors
+import pytest
+
+import hyou.aio
+import hyou.api
+import hyou.exception
+
+from . import fake_server
+from . import http_mocks
+
+CREDENTIALS_FILE = 'unittest-sheets.json'
+
+
+class AsyncTestBase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = hyou.api.API(
+            http_mocks.ReplayHttp(CREDENTIALS_FILE),
+            discovery=False)
+
+    def setUp(self):
+        self.collection = hyou.aio.AsyncCollection(self.api)
+
+
+class AsyncReadOnlyTest(AsyncTestBase):
+
+    KEY = '1ZeOz9HFMJaS4GhZNAdr1Lb-326zVF0c7IG1RL9btlVI'
+    ROWS = [
+        ['honoka', 'eri', 'kotori', 'umi', 'rin'],
+        ['maki', 'nozomi', 'hanayo', 'niko', '']]
+
+    def test_spreadsheet(self):
+        spreadsheet = asyncio.run(self.collection.get(self.KEY))
+        self.assertEqual(self.KEY, spreadsheet.key)
+        self.assertEqual('WorksheetReadOnlyTest', spreadsheet.title)
+        self.assertEqual(['Sheet1'], spreadsheet.keys())
+        worksheet = spreadsheet['Sheet1']
+        self.assertEqual('Sheet1', worksheet.title)
+        self.assertEqual(2, worksheet.rows)
+        self.assertEqual(5, worksheet.cols)
+
+    def test_view(self):
+        async def read():
+            spreadsheet = await self.collection.get(self.KEY)
+            view = spreadsheet['Sheet1'].view()
+            await view.fetch()
+            first = list(view[0])
+            return first, [list(row) async for row in view]
+
+        first, rows = asyncio.run(read())
+        self.assertEqual(self.ROWS[0], first)
+        self.assertEqual(self.ROWS, rows)
+
+    def test_iter_rows(self):
+        async def read(**kwargs):
+            spreadsheet = await self.collection.get(self.KEY)
+            return [
+                row async for row in
+                spreadsheet['Sheet1'].iter_rows(**kwargs)]
+
+        self.assertEqual(self.ROWS, asyncio.run(read()))
+        self.assertEqual(self.ROWS, asyncio.run(read(chunk_rows=1)))
+        self.assertEqual(
+            self.ROWS, asyncio.run(read(chunk_rows=1, prefetch=0)))
+
+    def test_iter_rows_uncached(self):
+        async def read():
+            spreadsheet = await self.collection.get(self.KEY)
+            worksheet = spreadsheet['Sheet1']
+            rows = [row async for row in worksheet.iter_rows(chunk_rows=1)]
+            return rows, len(worksheet.worksheet.tile_cache)
+
+        self.assertEqual((self.ROWS, 0), asyncio.run(read()))
+
+    def test_fetch_views(self):
+        async def read():
+            spreadsheet = await self.collection.get(self.KEY)
+            worksheet = spreadsheet['Sheet1']
+            views = [
+                worksheet.view(),
+                worksheet.view(start_row=1, start_col=1, end_col=3)]
+            await spreadsheet.fetch_views(views)
+            return [list(view.view) for view in views]
+
+        self.assertEqual(
+            [self.ROWS, [['nozomi', 'hanayo']]], asyncio.run(read()))
+
+    def test_concurrent(self):
+        async def read():
+            spreadsheet = await self.collection.get(self.KEY)
+            views = [spreadsheet['Sheet1'].view() for _ in range(10)]
+            await asyncio.gather(*(view.fetch() for view in views))
+            return [view[1][2] for view in views]
+
+        self.assertEqual(['hanayo'] * 10, asyncio.run(read()))
+
+
+class AsyncReadWriteTest(AsyncTestBase):
+
+    KEY = '1IWcyjDQhL0X8wdb1BZFAigJJ7WpBpmbgDrw1zQxyUHI'
+
+    def test_write(self):
+        async def write():
+            spreadsheet = await self.collection.get(self.KEY)
+            view = spreadsheet['Sheet1'].view()
+            view[1][3] = 'ni'
+            view[0][-3] = 'chunchun'
+            await view.commit()
+
+        asyncio.run(write())
+
+    def test_set_size(self):
+        async def resize():
+            spreadsheet = await self.collection.get(self.KEY)
+            worksheet = spreadsheet['Sheet1']
+            await worksheet.set_size(2, 5)
+            return worksheet
+
+        worksheet = asyncio.run(resize())
+        self.assertEqual(2, worksheet.rows)
+        self.assertEqual(5, worksheet.cols)
+
+    def test_batch(self):
+        async def resize():
+            spreadsheet = await self.collection.get(self.KEY)
+            async with spreadsheet.batch():
+                await spreadsheet['Sheet1'].set_size(2, 5)
+                self.assertIsNotNone(spreadsheet.spreadsheet._batch_requests)
+            self.assertIsNone(spreadsheet.spreadsheet._batch_requests)
+            return spreadsheet['Sheet1']
+
+        worksheet = asyncio.run(resize())
+        self.assertEqual(2, worksheet.rows)
+        self.assertEqual(5, worksheet.cols)
+
+
+class AsyncAppendRowsTest(unittest.TestCase):
+
+    def test_append_rows(self):
+        server = fake_server.FakeServer()
+        key = server.create_spreadsheet('Book', [('Sheet1', 2, 2)])
+        collection = hyou.aio.AsyncCollection(
+            hyou.api.API(server, discovery=False))
+
+        async def rows():
+            for i in range(3):
+                yield [i, 'x']
+
+        async def append():
+            spreadsheet = await collection.get(key)
+            worksheet = spreadsheet['Sheet1']
+            self.assertEqual(
+                3, await worksheet.append_rows(rows(), batch_size=2))
+            self.assertEqual(
+                1, await worksheet.append_rows([['y']]))
+            return worksheet
+
+        worksheet = asyncio.run(append())
+        self.assertEqual(6, worksheet.rows)
+        self.assertEqual(
+            [['0', 'x'], ['1', 'x'], ['2', 'x'], ['y']],
+            server.get_values(key, 'Sheet1'))
+        self.assertEqual(
+            3, server.request_counts['sheets.spreadsheets.values.append'])
+
+
+class AsyncRetryTest(unittest.TestCase):
+
+    KEY = '1ZeOz9HFMJaS4GhZNAdr1Lb-326zVF0c7IG1RL9btlVI'
+
+    def setUp(self):
+        # Blocking sleeps must not be used for retries.
+        self.time_sleep_patcher = mock.patch(
+            'time.sleep', side_effect=AssertionError('time.sleep called'))
+        self.time_sleep_patcher.start()
+        self.sleep_patcher = mock.patch('asyncio.sleep')
+        self.sleep_mock = self.sleep_patcher.start()
+
+    def tearDown(self):
+        self.sleep_patcher.stop()
+        self.time_sleep_patcher.stop()
+
+    def _read(self, max_sleep):
+        api = hyou.api.API(
+            http_mocks.ErrorHttp(
+                CREDENTIALS_FILE, max_sleep, self.sleep_mock),
+            discovery=False)
+        collection = hyou.aio.AsyncCollection(api)
+
+        async def read():
+            spreadsheet = await collection.get(self.KEY)
+            view = spreadsheet['Sheet1'].view()
+            await view.fetch()
+            return view[0][0]
+
+        return asyncio.run(read())
+
+    def test_retry(self):
+        self.assertEqual('honoka', self._read(hyou.api.MAX_WAIT_TIME - 1))
+        self.assertTrue(self.sleep_mock.called)
+
+    def test_too_many_errors(self):
+        with pytest.raises(googleapiclient.errors.HttpError):
+            self._read(hyou.api.MAX_WAIT_TIME + 1)
+
+
+class AsyncRetryScopeTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('asyncio.sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.server = fake_server.FakeServer(writes_per_minute=0)
+        self.key = self.server.create_spreadsheet(
+            'Book', [('Sheet1', 4, 3)])
+        self.collection = hyou.aio.AsyncCollection(
+            hyou.api.API(self.server, discovery=False))
+
+    def test_chunked_commit_deadline(self):
+        async def write():
+            spreadsheet = await self.collection.get(self.key)
+            view = spreadsheet['Sheet1'].view()
+            for i in range(4):
+                view[i] = ['%d:%d' % (i, j) for j in range(3)]
+            with hyou.api.retry_scope(deadline=0):
+                await view.commit(chunk_cells=6)
+
+        with pytest.raises(hyou.exception.HyouCommitError) as info:
+            asyncio.run(write())
+        self.assertEqual(2, len(info.value.errors))
+        # Chunks sent from the executor obey the scope of the caller.
+        self.assertFalse(self.sleep.called)
+        self.assertEqual(
+            2, self.server.request_counts[
+                'sheets.spreadsheets.values.batchUpdate'])
+
+
+class AsyncLoginTest(unittest.TestCase):
+
+    @mock.patch('hyou.util.parse_credentials')
+    @mock.patch('hyou.api.API')
+    def test_login(self, api_mock, parse_credentials_mock):
+        cache = mock.sentinel.cache
+        limiter = mock.sentinel.rate_limiter
+        collection = hyou.aio.AsyncCollection.login(
+            json_text='{}', cache=cache, rate_limiter=limiter)
+        api_mock.assert_called_once_with(
+            credentials=parse_credentials_mock.return_value,
+            discovery=False, cache=cache, rate_limiter=limiter)
+        self.assertIs(api_mock.return_value, collection.collection._api)
@@ -13,15 +13,21 @@
 # limitations under the License.
 
 import contextlib
+import contextvars
 import logging
+import os
+import threading
 import time
 import unittest
 from unittest import mock
 
 import googleapiclient.errors
+import httplib2
 import pytest
 
 import hyou.api
+import hyou.schema
+import hyou.util
 
 from . import http_mocks
 
@@ -46,11 +52,32 @@ class APITest(unittest.TestCase):
             http_mocks.ReplayHttp(None),
             discovery=False)
 
+    def test_schema(self):
+        self.assertEqual('v4', hyou.schema.SHEETS_V4['version'])
+        self.assertEqual('v2', hyou.schema.DRIVE_V2['version'])
+        # Documents are parsed once.
+        self.assertIs(hyou.schema.SHEETS_V4, hyou.schema.load('sheets_v4'))
+        with self.assertRaises(AttributeError):
+            hyou.schema.SHEETS_V5
+
     def test_discovery(self):
         with suppress_oauth2client_warnings():
-            hyou.api.API(
+            api = hyou.api.API(
                 http_mocks.ReplayHttp(CREDENTIALS_FILE),
                 discovery=True)
+            api.sheets
+            api.drive
+
+    def test_lazy_services(self):
+        api = hyou.api.API(http_mocks.ReplayHttp(None), discovery=False)
+        with mock.patch('googleapiclient.discovery.build_from_document') as (
+                build):
+            self.assertIs(api.sheets, api.sheets)
+            self.assertEqual(1, build.call_count)
+            self.assertEqual(
+                'sheets', build.call_args[0][0]['name'])
+            api.drive
+            self.assertEqual(2, build.call_count)
 
     def test_discovery_retry_on_error(self):
         sleep_patcher = mock.patch('time.sleep')
@@ -60,19 +87,183 @@ class APITest(unittest.TestCase):
         with suppress_oauth2client_warnings():
             # This should suceed as we wait one second longer than `ErrorHttp`
             # will return errors
-            hyou.api.API(
+            api = hyou.api.API(
                 http_mocks.ErrorHttp(
                     CREDENTIALS_FILE, hyou.api.MAX_WAIT_TIME-1, sleep_mock),
                 discovery=True)
+            api.sheets
+            api.drive
 
             sleep_mock.reset_mock()
-            # Conversely, this constructor should fail as `ErrorHttp` will
-            # return error for a longer time than we're willing to wait
+            # Conversely, building the service should fail as `ErrorHttp`
+            # will return error for a longer time than we're willing to wait
+            api = hyou.api.API(
+                http_mocks.ErrorHttp(
+                    CREDENTIALS_FILE, hyou.api.MAX_WAIT_TIME+1, sleep_mock
+                ),
+                discovery=True)
             with pytest.raises(googleapiclient.errors.HttpError):
-                hyou.api.API(
-                    http_mocks.ErrorHttp(
-                        CREDENTIALS_FILE, hyou.api.MAX_WAIT_TIME+1, sleep_mock
-                    ),
-                    discovery=True)
+                api.sheets
 
         sleep_patcher.stop()
+
+
+class ThreadLocalHttpTest(unittest.TestCase):
+
+    def setUp(self):
+        json_path = os.path.join(
+            os.path.dirname(__file__), 'creds', 'example-bot.json')
+        with open(json_path) as f:
+            self.credentials = hyou.util.parse_credentials(f.read())
+
+    def test_api_with_credentials(self):
+        api = hyou.api.API(credentials=self.credentials)
+        self.assertIsInstance(api.sheets._http, hyou.api._ThreadLocalHttp)
+
+    def test_http_per_thread(self):
+        http = hyou.api._ThreadLocalHttp(self.credentials)
+        with mock.patch('google_auth_httplib2.AuthorizedHttp') as http_class:
+            http_class.side_effect = lambda *args, **kwargs: mock.Mock()
+            http.request('https://example.com/')
+            http.request('https://example.com/')
+            self.assertEqual(1, http_class.call_count)
+
+            thread = threading.Thread(
+                target=http.request, args=('https://example.com/',))
+            thread.start()
+            thread.join()
+            self.assertEqual(2, http_class.call_count)
+
+
+class RetryTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def make_error(status, retry_after=None):
+        headers = {'status': status}
+        if retry_after is not None:
+            headers['retry-after'] = retry_after
+        return googleapiclient.errors.HttpError(
+            httplib2.Response(headers), b'')
+
+    def make_func(self, errors, idempotent=True):
+        errors = list(errors)
+
+        @hyou.api.retry_on_server_error(idempotent=idempotent)
+        def func():
+            if errors:
+                raise errors.pop(0)
+            return 'ok'
+        return func
+
+    def sleeps(self):
+        return [call[0][0] for call in self.sleep.call_args_list]
+
+    def test_jitter(self):
+        func = self.make_func([self.make_error(503)] * 5)
+        self.assertEqual('ok', func())
+        sleeps = self.sleeps()
+        self.assertEqual(5, len(sleeps))
+        for wait in sleeps:
+            self.assertGreaterEqual(wait, hyou.api.BASE_DELAY)
+            self.assertLessEqual(wait, hyou.api.MAX_DELAY)
+
+    def test_retry_after(self):
+        func = self.make_func([self.make_error(429, '7')])
+        self.assertEqual('ok', func())
+        self.assertEqual([7.0], self.sleeps())
+
+    def test_retry_after_too_long(self):
+        func = self.make_func([self.make_error(429, '7')])
+        with hyou.api.retry_scope(max_wait_time=5):
+            with self.assertRaises(googleapiclient.errors.HttpError):
+                func()
+        self.assertEqual([], self.sleeps())
+
+    def test_parse_retry_after(self):
+        self.assertEqual(
+            3.0, hyou.api._parse_retry_after(self.make_error(429, '3')))
+        self.assertEqual(
+            0.0,
+            hyou.api._parse_retry_after(
+                self.make_error(429, 'Wed, 21 Oct 2015 07:28:00 GMT')))
+        self.assertIsNone(
+            hyou.api._parse_retry_after(self.make_error(429, 'soon')))
+        self.assertIsNone(
+            hyou.api._parse_retry_after(self.make_error(429)))
+
+    def test_max_retries(self):
+        func = self.make_func([self.make_error(500)] * 3)
+        with hyou.api.retry_scope(max_retries=3):
+            self.assertEqual('ok', func())
+        func = self.make_func([self.make_error(500)] * 3)
+        with hyou.api.retry_scope(max_retries=3):
+            self.assertEqual('ok', self.make_func([self.make_error(500)])())
+            with self.assertRaises(googleapiclient.errors.HttpError):
+                func()
+        self.assertEqual(6, len(self.sleeps()))
+
+    def test_nested_scopes(self):
+        func = self.make_func([self.make_error(500)] * 2)
+        with hyou.api.retry_scope(max_retries=1):
+            with hyou.api.retry_scope(max_retries=5):
+                with self.assertRaises(googleapiclient.errors.HttpError):
+                    func()
+
+    def test_deadline(self):
+        func = self.make_func([self.make_error(500)])
+        with hyou.api.retry_scope(deadline=0):
+            with self.assertRaises(googleapiclient.errors.HttpError):
+                func()
+        self.assertEqual([], self.sleeps())
+
+    def test_budget_kept_after_deadline(self):
+        with hyou.api.retry_scope(max_retries=1):
+            with hyou.api.retry_scope(deadline=0):
+                with self.assertRaises(googleapiclient.errors.HttpError):
+                    self.make_func([self.make_error(500)])()
+            self.assertEqual('ok', self.make_func([self.make_error(500)])())
+        self.assertEqual(1, len(self.sleeps()))
+
+    def test_budget_kept_after_retry_after(self):
+        with hyou.api.retry_scope(max_retries=1, max_wait_time=5):
+            with self.assertRaises(googleapiclient.errors.HttpError):
+                self.make_func([self.make_error(429, '7')])()
+            self.assertEqual(
+                'ok', self.make_func([self.make_error(429, '2')])())
+        self.assertEqual([2.0], self.sleeps())
+
+    def test_budget_shared_by_threads(self):
+        results = []
+
+        def call():
+            try:
+                results.append(self.make_func([self.make_error(500)])())
+            except googleapiclient.errors.HttpError:
+                results.append('error')
+
+        with hyou.api.retry_scope(max_retries=10):
+            threads = [
+                threading.Thread(target=contextvars.copy_context().run,
+                                 args=(call,))
+                for _ in range(30)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(10, results.count('ok'))
+        self.assertEqual(20, results.count('error'))
+
+    def test_non_idempotent(self):
+        func = self.make_func([self.make_error(500)], idempotent=False)
+        with self.assertRaises(googleapiclient.errors.HttpError):
+            func()
+        func = self.make_func([self.make_error(429)], idempotent=False)
+        self.assertEqual('ok', func())
+        func = self.make_func([self.make_error(500)], idempotent=False)
+        with hyou.api.retry_scope(retry_non_idempotent=True):
+            self.assertEqual('ok', func())
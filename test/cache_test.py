@@ -0,0 +1,117 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import hyou.api
+import hyou.cache
+import hyou.collection
+
+from . import http_mocks
+
+CREDENTIALS_FILE = 'unittest-sheets.json'
+
+
+class CountingReplayHttp(http_mocks.ReplayHttp):
+
+    def __init__(self, json_name):
+        super(CountingReplayHttp, self).__init__(json_name)
+        self.uris = []
+
+    def request(self, uri, *args, **kwargs):
+        self.uris.append(uri.split('?')[0])
+        return super(CountingReplayHttp, self).request(uri, *args, **kwargs)
+
+
+class DirectoryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = hyou.cache.DirectoryCache(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get_put(self):
+        self.assertIsNone(self.cache.get('apple', 'v1'))
+        self.cache.put('apple', 'v1', {'color': 'red'})
+        self.assertEqual({'color': 'red'}, self.cache.get('apple', 'v1'))
+        self.assertIsNone(self.cache.get('apple', 'v2'))
+        self.assertIsNone(self.cache.get('banana', 'v1'))
+        self.cache.put('apple', 'v2', {'color': 'green'})
+        self.assertEqual({'color': 'green'}, self.cache.get('apple', 'v2'))
+        self.assertIsNone(self.cache.get('apple', 'v1'))
+
+    def test_shared(self):
+        self.cache.put('apple', 'v1', ['red'])
+        other = hyou.cache.DirectoryCache(self.path)
+        self.assertEqual(['red'], other.get('apple', 'v1'))
+
+    def test_corrupted(self):
+        self.cache.put('apple', 'v1', ['red'])
+        for name in os.listdir(self.path):
+            with open(os.path.join(self.path, name), 'w') as f:
+                f.write('{')
+        self.assertIsNone(self.cache.get('apple', 'v1'))
+
+
+class APICacheTest(unittest.TestCase):
+
+    KEY = '1ZeOz9HFMJaS4GhZNAdr1Lb-326zVF0c7IG1RL9btlVI'
+    DRIVE = 'https://www.googleapis.com/drive/v2/files/' + KEY
+    SHEETS = 'https://sheets.googleapis.com/v4/spreadsheets/' + KEY
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _read(self):
+        http = CountingReplayHttp(CREDENTIALS_FILE)
+        api = hyou.api.API(
+            http, discovery=False,
+            cache=hyou.cache.DirectoryCache(self.path))
+        collection = hyou.collection.Collection(api)
+        spreadsheet = collection[self.KEY]
+        worksheet = spreadsheet['Sheet1']
+        self.assertEqual('WorksheetReadOnlyTest', spreadsheet.title)
+        self.assertEqual(
+            [['honoka', 'eri', 'kotori', 'umi', 'rin'],
+             ['maki', 'nozomi', 'hanayo', 'niko', '']],
+            list(worksheet.view()))
+        self.assertEqual(
+            [['nozomi', 'hanayo']],
+            list(worksheet.view(start_row=1, start_col=1, end_col=3)))
+        # The second view is served by the tile cache of the worksheet.
+        return http.uris
+
+    def test_cache(self):
+        self.assertEqual(
+            [self.DRIVE, self.SHEETS,
+             self.SHEETS + '/values/%27Sheet1%27%21A1%3AE2'],
+            self._read())
+        # Only the modification time is fetched the second time.
+        self.assertEqual([self.DRIVE], self._read())
+
+    def test_stale(self):
+        self._read()
+        cache = hyou.cache.DirectoryCache(self.path)
+        for name in os.listdir(self.path):
+            os.remove(os.path.join(self.path, name))
+        cache.put('spreadsheet:%s' % self.KEY, 'old', {})
+        self.assertEqual(3, len(self._read()))
@@ -14,6 +14,7 @@
 
 
 import unittest
+from unittest import mock
 
 import hyou.api
 import hyou.collection
@@ -80,6 +81,30 @@ class CollectionReadOnlyTest(unittest.TestCase):
             .key)
 
 
+class CollectionPaginationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = mock.Mock()
+        self.list_request = self.api.drive.files.return_value.list
+        self.list_request.return_value.execute.side_effect = [
+            {'items': [{'id': 'key1'}, {'id': 'key2'}],
+             'nextPageToken': 'token1'},
+            {'items': [{'id': 'key3'}]},
+        ]
+        self.collection = hyou.collection.Collection(self.api)
+
+    def test_pagination(self):
+        self.assertEqual(['key1', 'key2', 'key3'], self.collection.keys())
+        self.assertEqual(2, self.list_request.call_count)
+        self.assertNotIn('pageToken', self.list_request.call_args_list[0][1])
+        self.assertEqual(
+            'token1', self.list_request.call_args_list[1][1]['pageToken'])
+
+    def test_first_page_only(self):
+        self.assertEqual('key1', self.collection[0].key)
+        self.assertEqual(1, self.list_request.call_count)
+
+
 class CollectionReadWriteTest(unittest.TestCase):
 
     @classmethod
@@ -0,0 +1,658 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory stand-in for the Sheets v4 and Drive v2 endpoints used by hyou.
+
+Unlike `http_mocks.ReplayHttp`, `FakeServer` keeps state, so any access
+pattern works offline:
+
+    server = FakeServer(latency=0.05, reads_per_minute=300)
+    key = server.create_spreadsheet('Test', sheets=[('Sheet1', 10000, 26)])
+    collection = hyou.collection.Collection(
+        hyou.api.API(server, discovery=False))
+
+Field masks are ignored; full resources are always returned. Values are
+stored as written, without parsing numbers or evaluating formulas.
+"""
+
+import collections
+import copy
+import datetime
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from urllib import parse
+
+import httplib2
+
+SPREADSHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+
+_SHEETS_PREFIX = '/v4/spreadsheets'
+_DRIVE_PREFIX = '/drive/v2/files'
+_CELL_RE = re.compile(r'^([A-Z]*)(\d*)$')
+
+
+class FakeServerError(Exception):
+
+    def __init__(self, status, message, reason=None):
+        super(FakeServerError, self).__init__(message)
+        self.status = status
+        self.message = message
+        self.reason = reason
+
+
+def _parse_column(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def _format_column(index):
+    letters = []
+    while index >= 0:
+        letters.append(chr(ord('A') + index % 26))
+        index = index // 26 - 1
+    return ''.join(reversed(letters))
+
+
+def _unformat(value):
+    """Parse a cell value like USER_ENTERED for UNFORMATTED_VALUE."""
+    if value in ('TRUE', 'FALSE'):
+        return value == 'TRUE'
+    for value_type in (int, float):
+        try:
+            return value_type(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _split_a1(a1):
+    """Split A1 notation to (sheet title, cell range or None)."""
+    if a1.startswith('\''):
+        end = 1
+        while True:
+            end = a1.find('\'', end)
+            if end < 0:
+                raise FakeServerError(400, 'Unable to parse range: %s' % a1)
+            if a1[end + 1:end + 2] == '\'':
+                end += 2
+                continue
+            break
+        title = a1[1:end].replace('\'\'', '\'')
+        rest = a1[end + 1:]
+    else:
+        title, _, rest = a1.partition('!')
+        rest = '!' + rest if rest else ''
+    if not rest:
+        return title, None
+    if not rest.startswith('!'):
+        raise FakeServerError(400, 'Unable to parse range: %s' % a1)
+    return title, rest[1:]
+
+
+class _Sheet(object):
+
+    def __init__(self, sheet_id, title, rows, cols):
+        self.sheet_id = sheet_id
+        self.title = title
+        self.rows = rows
+        self.cols = cols
+        self.frozen_rows = 0
+        self.frozen_cols = 0
+        self.cells = {}
+
+    def properties(self, index):
+        grid = {'rowCount': self.rows, 'columnCount': self.cols}
+        if self.frozen_rows:
+            grid['frozenRowCount'] = self.frozen_rows
+        if self.frozen_cols:
+            grid['frozenColumnCount'] = self.frozen_cols
+        return {
+            'sheetId': self.sheet_id,
+            'title': self.title,
+            'index': index,
+            'sheetType': 'GRID',
+            'gridProperties': grid,
+        }
+
+    def resize(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        for row, col in list(self.cells):
+            if row >= rows or col >= cols:
+                del self.cells[(row, col)]
+
+    def parse_range(self, cell_range):
+        """Return (start_row, end_row, start_col, end_col) of a cell range."""
+        if cell_range is None:
+            return 0, self.rows, 0, self.cols
+        start, _, end = cell_range.partition(':')
+        start_match = _CELL_RE.match(start)
+        end_match = _CELL_RE.match(end or start)
+        if not (start_match and end_match):
+            raise FakeServerError(
+                400, 'Unable to parse range: %s' % cell_range)
+        start_col, start_row = start_match.groups()
+        end_col, end_row = end_match.groups()
+        bounds = (
+            int(start_row) - 1 if start_row else 0,
+            int(end_row) if end_row else self.rows,
+            _parse_column(start_col) if start_col else 0,
+            _parse_column(end_col) + 1 if end_col else self.cols,
+        )
+        if (bounds[0] < 0 or bounds[0] > bounds[1] or bounds[1] > self.rows or
+                bounds[2] > bounds[3] or bounds[3] > self.cols):
+            raise FakeServerError(
+                400, 'Range (%s!%s) exceeds grid limits. Max rows: %d, max '
+                'columns: %d' % (self.title, cell_range, self.rows,
+                                 self.cols))
+        return bounds
+
+    def format_range(self, bounds):
+        start_row, end_row, start_col, end_col = bounds
+        return '\'%s\'!%s%d:%s%d' % (
+            self.title.replace('\'', '\'\''), _format_column(start_col),
+            start_row + 1, _format_column(end_col - 1), end_row)
+
+    def value_range(self, bounds, query=None):
+        start_row, end_row, start_col, end_col = bounds
+        values = []
+        for row in range(start_row, end_row):
+            row_values = [
+                self.cells.get((row, col), '')
+                for col in range(start_col, end_col)]
+            while row_values and row_values[-1] == '':
+                row_values.pop()
+            if (query or {}).get('valueRenderOption') == [
+                    'UNFORMATTED_VALUE']:
+                row_values = [
+                    _unformat(value) if value else value
+                    for value in row_values]
+            values.append(row_values)
+        while values and not values[-1]:
+            values.pop()
+        value_range = {
+            'range': self.format_range(bounds),
+            'majorDimension': 'ROWS',
+        }
+        if values:
+            value_range['values'] = values
+        return value_range
+
+    def write(self, bounds, values):
+        start_row, end_row, start_col, _ = bounds
+        if len(values) > end_row - start_row:
+            raise FakeServerError(400, 'Too many rows for the range')
+        for i, row_values in enumerate(values):
+            for j, value in enumerate(row_values):
+                col = start_col + j
+                if col >= bounds[3]:
+                    raise FakeServerError(400, 'Too many columns for range')
+                if value is None:
+                    continue
+                if isinstance(value, bool):
+                    value = 'TRUE' if value else 'FALSE'
+                elif not isinstance(value, str):
+                    value = str(value)
+                if value == '':
+                    self.cells.pop((start_row + i, col), None)
+                else:
+                    self.cells[(start_row + i, col)] = value
+
+    def insert_rows(self, row, count):
+        self.rows += count
+        self.cells = {
+            (r + count if r >= row else r, c): value
+            for (r, c), value in self.cells.items()}
+
+    def clear(self, bounds):
+        start_row, end_row, start_col, end_col = bounds
+        for row, col in list(self.cells):
+            if start_row <= row < end_row and start_col <= col < end_col:
+                del self.cells[(row, col)]
+
+
+class _Spreadsheet(object):
+
+    def __init__(self, key, title):
+        self.key = key
+        self.title = title
+        self.sheets = []
+        self.modified_date = None
+        self.trashed = False
+
+    def find_sheet(self, title):
+        for sheet in self.sheets:
+            if sheet.title == title:
+                return sheet
+        raise FakeServerError(400, 'Unable to parse range: %s' % title)
+
+    def find_sheet_by_id(self, sheet_id):
+        for sheet in self.sheets:
+            if sheet.sheet_id == sheet_id:
+                return sheet
+        raise FakeServerError(400, 'No grid with id: %s' % sheet_id)
+
+    def entry(self, sheets=None):
+        sheets = self.sheets if sheets is None else sheets
+        return {
+            'spreadsheetId': self.key,
+            'properties': {'title': self.title},
+            'sheets': [
+                {'properties': sheet.properties(self.sheets.index(sheet))}
+                for sheet in sheets],
+            'spreadsheetUrl':
+                'https://docs.google.com/spreadsheets/d/%s/edit' % self.key,
+        }
+
+    def file(self):
+        return {
+            'id': self.key,
+            'title': self.title,
+            'mimeType': SPREADSHEET_MIME_TYPE,
+            'modifiedDate': self.modified_date,
+        }
+
+
+class FakeServer(object):
+    """
+    Stateful in-memory Sheets v4 and Drive v2 server.
+
+    An instance can be passed as the `http` argument of `hyou.api.API`, and
+    is safe to use from multiple threads.
+
+    Each request sleeps for `latency` seconds, or `latency(method, uri)`
+    seconds if it is callable. If `reads_per_minute` or `writes_per_minute`
+    is set, requests beyond the quota within a sliding minute fail with 429
+    like the real API. `clock` and `sleep` can be replaced to simulate time.
+    Drive file lists return up to `page_size` items per page.
+
+    `request_counts` counts requests by API method ID, including ones
+    rejected by quotas.
+    """
+
+    def __init__(self, latency=0, reads_per_minute=None,
+                 writes_per_minute=None, page_size=100, clock=time.monotonic,
+                 sleep=time.sleep):
+        self.latency = latency
+        self.quotas = {'read': reads_per_minute, 'write': writes_per_minute}
+        self.page_size = page_size
+        self.clock = clock
+        self.sleep = sleep
+        self.request_counts = collections.Counter()
+        self._spreadsheets = collections.OrderedDict()
+        self._quota_usage = {
+            'read': collections.deque(), 'write': collections.deque()}
+        self._next_sheet_id = itertools.count(1)
+        self._last_modified = None
+        self._lock = threading.Lock()
+
+    # Methods to set up and inspect the state in tests.
+
+    def create_spreadsheet(self, title, sheets=(('Sheet1', 1000, 26),),
+                           key=None):
+        """Create a spreadsheet and return its key."""
+        with self._lock:
+            spreadsheet = self._create_spreadsheet(title, key)
+            for sheet_title, rows, cols in sheets:
+                sheet = _Sheet(
+                    next(self._next_sheet_id) if spreadsheet.sheets else 0,
+                    sheet_title, rows, cols)
+                spreadsheet.sheets.append(sheet)
+            return spreadsheet.key
+
+    def set_values(self, key, title, values, start_row=0, start_col=0):
+        """Write a list of rows to a worksheet."""
+        with self._lock:
+            spreadsheet = self._get_spreadsheet(key)
+            sheet = spreadsheet.find_sheet(title)
+            sheet.write(
+                (start_row, sheet.rows, start_col, sheet.cols), values)
+            self._touch(spreadsheet)
+
+    def get_values(self, key, title):
+        """Return all values of a worksheet as a list of rows."""
+        with self._lock:
+            sheet = self._get_spreadsheet(key).find_sheet(title)
+            return sheet.value_range(
+                sheet.parse_range(None)).get('values', [])
+
+    # Http interface.
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                *args, **kwargs):
+        latency = self.latency(method, uri) if callable(
+            self.latency) else self.latency
+        if latency:
+            self.sleep(latency)
+        split = parse.urlsplit(uri)
+        query = parse.parse_qs(split.query)
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        body = json.loads(body) if body else {}
+        try:
+            with self._lock:
+                handler, args = self._route(method, split.path)
+                self.request_counts[
+                    handler.__name__[1:].replace('_', '.')] += 1
+                self._check_quota('read' if method == 'GET' else 'write')
+                response = handler(query, body, *args)
+        except FakeServerError as e:
+            return self._respond(e.status, {
+                'error': {
+                    'code': e.status,
+                    'message': e.message,
+                    'errors': [{
+                        'message': e.message,
+                        'domain': 'global',
+                        'reason': e.reason or 'badRequest',
+                    }],
+                },
+            })
+        return self._respond(200, response)
+
+    @staticmethod
+    def _respond(status, content):
+        headers = httplib2.Response({
+            'status': status, 'content-type': 'application/json'})
+        return headers, json.dumps(content).encode('utf-8')
+
+    def _route(self, method, path):
+        if path.startswith(_SHEETS_PREFIX + '/'):
+            rest = path[len(_SHEETS_PREFIX) + 1:]
+            key, sep, rest = rest.partition('/values')
+            if not sep:
+                key, _, action = key.partition(':')
+                if method == 'GET' and not action:
+                    return self._sheets_spreadsheets_get, (key,)
+                if method == 'POST' and action == 'batchUpdate':
+                    return self._sheets_spreadsheets_batchUpdate, (key,)
+            elif rest.startswith(':'):
+                action = rest[1:]
+                if method == 'GET' and action == 'batchGet':
+                    return self._sheets_spreadsheets_values_batchGet, (key,)
+                if method == 'POST' and action == 'batchUpdate':
+                    return (
+                        self._sheets_spreadsheets_values_batchUpdate, (key,))
+            elif rest.startswith('/'):
+                a1, _, action = rest[1:].partition(':')
+                a1 = parse.unquote(a1)
+                if method == 'GET' and not action:
+                    return self._sheets_spreadsheets_values_get, (key, a1)
+                if method == 'PUT' and not action:
+                    return self._sheets_spreadsheets_values_update, (key, a1)
+                if method == 'POST' and action == 'clear':
+                    return self._sheets_spreadsheets_values_clear, (key, a1)
+                if method == 'POST' and action == 'append':
+                    return self._sheets_spreadsheets_values_append, (key, a1)
+        elif path == _DRIVE_PREFIX:
+            if method == 'GET':
+                return self._drive_files_list, ()
+            if method == 'POST':
+                return self._drive_files_insert, ()
+        elif path.startswith(_DRIVE_PREFIX + '/') and method == 'GET':
+            return self._drive_files_get, (path[len(_DRIVE_PREFIX) + 1:],)
+        raise FakeServerError(404, 'Not found: %s %s' % (method, path))
+
+    def _check_quota(self, kind):
+        quota = self.quotas[kind]
+        if quota is None:
+            return
+        now = self.clock()
+        usage = self._quota_usage[kind]
+        while usage and usage[0] <= now - 60:
+            usage.popleft()
+        if len(usage) >= quota:
+            raise FakeServerError(
+                429, 'Quota exceeded for quota metric \'%s requests\'' % kind,
+                reason='rateLimitExceeded')
+        usage.append(now)
+
+    def _create_spreadsheet(self, title, key=None):
+        if key is None:
+            key = uuid.uuid4().hex
+        spreadsheet = _Spreadsheet(key, title)
+        self._spreadsheets[key] = spreadsheet
+        self._touch(spreadsheet)
+        return spreadsheet
+
+    def _get_spreadsheet(self, key):
+        spreadsheet = self._spreadsheets.get(key)
+        if spreadsheet is None or spreadsheet.trashed:
+            raise FakeServerError(
+                404, 'Requested entity was not found.', reason='notFound')
+        return spreadsheet
+
+    def _touch(self, spreadsheet):
+        # Keep modification times unique and increasing, like revisions.
+        now = datetime.datetime.utcnow()
+        if self._last_modified is not None and now <= self._last_modified:
+            now = self._last_modified + datetime.timedelta(milliseconds=1)
+        self._last_modified = now
+        spreadsheet.modified_date = '%s.%03dZ' % (
+            now.strftime('%Y-%m-%dT%H:%M:%S'), now.microsecond // 1000)
+
+    def _resolve(self, spreadsheet, a1):
+        title, cell_range = _split_a1(a1)
+        sheet = spreadsheet.find_sheet(title)
+        return sheet, sheet.parse_range(cell_range)
+
+    # Sheets v4 handlers.
+
+    def _sheets_spreadsheets_get(self, query, body, key):
+        spreadsheet = self._get_spreadsheet(key)
+        if 'ranges' not in query:
+            return spreadsheet.entry()
+        sheets = []
+        for a1 in query['ranges']:
+            sheet, _ = self._resolve(spreadsheet, a1)
+            if sheet not in sheets:
+                sheets.append(sheet)
+        return spreadsheet.entry(sheets)
+
+    def _sheets_spreadsheets_batchUpdate(self, query, body, key):
+        spreadsheet = self._get_spreadsheet(key)
+        # Requests are applied atomically.
+        updated = copy.deepcopy(spreadsheet)
+        replies = [
+            self._apply_request(updated, request)
+            for request in body.get('requests', [])]
+        self._spreadsheets[key] = spreadsheet = updated
+        self._touch(spreadsheet)
+        response = {'spreadsheetId': key, 'replies': replies}
+        if (body.get('includeSpreadsheetInResponse') or
+                body.get('include_spreadsheet_in_response')):
+            response['updatedSpreadsheet'] = spreadsheet.entry()
+        return response
+
+    def _apply_request(self, spreadsheet, request):
+        (method, params), = request.items()
+        if method == 'addSheet':
+            properties = params.get('properties', {})
+            grid = properties.get('gridProperties', {})
+            title = properties.get('title')
+            if title is None:
+                title = 'Sheet%d' % (len(spreadsheet.sheets) + 1)
+            if any(sheet.title == title for sheet in spreadsheet.sheets):
+                raise FakeServerError(
+                    400, 'A sheet with the name "%s" already exists.' % title)
+            sheet_id = properties.get('sheetId')
+            if sheet_id is None:
+                sheet_id = next(self._next_sheet_id)
+            elif any(sheet.sheet_id == sheet_id
+                     for sheet in spreadsheet.sheets):
+                raise FakeServerError(
+                    400, 'A sheet with the id %d already exists.' % sheet_id)
+            sheet = _Sheet(
+                sheet_id, title, grid.get('rowCount', 1000),
+                grid.get('columnCount', 26))
+            sheet.frozen_rows = grid.get('frozenRowCount', 0)
+            sheet.frozen_cols = grid.get('frozenColumnCount', 0)
+            spreadsheet.sheets.insert(
+                properties.get('index', len(spreadsheet.sheets)), sheet)
+            return {'addSheet': {'properties': sheet.properties(
+                spreadsheet.sheets.index(sheet))}}
+        if method == 'deleteSheet':
+            sheet = spreadsheet.find_sheet_by_id(params['sheetId'])
+            if len(spreadsheet.sheets) == 1:
+                raise FakeServerError(
+                    400, 'You can\'t remove all the sheets in a document.')
+            spreadsheet.sheets.remove(sheet)
+            return {}
+        if method == 'updateSheetProperties':
+            properties = params['properties']
+            sheet = spreadsheet.find_sheet_by_id(properties['sheetId'])
+            if 'title' in properties and properties['title'] != sheet.title:
+                if any(other.title == properties['title']
+                       for other in spreadsheet.sheets):
+                    raise FakeServerError(
+                        400, 'A sheet with the name "%s" already exists.' %
+                        properties['title'])
+                sheet.title = properties['title']
+            grid = properties.get('gridProperties', {})
+            sheet.resize(
+                grid.get('rowCount', sheet.rows),
+                grid.get('columnCount', sheet.cols))
+            sheet.frozen_rows = grid.get('frozenRowCount', sheet.frozen_rows)
+            sheet.frozen_cols = grid.get(
+                'frozenColumnCount', sheet.frozen_cols)
+            return {}
+        if method == 'updateSpreadsheetProperties':
+            spreadsheet.title = params['properties'].get(
+                'title', spreadsheet.title)
+            return {}
+        raise FakeServerError(400, 'Unsupported request: %s' % method)
+
+    def _sheets_spreadsheets_values_get(self, query, body, key, a1):
+        sheet, bounds = self._resolve(self._get_spreadsheet(key), a1)
+        return sheet.value_range(bounds, query)
+
+    def _sheets_spreadsheets_values_batchGet(self, query, body, key):
+        spreadsheet = self._get_spreadsheet(key)
+        return {
+            'spreadsheetId': key,
+            'valueRanges': [
+                sheet.value_range(bounds, query)
+                for sheet, bounds in (
+                    self._resolve(spreadsheet, a1)
+                    for a1 in query.get('ranges', []))],
+        }
+
+    def _sheets_spreadsheets_values_batchUpdate(self, query, body, key):
+        spreadsheet = self._get_spreadsheet(key)
+        writes = []
+        for value_range in body.get('data', []):
+            if value_range.get('majorDimension', 'ROWS') != 'ROWS':
+                raise FakeServerError(400, 'Only ROWS is supported')
+            sheet, bounds = self._resolve(spreadsheet, value_range['range'])
+            writes.append((sheet, bounds, value_range.get('values', [])))
+        updated_cells = 0
+        for sheet, bounds, values in writes:
+            sheet.write(bounds, values)
+            updated_cells += sum(len(row) for row in values)
+        self._touch(spreadsheet)
+        return {
+            'spreadsheetId': key,
+            'totalUpdatedCells': updated_cells,
+        }
+
+    def _sheets_spreadsheets_values_append(self, query, body, key, a1):
+        spreadsheet = self._get_spreadsheet(key)
+        sheet, bounds = self._resolve(spreadsheet, a1)
+        if body.get('majorDimension', 'ROWS') != 'ROWS':
+            raise FakeServerError(400, 'Only ROWS is supported')
+        values = body.get('values', [])
+        start_row, end_row, start_col, end_col = bounds
+        # The table is assumed to extend to the last non-empty row.
+        table_end = max(
+            [row + 1 for row, col in sheet.cells
+             if start_row <= row < end_row and start_col <= col < end_col],
+            default=start_row)
+        new_bounds = (
+            table_end, table_end + len(values), start_col,
+            start_col + max([len(row) for row in values], default=0))
+        option = query.get('insertDataOption', ['OVERWRITE'])[0]
+        if option == 'INSERT_ROWS':
+            sheet.insert_rows(table_end, len(values))
+        elif new_bounds[1] > sheet.rows:
+            sheet.resize(new_bounds[1], sheet.cols)
+        if new_bounds[3] > sheet.cols:
+            raise FakeServerError(400, 'Too many columns for range')
+        sheet.write(new_bounds, values)
+        self._touch(spreadsheet)
+        return {
+            'spreadsheetId': key,
+            'tableRange': sheet.format_range(
+                (start_row, table_end, start_col, end_col)),
+            'updates': {
+                'spreadsheetId': key,
+                'updatedRange': sheet.format_range(new_bounds),
+                'updatedRows': len(values),
+                'updatedColumns': new_bounds[3] - new_bounds[2],
+                'updatedCells': sum(len(row) for row in values),
+            },
+        }
+
+    def _sheets_spreadsheets_values_update(self, query, body, key, a1):
+        spreadsheet = self._get_spreadsheet(key)
+        if body.get('majorDimension', 'ROWS') != 'ROWS':
+            raise FakeServerError(400, 'Only ROWS is supported')
+        sheet, bounds = self._resolve(spreadsheet, a1)
+        values = body.get('values', [])
+        sheet.write(bounds, values)
+        self._touch(spreadsheet)
+        return {
+            'spreadsheetId': key,
+            'updatedRange': sheet.format_range(bounds),
+            'updatedCells': sum(len(row) for row in values),
+        }
+
+    def _sheets_spreadsheets_values_clear(self, query, body, key, a1):
+        spreadsheet = self._get_spreadsheet(key)
+        sheet, bounds = self._resolve(spreadsheet, a1)
+        sheet.clear(bounds)
+        self._touch(spreadsheet)
+        return {'spreadsheetId': key, 'clearedRange': sheet.format_range(
+            bounds)}
+
+    # Drive v2 handlers.
+
+    def _drive_files_list(self, query, body):
+        files = [
+            spreadsheet.file()
+            for spreadsheet in self._spreadsheets.values()
+            if not spreadsheet.trashed]
+        max_results = min(
+            int(query.get('maxResults', ['100'])[0]), self.page_size)
+        start = int(query.get('pageToken', ['0'])[0])
+        response = {'items': files[start:start + max_results]}
+        if start + max_results < len(files):
+            response['nextPageToken'] = str(start + max_results)
+        return response
+
+    def _drive_files_insert(self, query, body):
+        if body.get('mimeType') != SPREADSHEET_MIME_TYPE:
+            raise FakeServerError(400, 'Only spreadsheets are supported')
+        spreadsheet = self._create_spreadsheet(
+            body.get('title', 'Untitled spreadsheet'))
+        spreadsheet.sheets.append(_Sheet(0, 'Sheet1', 1000, 26))
+        return spreadsheet.file()
+
+    def _drive_files_get(self, query, body, key):
+        return self._get_spreadsheet(key).file()
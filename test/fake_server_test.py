@@ -0,0 +1,183 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+import unittest
+from unittest import mock
+
+import googleapiclient.errors
+
+import hyou.api
+import hyou.collection
+
+from . import fake_server
+
+
+class FakeServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.collection = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))
+
+    def test_create_spreadsheet(self):
+        spreadsheet = self.collection.create_spreadsheet(
+            'Book', rows=5, cols=4)
+        self.assertEqual('Book', spreadsheet.title)
+        self.assertEqual(['Sheet1'], spreadsheet.keys())
+        self.assertEqual((5, 4), (spreadsheet[0].rows, spreadsheet[0].cols))
+        self.assertEqual([spreadsheet.key], self.collection.keys())
+
+    def test_values(self):
+        key = self.server.create_spreadsheet('Book', [('Sheet1', 4, 3)])
+        self.server.set_values(key, 'Sheet1', [['a', 'b'], ['c']])
+        worksheet = self.collection[key]['Sheet1']
+        view = worksheet.view(start_row=1)
+        self.assertEqual([['c', '', ''], ['', '', ''], ['', '', '']], view)
+        view[2][2] = 'd'
+        view[0][0] = ''
+        view.commit()
+        self.assertEqual(
+            [['a', 'b'], [], [], ['', '', 'd']],
+            self.server.get_values(key, 'Sheet1'))
+        self.assertEqual(
+            [['a', 'b', ''], ['', '', ''], ['', '', ''], ['', '', 'd']],
+            list(worksheet.iter_rows(chunk_rows=3)))
+        worksheet.view(end_row=1).clear()
+        self.assertEqual(
+            [[], [], [], ['', '', 'd']],
+            self.server.get_values(key, 'Sheet1'))
+
+    def test_clear_range(self):
+        key = self.server.create_spreadsheet('Book', [('Sheet1', 4, 4)])
+        self.server.set_values(
+            key, 'Sheet1', [['%d:%d' % (i, j) for j in range(4)]
+                            for i in range(4)])
+        worksheet = self.collection[key]['Sheet1']
+        # Cells next to the view are left intact.
+        worksheet.view(start_row=1, end_row=3, start_col=1, end_col=3).clear()
+        self.assertEqual(
+            [['0:0', '0:1', '0:2', '0:3'],
+             ['1:0', '', '', '1:3'],
+             ['2:0', '', '', '2:3'],
+             ['3:0', '3:1', '3:2', '3:3']],
+            self.server.get_values(key, 'Sheet1'))
+        # A view of the whole worksheet does not exceed the grid.
+        worksheet.view().clear()
+        self.assertEqual([], self.server.get_values(key, 'Sheet1'))
+
+    def test_bool_values(self):
+        key = self.server.create_spreadsheet('Book', [('Sheet1', 1, 3)])
+        worksheet = self.collection[key]['Sheet1']
+        view = worksheet.view()
+        view[0] = [True, False, 1]
+        view.commit()
+        self.assertEqual(
+            [['TRUE', 'FALSE', '1']], self.server.get_values(key, 'Sheet1'))
+        view = worksheet.view(
+            fetch_params={'valueRenderOption': 'UNFORMATTED_VALUE'},
+            use_tile_cache=False)
+        self.assertEqual([True, False, 1], list(view[0]))
+
+    def test_structure(self):
+        key = self.server.create_spreadsheet('Book')
+        spreadsheet = self.collection[key]
+        with spreadsheet.batch():
+            spreadsheet.add_worksheet('Data', rows=3, cols=3)
+            spreadsheet['Data'].frozen_rows = 1
+            spreadsheet.delete_worksheet('Sheet1')
+            spreadsheet.title = 'New Book'
+        self.assertEqual(
+            1, self.server.request_counts['sheets.spreadsheets.batchUpdate'])
+        spreadsheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[key]
+        self.assertEqual('New Book', spreadsheet.title)
+        self.assertEqual(['Data'], spreadsheet.keys())
+        self.assertEqual(1, spreadsheet['Data'].frozen_rows)
+        with self.assertRaises(googleapiclient.errors.HttpError):
+            spreadsheet.add_worksheet('Data')
+
+    def test_pagination(self):
+        self.server.page_size = 2
+        keys = [
+            self.server.create_spreadsheet('Book %d' % i) for i in range(5)]
+        self.assertEqual(keys, self.collection.keys())
+        self.assertEqual(3, self.server.request_counts['drive.files.list'])
+
+    def test_not_found(self):
+        with self.assertRaises(googleapiclient.errors.HttpError) as cm:
+            self.collection['missing'].title
+        self.assertEqual(404, cm.exception.resp.status)
+
+    def test_modified_date(self):
+        key = self.server.create_spreadsheet('Book')
+        spreadsheet = self.collection[key]
+        updated = spreadsheet.updated
+        view = spreadsheet['Sheet1'].view(end_row=1, end_col=1)
+        view[0][0] = 'a'
+        view.commit()
+        self.assertGreater(spreadsheet.updated, updated)
+
+
+class FakeServerQuotaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.server = fake_server.FakeServer(
+            reads_per_minute=3, clock=lambda: self.now)
+        self.key = self.server.create_spreadsheet('Book')
+        self.collection = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def test_quota(self):
+        with mock.patch('time.sleep', side_effect=self.advance) as sleep:
+            worksheet = self.collection[self.key]['Sheet1']
+            for i in range(3):
+                worksheet.view(start_row=i, end_row=i + 1)[0][0]
+        self.assertTrue(sleep.called)
+        self.assertGreaterEqual(self.now, 60)
+        # Rejected requests are counted too.
+        self.assertGreater(
+            self.server.request_counts['sheets.spreadsheets.values.get'], 3)
+
+
+class FakeServerConcurrencyTest(unittest.TestCase):
+
+    def test_concurrent_requests(self):
+        num_threads = 4
+        barrier = threading.Barrier(num_threads, timeout=10)
+
+        def latency(method, uri):
+            # Blocks until all threads are in a values request at once.
+            return 1 if '/values/' in uri else 0
+
+        def sleep(seconds):
+            barrier.wait()
+
+        server = fake_server.FakeServer(latency=latency, sleep=sleep)
+        key = server.create_spreadsheet('Book', [('Sheet1', 100, 5)])
+        server.set_values(
+            key, 'Sheet1', [['r%d' % i] for i in range(100)])
+        worksheet = hyou.collection.Collection(
+            hyou.api.API(server, discovery=False))[key]['Sheet1']
+        views = [
+            worksheet.view(start_row=i * 25, end_row=(i + 1) * 25)
+            for i in range(num_threads)]
+        with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
+            firsts = list(executor.map(lambda view: view[0][0], views))
+        self.assertEqual(['r0', 'r25', 'r50', 'r75'], firsts)
@@ -0,0 +1,132 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+
+import pytest
+
+import hyou.api
+import hyou.collection
+import hyou.storage
+import hyou.typed
+
+from . import fake_server
+
+VALUES = [
+    ['name', 'age', 'member'],
+    ['honoka', '16', 'TRUE', 'x'],
+    ['maki', '', 'FALSE'],
+    ['nozomi', '17.5'],
+]
+
+
+class FrameTestBase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet(
+            'Book', [('Sheet1', 4, 4)])
+        self.server.set_values(self.key, 'Sheet1', VALUES)
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]['Sheet1']
+
+
+class PandasTest(FrameTestBase):
+
+    def setUp(self):
+        self.pandas = pytest.importorskip('pandas')
+        super(PandasTest, self).setUp()
+
+    def test_to_pandas(self):
+        df = self.worksheet.view(
+            storage=hyou.storage.ColumnarStorage).to_pandas(header=True)
+        self.assertEqual(['name', 'age', 'member', 'D'], list(df.columns))
+        self.assertEqual(['honoka', 'maki', 'nozomi'], list(df['name']))
+        self.assertEqual(16.0, df['age'][0])
+        self.assertTrue(math.isnan(df['age'][1]))
+        self.assertEqual(17.5, df['age'][2])
+        self.assertEqual([True, False], list(df['member'][:2]))
+        self.assertEqual(['x', '', ''], list(df['D']))
+
+    def test_to_pandas_typed(self):
+        view = self.worksheet.view(
+            start_row=1, fetch_params=hyou.typed.TypedValues())
+        df = view.to_pandas()
+        # Booleans of unformatted values are not converted to numbers.
+        self.assertEqual([True, False], list(df['C'][:2]))
+        self.assertIs(True, df['C'][0])
+        self.assertTrue(math.isnan(df['C'][2]))
+        self.assertEqual('float64', df['B'].dtype.name)
+        df = self.worksheet.view(
+            start_row=1, end_row=3,
+            fetch_params=hyou.typed.TypedValues()).to_pandas()
+        self.assertEqual('bool', df['C'].dtype.name)
+
+    def test_to_pandas_raw(self):
+        df = self.worksheet.view(start_row=1).to_pandas(infer_dtypes=False)
+        self.assertEqual(['A', 'B', 'C', 'D'], list(df.columns))
+        self.assertEqual(['16', '', '17.5'], list(df['B']))
+
+    def test_write_frame(self):
+        df = self.pandas.DataFrame({
+            'a': [1, 2, None],
+            'b': ['x', None, 'z'],
+            'c': [True, False, True],
+        })
+        self.worksheet.write_frame(df, start_row=2, start_col=2)
+        self.assertEqual((6, 5), (self.worksheet.rows, self.worksheet.cols))
+        self.assertEqual(
+            1, self.server.request_counts['sheets.spreadsheets.values.update'])
+        self.assertEqual(
+            VALUES[:2] + [
+                ['maki', '', 'a', 'b', 'c'],
+                ['nozomi', '17.5', '1.0', 'x', 'TRUE'],
+                ['', '', '2.0', '', 'FALSE'],
+                ['', '', '', 'z', 'TRUE']],
+            self.server.get_values(self.key, 'Sheet1'))
+
+
+class ArrowTest(FrameTestBase):
+
+    def setUp(self):
+        self.pyarrow = pytest.importorskip('pyarrow')
+        super(ArrowTest, self).setUp()
+
+    def test_to_arrow(self):
+        table = self.worksheet.view().to_arrow(header=True)
+        self.assertEqual(['name', 'age', 'member', 'D'], table.column_names)
+        self.assertEqual(self.pyarrow.float64(), table['age'].type)
+        self.assertEqual(
+            {
+                'name': ['honoka', 'maki', 'nozomi'],
+                'age': [16.0, None, 17.5],
+                'member': [True, False, None],
+                'D': ['x', '', ''],
+            },
+            table.to_pydict())
+
+    def test_to_arrow_typed(self):
+        table = self.worksheet.view(
+            start_row=1, fetch_params=hyou.typed.TypedValues()).to_arrow()
+        self.assertEqual(self.pyarrow.bool_(), table['C'].type)
+        self.assertEqual([True, False, None], table['C'].to_pylist())
+
+    def test_write_frame(self):
+        table = self.pyarrow.table({'n': [1, None], 's': ['a', 'b']})
+        self.worksheet.write_frame(table, start_row=1, header=False)
+        self.assertEqual(
+            [VALUES[0], ['1', 'a', 'TRUE', 'x'], ['', 'b', 'FALSE'],
+             VALUES[3]],
+            self.server.get_values(self.key, 'Sheet1'))
@@ -0,0 +1,115 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import httplib2
+
+import hyou.api
+import hyou.collection
+import hyou.instrumentation
+
+from . import http_mocks
+
+CREDENTIALS_FILE = 'unittest-sheets.json'
+KEY = '1ZeOz9HFMJaS4GhZNAdr1Lb-326zVF0c7IG1RL9btlVI'
+
+
+class FlakyHttp(http_mocks.ReplayHttp):
+    """ReplayHttp which fails the first `failures` requests with 503."""
+
+    def __init__(self, json_name, failures):
+        super(FlakyHttp, self).__init__(json_name)
+        self.failures = failures
+
+    def request(self, uri, method='GET', body=None, *args, **kwargs):
+        if self.failures > 0:
+            self.failures -= 1
+            return httplib2.Response({'status': 503}), b'unavailable'
+        return super(FlakyHttp, self).request(
+            uri, method, body, *args, **kwargs)
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.events = []
+
+    def read(self, http):
+        api = hyou.api.API(http, discovery=False)
+        api.add_listener(self.events.append)
+        collection = hyou.collection.Collection(api)
+        view = collection[KEY]['Sheet1'].view()
+        self.assertEqual('honoka', view[0][0])
+        return api
+
+    def test_events(self):
+        api = self.read(http_mocks.ReplayHttp(CREDENTIALS_FILE))
+        self.assertEqual(
+            [('sheets.spreadsheets.get', 'get_entry'),
+             ('sheets.spreadsheets.values.get',
+              'View._ensure_cells_fetched')],
+            [(event.method, event.operation) for event in self.events])
+        for event in self.events:
+            self.assertEqual('GET', event.http_method)
+            self.assertEqual(KEY, event.spreadsheet_key)
+            self.assertEqual(200, event.status)
+            self.assertGreater(event.response_bytes, 0)
+            self.assertGreaterEqual(event.latency, event.decode_time)
+            self.assertEqual(0, event.retries)
+            self.assertIsNone(event.error)
+        total = api.metrics.total()
+        self.assertEqual(2, total['requests'])
+        self.assertEqual(0, total['errors'])
+        self.assertEqual(
+            sum(event.response_bytes for event in self.events),
+            total['response_bytes'])
+
+    def test_retry(self):
+        api = self.read(FlakyHttp(CREDENTIALS_FILE, 2))
+        self.assertEqual(
+            [(503, 0), (503, 1), (200, 2), (200, 0)],
+            [(event.status, event.retries) for event in self.events])
+        self.assertEqual(
+            len('unavailable'), self.events[0].response_bytes)
+        self.assertIsNotNone(self.events[0].error)
+        sleeps = [call[0][0] for call in self.sleep.call_args_list]
+        self.assertEqual(
+            [0.0] + sleeps + [0.0],
+            [event.backoff_time for event in self.events])
+        counters = api.metrics.snapshot()['sheets.spreadsheets.get']
+        self.assertEqual(3, counters['requests'])
+        self.assertEqual(2, counters['errors'])
+        self.assertEqual(2, counters['retries'])
+        self.assertAlmostEqual(sum(sleeps), counters['backoff_time'])
+
+    def test_failing_listener(self):
+        api = hyou.api.API(
+            http_mocks.ReplayHttp(CREDENTIALS_FILE), discovery=False)
+        listener = mock.Mock(side_effect=ValueError())
+        api.add_listener(listener)
+        with self.assertLogs('hyou.api'):
+            self.assertEqual(
+                'WorksheetReadOnlyTest',
+                hyou.collection.Collection(api)[KEY].title)
+        self.assertTrue(listener.called)
+        api.remove_listener(listener)
+        api.metrics.reset()
+        hyou.collection.Collection(api)[KEY].title
+        self.assertEqual(1, listener.call_count)
+        self.assertEqual(1, api.metrics.total()['requests'])
@@ -0,0 +1,145 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import hyou.api
+import hyou.collection
+import hyou.ratelimit
+from hyou.ratelimit import READ, WRITE
+
+from . import http_mocks
+
+CREDENTIALS_FILE = 'unittest-sheets.json'
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch('hyou.ratelimit.time')
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.time.monotonic.side_effect = lambda: self.now
+        self.time.time.side_effect = lambda: self.now
+
+    def assert_waits(self, limiter, kind, expected):
+        self.time.sleep.reset_mock()
+        limiter.acquire(kind)
+        if expected:
+            self.time.sleep.assert_called_once_with(expected)
+        else:
+            self.assertFalse(self.time.sleep.called)
+
+    def test_burst(self):
+        limiter = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=None, burst=2)
+        self.assert_waits(limiter, READ, 0)
+        self.assert_waits(limiter, READ, 0)
+        self.assert_waits(limiter, READ, 1.0)
+        self.now += 0.5
+        self.assert_waits(limiter, READ, 1.5)
+        self.now += 10
+        self.assert_waits(limiter, READ, 0)
+
+    def send(self, limiter, count, interval=0.0):
+        """Acquire `count` times, sleeping on the mocked clock."""
+        def sleep(seconds):
+            self.now += seconds
+
+        self.time.sleep.side_effect = sleep
+        times = []
+        for _ in range(count):
+            limiter.acquire(READ)
+            times.append(self.now)
+            self.now += interval
+        return times
+
+    def assert_within_quota(self, times, quota):
+        # Like the server, windows are (t - 60, t].
+        for i in range(len(times) - quota):
+            self.assertGreater(times[i + quota] - times[i], 60.0)
+
+    def test_window(self):
+        limiter = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=None)
+        times = self.send(limiter, 200)
+        self.assert_within_quota(times, 60)
+        # A whole quota is available on a cold start.
+        self.assertEqual([1000.0] * 60, times[:60])
+        times = self.send(limiter, 200, interval=0.3)
+        self.assert_within_quota(times, 60)
+
+    def test_window_burst(self):
+        limiter = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=300, burst=5)
+        times = self.send(limiter, 200, interval=0.1)
+        self.assert_within_quota(times, 60)
+        # The first `burst` requests are not delayed.
+        self.assertAlmostEqual(1000.4, times[4])
+        self.assertGreater(times[5], 1000.5)
+
+    def test_read_write(self):
+        limiter = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=None, burst=1)
+        self.assert_waits(limiter, READ, 0)
+        self.assert_waits(limiter, WRITE, 0)
+        self.assert_waits(limiter, WRITE, 1.0)
+
+    def test_project(self):
+        limiter = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=30, burst=1)
+        self.assert_waits(limiter, READ, 0)
+        self.assert_waits(limiter, READ, 2.0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            hyou.ratelimit.RateLimiter(user_per_minute=0)
+
+    def test_shared(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        state_path = os.path.join(path, 'quota')
+        limiter1 = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=None, burst=1,
+            path=state_path)
+        limiter2 = hyou.ratelimit.RateLimiter(
+            user_per_minute=60, project_per_minute=None, burst=1,
+            path=state_path)
+        self.assert_waits(limiter1, READ, 0)
+        self.assert_waits(limiter2, READ, 1.0)
+        self.now += 5
+        self.assert_waits(limiter2, READ, 0)
+        self.assert_waits(limiter1, READ, 1.0)
+
+
+class APIRateLimiterTest(unittest.TestCase):
+
+    def test_api(self):
+        limiter = mock.Mock()
+        api = hyou.api.API(
+            http_mocks.ReplayHttp(CREDENTIALS_FILE), discovery=False,
+            rate_limiter=limiter)
+        collection = hyou.collection.Collection(api)
+        spreadsheet = collection[
+            '1ZeOz9HFMJaS4GhZNAdr1Lb-326zVF0c7IG1RL9btlVI']
+        self.assertEqual('WorksheetReadOnlyTest', spreadsheet.title)
+        limiter.acquire.assert_called_once_with(READ)
+        # Drive requests are not limited.
+        spreadsheet.updated
+        limiter.acquire.assert_called_once_with(READ)
@@ -23,6 +23,7 @@ import pytest
 
 import hyou.api
 import hyou.collection
+import hyou.spreadsheet
 
 from . import http_mocks
 
@@ -137,6 +138,136 @@ class RetrySpreadsheetReadOnlyTest(RetryTestBase, SpreadsheetReadOnlyTest):
         self.error_http.max_sleep = original_max_sleep
 
 
+class FetchViewsTest(SpreadsheetTestBase):
+
+    def setUp(self):
+        self.collection = hyou.collection.Collection(self.api)
+        self.spreadsheet = self.collection[
+            '1ZeOz9HFMJaS4GhZNAdr1Lb-326zVF0c7IG1RL9btlVI']
+        self.worksheet1 = self.spreadsheet['Sheet1']
+
+    def test_fetch_views(self):
+        view_all = self.worksheet1.view()
+        view_part = self.worksheet1.view(start_row=1, start_col=1, end_col=3)
+        view_unformatted = self.worksheet1.view(
+            end_row=1,
+            fetch_params={'valueRenderOption': 'UNFORMATTED_VALUE'})
+        self.spreadsheet.fetch_views([view_all, view_part, view_unformatted])
+        # No more requests are issued.
+        with mock.patch.object(
+                hyou.api.API, 'sheets', new_callable=mock.PropertyMock) as (
+                    sheets):
+            self.assertEqual(
+                [['honoka', 'eri', 'kotori', 'umi', 'rin'],
+                 ['maki', 'nozomi', 'hanayo', 'niko', '']],
+                list(view_all))
+            self.assertEqual([['nozomi', 'hanayo']], list(view_part))
+            self.assertEqual(
+                [['honoka', 'eri', 'kotori', 'umi', 'rin']],
+                list(view_unformatted))
+            # Fetched views are skipped.
+            self.spreadsheet.fetch_views([view_all])
+            self.assertFalse(sheets.called)
+
+    def test_fetch_views_other_spreadsheet(self):
+        other = self.collection['11NoixDrkf3GIFaJTbWYccHuNIkgtxIqeyf-oOSBttPA']
+        with self.assertRaises(ValueError):
+            self.spreadsheet.fetch_views([other['Sheet1'].view()])
+
+
+class RetryFetchViewsTest(RetryTestBase, FetchViewsTest):
+    """Same tests as above, but involving retries on server errors."""
+
+    def setUp(self):
+        super(RetryFetchViewsTest, self).setUp()
+        self.error_http.sleep_mock.reset_mock()
+
+
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sheets = mock.MagicMock()
+        patcher = mock.patch.object(
+            hyou.api.API, 'sheets', new_callable=mock.PropertyMock,
+            return_value=self.sheets)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.api = hyou.api.API(mock.Mock(), discovery=False)
+        self.entry = {
+            'spreadsheetId': 'abc',
+            'properties': {'title': 'Book'},
+            'sheets': [{
+                'properties': {
+                    'sheetId': 0, 'title': 'Sheet1', 'index': 0,
+                    'sheetType': 'GRID',
+                    'gridProperties': {'rowCount': 10, 'columnCount': 5},
+                },
+            }],
+        }
+        self.spreadsheet = hyou.spreadsheet.Spreadsheet(
+            self.api, 'abc', self.entry)
+        self.batch_update = (
+            self.sheets.spreadsheets.return_value.batchUpdate)
+        self.batch_update.return_value.execute.return_value = {
+            'updatedSpreadsheet': self.entry}
+
+    def test_batch(self):
+        with self.spreadsheet.batch():
+            self.spreadsheet.title = 'New Book'
+            worksheet = self.spreadsheet.add_worksheet('Sheet2', 3, 4)
+            worksheet.set_frozen_size(1, 0)
+            worksheet.title = 'Sheet3'
+            self.spreadsheet['Sheet1'].rows = 20
+            with self.spreadsheet.batch():
+                self.spreadsheet.delete_worksheet('Sheet1')
+            self.assertEqual('New Book', self.spreadsheet.title)
+            self.assertEqual(['Sheet3'], self.spreadsheet.keys())
+            self.assertEqual(
+                (3, 4, 1),
+                (worksheet.rows, worksheet.cols, worksheet.frozen_rows))
+            self.assertFalse(self.batch_update.called)
+        self.assertEqual(1, self.batch_update.call_count)
+        requests = self.batch_update.call_args[1]['body']['requests']
+        self.assertEqual(
+            ['updateSpreadsheetProperties', 'addSheet',
+             'updateSheetProperties', 'updateSheetProperties',
+             'updateSheetProperties', 'deleteSheet'],
+            [list(request)[0] for request in requests])
+        sheet_id = requests[1]['addSheet']['properties']['sheetId']
+        self.assertEqual(worksheet.key, sheet_id)
+        self.assertEqual(
+            sheet_id, requests[2]['updateSheetProperties']['properties'][
+                'sheetId'])
+        # The spreadsheet is refreshed with the response.
+        self.assertEqual('Book', self.spreadsheet.title)
+
+    def test_batch_empty(self):
+        with self.spreadsheet.batch():
+            pass
+        self.assertFalse(self.batch_update.called)
+
+    def test_batch_error(self):
+        get = self.sheets.spreadsheets.return_value.get
+        get.return_value.execute.return_value = self.entry
+        with self.assertRaises(RuntimeError):
+            with self.spreadsheet.batch():
+                self.spreadsheet.title = 'New Book'
+                raise RuntimeError()
+        self.assertFalse(self.batch_update.called)
+        self.assertFalse(get.called)
+        self.assertEqual('Book', self.spreadsheet.title)
+        self.assertTrue(get.called)
+
+    def test_batch_raw_requests(self):
+        with self.spreadsheet.batch():
+            self.spreadsheet.make_batch_request([{'addBanding': {}}])
+            self.spreadsheet.title = 'New Book'
+        requests = self.batch_update.call_args[1]['body']['requests']
+        self.assertEqual(
+            ['addBanding', 'updateSpreadsheetProperties'],
+            [list(request)[0] for request in requests])
+
+
 class SpreadsheetReadWriteTest(SpreadsheetTestBase):
 
     def setUp(self):
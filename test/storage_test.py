@@ -0,0 +1,74 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import hyou.storage
+
+
+class DictStorageTest(unittest.TestCase):
+
+    storage_class = hyou.storage.DictStorage
+
+    def setUp(self):
+        # Rows 10-13, columns 2-5.
+        self.storage = self.storage_class(10, 14, 2, 6)
+
+    def test_empty(self):
+        self.assertIsNone(self.storage.get(10, 2))
+        self.assertEqual('', self.storage.get(13, 5, ''))
+        self.assertEqual(['', '', '', ''], self.storage.get_row(11, 2, 6, ''))
+
+    def test_load(self):
+        self.storage.load([['a', 'b'], [], ['c', 'd', 'e', 'f']])
+        self.assertEqual('a', self.storage.get(10, 2))
+        self.assertEqual('b', self.storage.get(10, 3))
+        self.assertIsNone(self.storage.get(10, 4))
+        self.assertIsNone(self.storage.get(11, 2))
+        self.assertEqual('f', self.storage.get(12, 5))
+        self.assertIsNone(self.storage.get(13, 2))
+        self.assertEqual(
+            ['a', 'b', '', ''], self.storage.get_row(10, 2, 6, ''))
+        self.assertEqual(['d', 'e'], self.storage.get_row(12, 3, 5, ''))
+
+    def test_load_replaces(self):
+        self.storage.set(13, 5, 'x')
+        self.storage.load([['a']])
+        self.assertEqual('a', self.storage.get(10, 2))
+        self.assertIsNone(self.storage.get(13, 5))
+
+    def test_set(self):
+        self.storage.set(12, 4, 28)
+        self.assertEqual(28, self.storage.get(12, 4))
+        self.assertEqual(['', '', 28, ''], self.storage.get_row(12, 2, 6, ''))
+
+    def test_get_columns(self):
+        self.storage.load([['a', 'b'], [], ['c', 'd', 'e']])
+        self.storage.set(13, 3, 'x')
+        self.assertEqual(
+            [['a', '', 'c', ''], ['b', '', 'd', 'x'], ['', '', 'e', ''],
+             ['', '', '', '']],
+            self.storage.get_columns(''))
+
+    def test_clear(self):
+        self.storage.load([['a']])
+        self.storage.set(11, 3, 'b')
+        self.storage.clear()
+        self.assertIsNone(self.storage.get(10, 2))
+        self.assertIsNone(self.storage.get(11, 3))
+
+
+class ColumnarStorageTest(DictStorageTest):
+
+    storage_class = hyou.storage.ColumnarStorage
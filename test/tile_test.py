@@ -0,0 +1,252 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import googleapiclient.errors
+
+import hyou.api
+import hyou.collection
+import hyou.tile
+
+from . import fake_server
+
+
+class TileCacheTest(unittest.TestCase):
+
+    def test_tile_bounds(self):
+        self.assertEqual(
+            (10, 20, 4, 8), hyou.tile.tile_bounds(15, 5, (10, 4), 100, 26))
+        self.assertEqual(
+            (90, 95, 24, 26), hyou.tile.tile_bounds(94, 25, (10, 4), 95, 26))
+
+    def test_lru(self):
+        cache = hyou.tile.TileCache(max_cells=8)
+        cache.put(('', (0, 2, 0, 2)), [['a']])
+        cache.put(('', (2, 4, 0, 2)), [['b']])
+        self.assertEqual([['a']], cache.get(('', (0, 2, 0, 2))))
+        cache.put(('', (4, 6, 0, 2)), [['c']])
+        self.assertEqual(8, cache.cells)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get(('', (2, 4, 0, 2))))
+        self.assertEqual([['a']], cache.get(('', (0, 2, 0, 2))))
+
+    def test_max_bytes(self):
+        cache = hyou.tile.TileCache(max_cells=None, max_bytes=1000)
+        cache.put(('', (0, 1, 0, 1)), [['x' * 400]])
+        cache.put(('', (1, 2, 0, 1)), [['y' * 400]])
+        self.assertEqual(1, len(cache))
+        self.assertLessEqual(cache.bytes, 1000)
+        self.assertIsNotNone(cache.get(('', (1, 2, 0, 1))))
+
+    def test_bytes_not_estimated(self):
+        cache = hyou.tile.TileCache()
+        with mock.patch('hyou.tile._estimate_bytes') as estimate_bytes:
+            cache.put(('', (0, 1, 0, 1)), [['x']])
+        self.assertFalse(estimate_bytes.called)
+        self.assertEqual(0, cache.bytes)
+        cache = hyou.tile.TileCache(max_cells=1, max_bytes=1000)
+        with mock.patch('hyou.tile._estimate_bytes') as estimate_bytes:
+            cache.put(('', (0, 2, 0, 1)), [['x'], ['y']])
+        self.assertFalse(estimate_bytes.called)
+        self.assertEqual(0, len(cache))
+
+    def test_contained(self):
+        cache = hyou.tile.TileCache()
+        cache.put(('', (2, 5, 1, 4)), [['a', 'b', 'c'], [], ['d', 'e']])
+        self.assertEqual([[], ['e']], cache.get(('', (3, 5, 2, 4))))
+        self.assertIsNone(cache.get(('x', (3, 5, 2, 4))))
+        self.assertIsNone(cache.get(('', (3, 6, 2, 4))))
+        self.assertEqual(
+            {'hits': 1, 'misses': 2, 'evictions': 0, 'tiles': 1, 'cells': 9,
+             'bytes': cache.bytes},
+            cache.stats())
+        cache.reset_stats()
+        self.assertEqual(0, cache.stats()['misses'])
+
+    def test_too_large(self):
+        cache = hyou.tile.TileCache(max_cells=4)
+        cache.put(('', (0, 2, 0, 2)), [['a']])
+        cache.put(('', (0, 3, 0, 2)), [['b']])
+        self.assertEqual(1, len(cache))
+        self.assertEqual(0, cache.stats()['evictions'])
+
+    def test_discard(self):
+        cache = hyou.tile.TileCache()
+        cache.put(('', (0, 2, 0, 2)), [['a']])
+        cache.put(('', (0, 2, 2, 4)), [['b']])
+        cache.discard(1, 5, 2, 3)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(4, cache.cells)
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.bytes)
+
+
+class TileViewTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        key = self.server.create_spreadsheet('Book', [('Sheet1', 100, 10)])
+        self.server.set_values(
+            key, 'Sheet1',
+            [['%d:%d' % (i, j) for j in range(10)] for i in range(100)])
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[key]['Sheet1']
+
+    def fetches(self):
+        return self.server.request_counts['sheets.spreadsheets.values.get']
+
+    def test_read(self):
+        view = self.worksheet.view(tile_size=(10, 4))
+        self.assertEqual('55:5', view[55][5])
+        self.assertEqual('56:7', view[56][7])
+        self.assertEqual(1, self.fetches())
+        self.assertEqual('99:9', view[-1][-1])
+        self.assertEqual(2, self.fetches())
+        self.assertEqual(['50:%d' % j for j in range(10)], list(view[50]))
+        self.assertEqual(4, self.fetches())
+
+    def test_shared(self):
+        self.worksheet.view(tile_size=(10, 4))[5][5]
+        view = self.worksheet.view(
+            start_row=3, end_row=8, start_col=4, tile_size=(10, 4))
+        self.assertEqual('7:6', view[4][2])
+        self.assertEqual(1, self.fetches())
+        # Tiles of different fetch parameters are not shared.
+        view = self.worksheet.view(
+            fetch_params={'valueRenderOption': 'FORMULA'}, tile_size=(10, 4))
+        self.assertEqual('5:5', view[5][5])
+        self.assertEqual(2, self.fetches())
+
+    def test_budget(self):
+        self.worksheet.tile_cache = hyou.tile.TileCache(max_cells=80)
+        view = self.worksheet.view(tile_size=(10, 4))
+        view[0][0]
+        view[10][0]
+        view[20][0]
+        view[0][0]
+        self.assertEqual(4, self.fetches())
+
+    def test_write(self):
+        view = self.worksheet.view(tile_size=(10, 4))
+        other = self.worksheet.view(end_row=10, tile_size=(10, 4))
+        self.assertEqual('1:1', other[1][1])
+        view[1][1] = 'x'
+        self.assertEqual('x', view[1][1])
+        self.assertEqual('1:1', other[1][1])
+        view.commit()
+        self.assertEqual('x', other[1][1])
+        self.assertEqual(2, self.fetches())
+
+    def test_shrunk_worksheet(self):
+        view = self.worksheet.view(tile_size=(4, 4))
+        self.worksheet.set_size(100, 6)
+        self.assertEqual('0:1', view[0][1])
+        # Reading cells out of the worksheet fails instead of looping.
+        with self.assertRaises(googleapiclient.errors.HttpError):
+            list(view[0])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.worksheet.view(tile_size=(0, 4))
+        with self.assertRaises(TypeError):
+            self.worksheet.view(tile_size=(1.5, 4))
+
+
+class SharedCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet(
+            'Book', [('Sheet1', 10, 5)])
+        self.server.set_values(
+            self.key, 'Sheet1',
+            [['%d:%d' % (i, j) for j in range(5)] for i in range(10)])
+        self.spreadsheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]
+        self.worksheet = self.spreadsheet['Sheet1']
+
+    def fetches(self):
+        return (
+            self.server.request_counts['sheets.spreadsheets.values.get'] +
+            self.server.request_counts['sheets.spreadsheets.values.batchGet'])
+
+    def test_overlapping_views(self):
+        self.assertEqual('3:3', self.worksheet.view(end_row=5)[3][3])
+        view = self.worksheet.view(start_row=1, end_row=4, start_col=2)
+        self.assertEqual(['2:2', '2:3', '2:4'], list(view[1]))
+        self.assertEqual('3:1', self.worksheet.view(tile_size=(2, 2))[3][1])
+        self.assertEqual(1, self.fetches())
+        self.spreadsheet.fetch_views([
+            self.worksheet.view(end_row=2),
+            self.worksheet.view(start_row=5)])
+        self.assertEqual(2, self.fetches())
+        self.assertEqual(
+            {'hits': 3, 'misses': 2},
+            {name: value
+             for name, value in self.worksheet.tile_cache.stats().items()
+             if name in ('hits', 'misses')})
+
+    def test_bypass(self):
+        self.assertEqual('0:0', self.worksheet.view()[0][0])
+        self.server.set_values(self.key, 'Sheet1', [['changed']])
+        # Cells cached by the first view are stale.
+        self.assertEqual('0:0', self.worksheet.view()[0][0])
+        view = self.worksheet.view(use_tile_cache=False)
+        self.assertEqual('changed', view[0][0])
+        self.assertEqual(2, self.fetches())
+        # Cells fetched without the cache are not shared.
+        self.assertEqual('0:0', self.worksheet.view()[0][0])
+        self.spreadsheet.fetch_views(
+            [self.worksheet.view(end_row=1, use_tile_cache=False)])
+        self.assertEqual(3, self.fetches())
+        with self.assertRaises(ValueError):
+            self.worksheet.view(tile_size=(2, 2), use_tile_cache=False)
+
+    def test_iter_rows(self):
+        rows = list(self.worksheet.iter_rows(chunk_rows=3))
+        self.assertEqual(10, len(rows))
+        self.assertEqual(0, len(self.worksheet.tile_cache))
+
+    def test_invalidation(self):
+        view = self.worksheet.view()
+        view[0][0] = 'x'
+        view.commit()
+        self.assertEqual('x', self.worksheet.view(end_row=1)[0][0])
+        self.worksheet.view(start_row=2).clear()
+        self.assertEqual('', self.worksheet.view(start_row=5)[0][0])
+        self.assertEqual('1:1', self.worksheet.view()[1][1])
+        self.worksheet.refresh()
+        self.assertEqual(0, len(self.worksheet.tile_cache))
+        self.assertEqual('1:1', self.worksheet.view()[1][1])
+        self.assertEqual(4, self.fetches())
+
+    def test_refreshed_spreadsheet(self):
+        old_worksheet = self.worksheet
+        self.assertEqual('0:0', old_worksheet.view()[0][0])
+        self.spreadsheet.add_worksheet('Sheet2', rows=1, cols=1)
+        worksheet = self.spreadsheet['Sheet1']
+        self.assertIsNot(old_worksheet, worksheet)
+        self.assertIs(old_worksheet.tile_cache, worksheet.tile_cache)
+        view = worksheet.view()
+        view[0][0] = 'z'
+        view.commit()
+        self.assertEqual('z', old_worksheet.view()[0][0])
+        self.spreadsheet.delete_worksheet('Sheet2')
+        self.assertEqual('z', old_worksheet.view()[0][0])
+        self.assertEqual(2, self.fetches())
+        self.spreadsheet.refresh()
+        self.assertEqual(0, len(old_worksheet.tile_cache))
@@ -0,0 +1,131 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import hyou.api
+import hyou.collection
+import hyou.typed
+import hyou.util
+
+from . import fake_server
+
+
+class TypedValuesTest(unittest.TestCase):
+
+    def test_schema(self):
+        typed = hyou.typed.TypedValues({'A': int, 'AA': float, 3: str})
+        self.assertEqual({0: int, 26: float, 3: str}, typed.schema)
+        self.assertEqual(
+            {'valueRenderOption': 'UNFORMATTED_VALUE',
+             'dateTimeRenderOption': 'SERIAL_NUMBER'},
+            typed.params)
+        with self.assertRaises(ValueError):
+            hyou.typed.TypedValues({'A': list})
+        with self.assertRaises(ValueError):
+            hyou.typed.TypedValues({'A1': int})
+
+    def test_decode(self):
+        typed = hyou.typed.TypedValues({
+            'B': int, 'C': float, 'D': bool, 'E': str,
+            'F': datetime.datetime, 'G': datetime.date})
+        values = [
+            ['x', 3.0, 1, 0, True, 43831.75, 43831.75],
+            ['y', '', 2.5, True, 12],
+            ['z'],
+        ]
+        self.assertEqual(
+            [['x', 3, 1.0, False, 'TRUE',
+              datetime.datetime(2020, 1, 1, 18), datetime.date(2020, 1, 1)],
+             ['y', '', 2.5, True, '12'],
+             ['z']],
+            typed.decode(values, 0, 7))
+        # The input is left unmodified.
+        self.assertEqual(3.0, values[0][1])
+        self.assertIs(int, type(typed.decode(values, 0, 7)[0][1]))
+
+    def test_decode_offset(self):
+        typed = hyou.typed.TypedValues({'C': int, 'Z': int})
+        self.assertEqual([[1.5, 2]], typed.decode([[1.5, 2.0]], 1, 3))
+        values = [[1.5]]
+        self.assertIs(values, typed.decode(values, 3, 5))
+
+    def test_decode_error(self):
+        typed = hyou.typed.TypedValues({'B': int})
+        for value in ('abc', 1.5):
+            with self.assertRaisesRegex(ValueError, 'column B'):
+                typed.decode([[0, value]], 0, 2)
+        typed = hyou.typed.TypedValues({'A': datetime.date})
+        with self.assertRaises(ValueError):
+            typed.decode([['#N/A']], 0, 1)
+
+
+class TypedViewTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet('Book', [('Sheet1', 5, 3)])
+        self.server.set_values(
+            self.key, 'Sheet1',
+            [['a', 1, 43831], ['b', 2.5, 43832.5], ['c', 'TRUE', '']])
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]['Sheet1']
+        self.uris = []
+        request = self.server.request
+
+        def record(uri, *args, **kwargs):
+            self.uris.append(uri)
+            return request(uri, *args, **kwargs)
+
+        self.server.request = record
+
+    def test_view(self):
+        view = self.worksheet.view(
+            end_row=3,
+            fetch_params=hyou.typed.TypedValues({'C': datetime.date}))
+        self.assertEqual(
+            [['a', 1, datetime.date(2020, 1, 1)],
+             ['b', 2.5, datetime.date(2020, 1, 2)],
+             ['c', True, '']],
+            [list(row) for row in view])
+        self.assertEqual(1, len(self.uris))
+        self.assertIn('valueRenderOption=UNFORMATTED_VALUE', self.uris[0])
+        self.assertIn('dateTimeRenderOption=SERIAL_NUMBER', self.uris[0])
+
+    def test_tiles(self):
+        view = self.worksheet.view(
+            fetch_params=hyou.typed.TypedValues({'B': float, 'C': int}),
+            tile_size=(2, 2))
+        self.assertEqual(1.0, view[0][1])
+        self.assertEqual(1.0, view[2][1])
+        self.assertIs(float, type(view[2][1]))
+        # Only tiles containing a cell failing to decode raise.
+        with self.assertRaises(ValueError):
+            view[0][2]
+        self.assertEqual('', view[2][2])
+
+    def test_schemas_not_shared(self):
+        view = self.worksheet.view(
+            fetch_params=hyou.typed.TypedValues({'C': datetime.date}))
+        self.assertEqual(datetime.date(2020, 1, 1), view[0][2])
+        view = self.worksheet.view(fetch_params=hyou.typed.TypedValues())
+        self.assertEqual(43831, view[0][2])
+        self.assertEqual(2, len(self.uris))
+
+    def test_iter_rows(self):
+        rows = list(self.worksheet.iter_rows(
+            chunk_rows=2, end_row=3,
+            fetch_params=hyou.typed.TypedValues({'B': str})))
+        self.assertEqual(['1', '2.5', 'TRUE'], [row[1] for row in rows])
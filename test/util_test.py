@@ -34,6 +34,16 @@ class MiscUtilsTest(unittest.TestCase):
         assert hyou.util.format_column_address(26 + 26 * 26) == 'AAA'
         assert hyou.util.format_column_address(27 + 26 * 26) == 'AAB'
 
+    def test_parse_column_address(self):
+        assert hyou.util.parse_column_address('A') == 0
+        assert hyou.util.parse_column_address('Z') == 25
+        assert hyou.util.parse_column_address('AA') == 26
+        assert hyou.util.parse_column_address('zz') == 26 + 26 * 26 - 1
+        assert hyou.util.parse_column_address('AAB') == 27 + 26 * 26
+        for address in ('', 'A1', 'Ａ'):
+            with self.assertRaises(ValueError):
+                hyou.util.parse_column_address(address)
+
     def test_format_range_a1_notation(self):
         assert (
             hyou.util.format_range_a1_notation('test', 1, 5, 3, 7)
@@ -154,6 +164,58 @@ class LazyOrderedDictionaryTest(unittest.TestCase):
         self.enumerator.return_value = [('B', 'banana')]
         self.assertRaises(KeyError, self.dict.__getitem__, 'A')
 
+    def test_enumerate_incrementally(self):
+        consumed = []
+
+        def enumerate_fruits():
+            for key, value in [
+                    ('A', 'apple'), ('B', 'banana'), ('C', 'cinamon')]:
+                consumed.append(key)
+                yield (key, value)
+
+        self.enumerator.side_effect = enumerate_fruits
+        self.assertEqual('apple', self.dict[0])
+        self.assertEqual(['A'], consumed)
+        for key in self.dict:
+            if key == 'B':
+                break
+        self.assertEqual(['A', 'B'], consumed)
+        self.assertEqual('cinamon', self.dict[-1])
+        self.assertEqual(['A', 'B', 'C'], consumed)
+        self.assertEqual(['A', 'B', 'C'], self.dict.keys())
+        self.assertEqual(1, self.enumerator.call_count)
+
+    def test_construct_while_enumerating(self):
+        self.enumerator.return_value = [('A', 'apple'), ('B', 'banana')]
+        self.constructor.side_effect = ['bacon', 'cherry']
+        self.assertEqual('apple', self.dict[0])
+        self.assertEqual('bacon', self.dict['B'])
+        self.assertEqual('cherry', self.dict['C'])
+        self.assertEqual(['A', 'B', 'C'], self.dict.keys())
+        self.assertEqual(['apple', 'bacon', 'cherry'], self.dict.values())
+
+    def test_no_constructor_indexing_incrementally(self):
+        self.dict = hyou.util.LazyOrderedDictionary(
+            enumerator=self.enumerator, constructor=None)
+        self.enumerator.return_value = iter(
+            [('A', 'apple'), ('B', 'banana')])
+        self.assertEqual('apple', self.dict['A'])
+        self.assertEqual('banana', self.dict['B'])
+        self.assertEqual(2, len(self.dict))
+
+    def test_enumerate_error(self):
+        def enumerate_fruits():
+            yield ('A', 'apple')
+            raise IOError()
+
+        self.enumerator.side_effect = enumerate_fruits
+        self.assertEqual('apple', self.dict[0])
+        with self.assertRaises(IOError):
+            self.dict.keys()
+        self.enumerator.side_effect = None
+        self.enumerator.return_value = [('A', 'apple'), ('B', 'banana')]
+        self.assertEqual(['A', 'B'], self.dict.keys())
+
     def test_get(self):
         self.enumerator.return_value = [('A', 'apple')]
         self.constructor.return_value = None
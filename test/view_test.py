@@ -21,8 +21,12 @@ import pytest
 
 import hyou.api
 import hyou.collection
+import hyou.exception
+import hyou.storage
 import hyou.util
+import hyou.view
 
+from . import fake_server
 from . import http_mocks
 
 CREDENTIALS_FILE = 'unittest-sheets.json'
@@ -184,6 +188,15 @@ class RetryViewReadOnlyTest(RetryTestBase, ViewReadOnlyTest):
         self.error_http.sleep_mock.reset_mock()
 
 
+class ColumnarViewReadOnlyTest(ViewReadOnlyTest):
+    """Same tests as above, but with columnar cell storage."""
+
+    def setUp(self):
+        super(ColumnarViewReadOnlyTest, self).setUp()
+        self.view = self.worksheet1.view(
+            storage=hyou.storage.ColumnarStorage)
+
+
 class ViewReadWriteTest(ViewTestBase):
 
     @classmethod
@@ -280,6 +293,15 @@ class RetryViewReadWriteTest(RetryTestBase, ViewReadWriteTest):
         self.error_http.max_sleep = original_max_sleep
 
 
+class ColumnarViewReadWriteTest(ViewReadWriteTest):
+    """Same tests as above, but with columnar cell storage."""
+
+    def setUp(self):
+        super(ColumnarViewReadWriteTest, self).setUp()
+        self.view = self.worksheet1.view(
+            storage=hyou.storage.ColumnarStorage)
+
+
 class ViewClearTest(ViewTestBase):
 
     NUM_COLS = 10
@@ -306,3 +328,183 @@ class ViewClearTest(ViewTestBase):
         self.view.commit()
         self.view.clear()
         self.assertTrue(all(value == '' for row in self.view for value in row))
+
+
+class WriteQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet('Book', [('Sheet1', 3, 2)])
+        self.server.set_values(
+            self.key, 'Sheet1', [['c', '3'], ['a', '1'], ['b', '2']])
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]['Sheet1']
+        self.view = self.worksheet.view()
+
+    def queued(self):
+        return sorted(
+            (row, col, value)
+            for row, queued in self.view._queued_updates.items()
+            for col, value in queued.items())
+
+    def test_last_write_wins(self):
+        for i in range(10):
+            self.view[0][0] = i
+        self.assertEqual([(0, 0, 9)], self.queued())
+        self.assertEqual(9, self.view[0][0])
+
+    def test_unchanged(self):
+        self.view[0][0] = 'c'
+        self.assertEqual([(0, 0, 'c')], self.queued())
+        self.assertEqual('3', self.view[0][1])
+        self.view[0][0] = 'x'
+        self.view[0][0] = 'c'
+        self.view[1][1] = 1
+        self.assertEqual([(1, 1, 1)], self.queued())
+        self.view[1][1] = '1'
+        self.assertEqual([], self.queued())
+
+    def test_fetch_keeps_writes(self):
+        self.view[2][1] = 'x'
+        self.assertEqual(['b', 'x'], list(self.view[2]))
+        self.assertEqual([(2, 1, 'x')], self.queued())
+
+    def test_commit(self):
+        self.view[0][0] = 'x'
+        self.view.commit()
+        self.assertEqual([], self.queued())
+        self.view[0][0] = 'x'
+        self.assertEqual([], self.queued())
+        self.assertEqual(
+            [['x', '3'], ['a', '1'], ['b', '2']],
+            self.server.get_values(self.key, 'Sheet1'))
+
+    def test_sort(self):
+        self.view.sort()
+        self.assertEqual([['a', '1'], ['b', '2'], ['c', '3']], self.view)
+        self.view.reverse()
+        self.assertEqual(
+            [(1, 0, 'b'), (1, 1, '2'), (2, 0, 'a'), (2, 1, '1')],
+            self.queued())
+        self.view.commit()
+        self.assertEqual(
+            [['c', '3'], ['b', '2'], ['a', '1']],
+            self.server.get_values(self.key, 'Sheet1'))
+
+
+class ChunkedCommitTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet('Book', [('Sheet1', 4, 3)])
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]['Sheet1']
+        self.view = self.worksheet.view()
+        for i in range(4):
+            self.view[i] = ['%d:%d' % (i, j) for j in range(3)]
+
+    def requests(self):
+        return self.server.request_counts[
+            'sheets.spreadsheets.values.batchUpdate']
+
+    def test_chunk_rects(self):
+        rects = [(0, 3, 0, 2, [['a', 'b'], ['c', 'd'], ['e', 'f']]),
+                 (5, 6, 0, 5, [['g', 'h', 'i', 'j', 'k']])]
+        self.assertEqual(
+            [[(0, 2, 0, 2, [['a', 'b'], ['c', 'd']])],
+             [(2, 3, 0, 2, [['e', 'f']])],
+             [(5, 6, 0, 4, [['g', 'h', 'i', 'j']])],
+             [(5, 6, 4, 5, [['k']])]],
+            hyou.view._chunk_rects(rects, 4, 10 ** 6))
+        chunks = hyou.view._chunk_rects(rects, 100, 110)
+        self.assertEqual(6, len(chunks))
+        self.assertEqual(
+            rects[0][4], [row for chunk in chunks[:3] for row in chunk[0][4]])
+
+    def test_commit(self):
+        progress = []
+        self.view.commit(
+            progress=lambda *args: progress.append(args), chunk_cells=3)
+        self.assertEqual(4, self.requests())
+        self.assertEqual([(3, 12), (6, 12), (9, 12), (12, 12)],
+                         sorted(progress))
+        self.assertEqual(
+            [['%d:%d' % (i, j) for j in range(3)] for i in range(4)],
+            self.server.get_values(self.key, 'Sheet1'))
+        self.assertEqual({}, self.view._queued_updates)
+
+    def test_partial_failure(self):
+        original = hyou.view.View._commit_chunk
+
+        def commit_chunk(view, chunk):
+            if chunk[0][0] == 2:
+                raise ValueError('failed')
+            original(view, chunk)
+
+        with mock.patch.object(
+                hyou.view.View, '_commit_chunk', autospec=True,
+                side_effect=commit_chunk):
+            with self.assertRaises(hyou.exception.HyouCommitError) as cm:
+                self.view.commit(chunk_cells=6)
+        self.assertEqual(6, cm.exception.committed_cells)
+        self.assertEqual(6, cm.exception.failed_cells)
+        [(ranges, error)] = cm.exception.errors
+        self.assertEqual(["'Sheet1'!A3:C4"], ranges)
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual([2, 3], sorted(self.view._queued_updates))
+        self.view.commit()
+        self.assertEqual(
+            [['%d:%d' % (i, j) for j in range(3)] for i in range(4)],
+            self.server.get_values(self.key, 'Sheet1'))
+
+
+class LargeViewTest(unittest.TestCase):
+
+    def test_create(self):
+        worksheet = mock.Mock(rows=10 ** 9, cols=26)
+        view = hyou.view.View(
+            worksheet, None, start_row=0, end_row=10 ** 9, start_col=0,
+            end_col=26)
+        self.assertEqual(10 ** 9, len(view))
+        self.assertEqual(10 ** 9 - 1, view[-1]._row)
+        self.assertEqual([5, 6], [row._row for row in view[5:7]])
+        self.assertFalse(hasattr(view, '__dict__'))
+        self.assertFalse(hasattr(view[0], '__dict__'))
+
+
+class CoalesceUpdatesTest(unittest.TestCase):
+
+    def test_empty(self):
+        self.assertEqual([], hyou.view._coalesce_updates([]))
+
+    def test_single_cell(self):
+        self.assertEqual(
+            [(3, 4, 2, 3, [['a']])],
+            hyou.view._coalesce_updates([(3, 2, 'a')]))
+
+    def test_rectangle(self):
+        updates = [
+            (row, col, '%d-%d' % (row, col))
+            for row in range(10) for col in range(5)]
+        updates.reverse()
+        self.assertEqual(
+            [(0, 10, 0, 5,
+              [['%d-%d' % (row, col) for col in range(5)]
+               for row in range(10)])],
+            hyou.view._coalesce_updates(updates))
+
+    def test_last_write_wins(self):
+        self.assertEqual(
+            [(0, 1, 0, 2, [['c', 'b']])],
+            hyou.view._coalesce_updates(
+                [(0, 0, 'a'), (0, 1, 'b'), (0, 0, 'c')]))
+
+    def test_disjoint(self):
+        self.assertEqual(
+            [(0, 2, 0, 2, [['a', 'b'], ['c', 'd']]),
+             (0, 2, 3, 4, [['x'], ['y']]),
+             (2, 3, 0, 1, [['e']]),
+             (3, 4, 3, 4, [['z']])],
+            hyou.view._coalesce_updates(
+                [(0, 0, 'a'), (0, 1, 'b'), (1, 0, 'c'), (1, 1, 'd'),
+                 (2, 0, 'e'), (0, 3, 'x'), (1, 3, 'y'), (3, 3, 'z')]))
@@ -17,12 +17,16 @@ import unittest
 from unittest import mock
 
 import googleapiclient.errors
+import httplib2
 import pytest
 
 import hyou.api
 import hyou.collection
+import hyou.exception
 import hyou.util
+import hyou.worksheet
 
+from . import fake_server
 from . import http_mocks
 
 CREDENTIALS_FILE = 'unittest-sheets.json'
@@ -75,6 +79,12 @@ class WorksheetReadOnlyTest(WorksheetTestBase):
     def test_repr(self):
         self.assertEqual(str('Worksheet(key=0)'), repr(self.worksheet1))
 
+    def test_refresh(self):
+        self.worksheet1.refresh()
+        self.assertEqual('Sheet1', self.worksheet1.title)
+        self.assertEqual(2, self.worksheet1.rows)
+        self.assertEqual(5, self.worksheet1.cols)
+
     def test_view(self):
         self.worksheet1.view(start_row=3)
         self.worksheet1.view(end_row=-1)
@@ -83,6 +93,37 @@ class WorksheetReadOnlyTest(WorksheetTestBase):
         self.worksheet1.view(end_col=-1)
         self.worksheet1.view(start_col=1, end_col=0)
 
+    def test_iter_rows(self):
+        expected = [
+            ['honoka', 'eri', 'kotori', 'umi', 'rin'],
+            ['maki', 'nozomi', 'hanayo', 'niko', '']]
+        self.assertEqual(expected, list(self.worksheet1.iter_rows()))
+        self.assertEqual(
+            expected, list(self.worksheet1.iter_rows(chunk_rows=1)))
+        self.assertEqual(
+            expected,
+            list(self.worksheet1.iter_rows(chunk_rows=1, prefetch=0)))
+        self.assertEqual(
+            expected,
+            list(self.worksheet1.iter_rows(chunk_rows=1, prefetch=5)))
+        self.assertEqual(
+            [['nozomi', 'hanayo']],
+            list(self.worksheet1.iter_rows(
+                chunk_rows=1, start_row=1, start_col=1, end_col=3)))
+        self.assertEqual([], list(self.worksheet1.iter_rows(start_row=2)))
+
+    def test_iter_rows_break(self):
+        rows = self.worksheet1.iter_rows(chunk_rows=1)
+        self.assertEqual(
+            ['honoka', 'eri', 'kotori', 'umi', 'rin'], next(rows))
+        rows.close()
+
+    def test_iter_rows_invalid(self):
+        with self.assertRaises(ValueError):
+            list(self.worksheet1.iter_rows(chunk_rows=0))
+        with self.assertRaises(ValueError):
+            list(self.worksheet1.iter_rows(prefetch=-1))
+
 
 class RetryWorksheetReadOnlyTest(RetryTestBase, WorksheetReadOnlyTest):
     """Same tests as above, but involving retries on server errors."""
@@ -92,6 +133,98 @@ class RetryWorksheetReadOnlyTest(RetryTestBase, WorksheetReadOnlyTest):
         self.error_http.sleep_mock.reset_mock()
 
 
+class WorksheetRefreshTest(unittest.TestCase):
+
+    ENTRY = {'properties': {'sheetId': 7, 'title': 'old'}}
+
+    def setUp(self):
+        self.sheets = mock.MagicMock()
+        patcher = mock.patch.object(
+            hyou.api.API, 'sheets', new_callable=mock.PropertyMock,
+            return_value=self.sheets)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.api = hyou.api.API(mock.Mock(), discovery=False)
+        spreadsheet = mock.Mock(key='abc')
+        self.worksheet = hyou.worksheet.Worksheet(
+            spreadsheet, self.api, self.ENTRY)
+        self.get = self.sheets.spreadsheets.return_value.get
+
+    def _error(self, status):
+        return googleapiclient.errors.HttpError(
+            httplib2.Response({'status': status}), b'')
+
+    def test_scoped(self):
+        new_entry = {'properties': {'sheetId': 7, 'title': 'old', 'x': 1}}
+        self.get.return_value.execute.return_value = {'sheets': [new_entry]}
+        self.worksheet.refresh()
+        self.assertEqual(new_entry, self.worksheet._entry)
+        self.get.assert_called_once_with(
+            spreadsheetId='abc', ranges="'old'", includeGridData=False,
+            fields='sheets.properties')
+
+    def test_full_entry(self):
+        new_entry = {'properties': {'sheetId': 7, 'title': 'old'},
+                     'conditionalFormats': []}
+        self.get.return_value.execute.return_value = {'sheets': [new_entry]}
+        self.worksheet.refresh(full_entry=True)
+        self.assertEqual(new_entry, self.worksheet._entry)
+        self.assertEqual('sheets', self.get.call_args[1]['fields'])
+
+    def test_renamed(self):
+        new_entry = {'properties': {'sheetId': 7, 'title': 'new'}}
+        self.get.return_value.execute.side_effect = [
+            self._error(400),
+            {'sheets': [
+                {'properties': {'sheetId': 3, 'title': 'old'}}, new_entry]},
+        ]
+        self.worksheet.refresh()
+        self.assertEqual('new', self.worksheet.title)
+        self.assertEqual(2, self.get.call_count)
+        self.assertNotIn('ranges', self.get.call_args[1])
+
+    def test_removed(self):
+        self.get.return_value.execute.side_effect = [
+            {'sheets': [{'properties': {'sheetId': 3, 'title': 'old'}}]},
+            {'sheets': [{'properties': {'sheetId': 3, 'title': 'old'}}]},
+        ]
+        with self.assertRaises(hyou.exception.HyouRuntimeError):
+            self.worksheet.refresh()
+
+
+class AppendRowsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet(
+            'Book', [('Sheet1', 5, 3)])
+        self.server.set_values(self.key, 'Sheet1', [['a'], [], ['b', 'c']])
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]['Sheet1']
+
+    def test_append_rows(self):
+        rows = ([i, None, b'x'] for i in range(5))
+        self.assertEqual(5, self.worksheet.append_rows(rows, batch_size=2))
+        self.assertEqual(
+            3, self.server.request_counts['sheets.spreadsheets.values.append'])
+        self.assertEqual(10, self.worksheet.rows)
+        self.assertEqual(
+            [['a'], [], ['b', 'c']] + [[str(i), '', 'x'] for i in range(5)],
+            self.server.get_values(self.key, 'Sheet1'))
+        self.worksheet.refresh()
+        self.assertEqual(10, self.worksheet.rows)
+
+    def test_append_rows_empty(self):
+        self.assertEqual(0, self.worksheet.append_rows([]))
+        self.assertEqual(
+            0, self.server.request_counts['sheets.spreadsheets.values.append'])
+        self.assertEqual(5, self.worksheet.rows)
+
+    def test_append_rows_invalid(self):
+        with self.assertRaises(ValueError):
+            self.worksheet.append_rows([['a']], batch_size=0)
+
+
 class WorksheetReadWriteTest(WorksheetTestBase):
 
     def setUp(self):
@@ -0,0 +1,165 @@
+# Copyright 2017 Google Inc. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import hyou.api
+import hyou.collection
+import hyou.exception
+import hyou.view
+
+from . import fake_server
+
+
+class WriteBehindTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = fake_server.FakeServer()
+        self.key = self.server.create_spreadsheet('Book', [('Sheet1', 4, 3)])
+        self.worksheet = hyou.collection.Collection(
+            hyou.api.API(self.server, discovery=False))[self.key]['Sheet1']
+        self.view = self.worksheet.view()
+
+    def requests(self):
+        return self.server.request_counts[
+            'sheets.spreadsheets.values.batchUpdate']
+
+    def wait_committed(self):
+        deadline = time.monotonic() + 5
+        while self.view._queued_updates and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual({}, self.view._queued_updates)
+
+    def test_flush(self):
+        with self.view.write_behind(max_cells=None, max_age=None) as wb:
+            self.view[0][0] = 'a'
+            self.view[1][1] = 'b'
+            self.assertEqual(0, self.requests())
+            wb.flush()
+            self.assertEqual(1, self.requests())
+            self.assertEqual(
+                [['a'], ['', 'b']],
+                self.server.get_values(self.key, 'Sheet1'))
+            self.assertIs(wb, self.view._write_behind)
+            self.view[2][2] = 'c'
+        self.assertTrue(wb.closed)
+        self.assertIsNone(self.view._write_behind)
+        self.assertEqual(2, self.requests())
+        self.assertEqual(
+            [['a'], ['', 'b'], ['', '', 'c']],
+            self.server.get_values(self.key, 'Sheet1'))
+        # Writes after closing are not flushed.
+        self.view[3][0] = 'd'
+        self.assertEqual({3: {0: 'd'}}, self.view._queued_updates)
+        with self.assertRaises(hyou.exception.HyouRuntimeError):
+            wb.flush()
+
+    def test_max_cells(self):
+        with self.view.write_behind(max_cells=3, max_age=None):
+            self.view[0][:2] = ['a', 'b']
+            time.sleep(0.05)
+            self.assertEqual(0, self.requests())
+            self.view[1][0] = 'c'
+            self.wait_committed()
+            self.assertEqual(1, self.requests())
+        self.assertEqual(1, self.requests())
+        self.assertEqual(
+            [['a', 'b'], ['c']], self.server.get_values(self.key, 'Sheet1'))
+
+    def test_max_bytes(self):
+        with self.view.write_behind(max_cells=None, max_bytes=10,
+                                    max_age=None):
+            self.view[0][0] = 'abc'
+            time.sleep(0.05)
+            self.assertEqual(0, self.requests())
+            self.view[0][1] = 'defg'
+            self.wait_committed()
+            self.assertEqual(1, self.requests())
+
+    def test_max_age(self):
+        with self.view.write_behind(max_cells=None, max_age=0.05):
+            self.view[0][0] = 'a'
+            self.wait_committed()
+            self.assertEqual(1, self.requests())
+            self.assertEqual([['a']],
+                             self.server.get_values(self.key, 'Sheet1'))
+
+    def test_write_while_flushing(self):
+        original = hyou.view.View._commit_chunk
+        started = threading.Event()
+        resume = threading.Event()
+
+        def commit_chunk(view, chunk):
+            started.set()
+            resume.wait(5)
+            original(view, chunk)
+
+        with mock.patch.object(hyou.view.View, '_commit_chunk', commit_chunk):
+            with self.view.write_behind(max_cells=1, max_age=None):
+                self.view[0][0] = 'a'
+                self.assertTrue(started.wait(5))
+                # The producer is not blocked by the flush in progress.
+                self.view[0][0] = 'b'
+                self.view[1][0] = 'c'
+                resume.set()
+        self.assertEqual({}, self.view._queued_updates)
+        self.assertEqual([['b'], ['c']],
+                         self.server.get_values(self.key, 'Sheet1'))
+
+    def test_error(self):
+        error = ValueError('boom')
+        with mock.patch.object(
+                hyou.view.View, '_commit_chunk', side_effect=error):
+            wb = self.view.write_behind(max_cells=1, max_age=None)
+            self.view[0][0] = 'a'
+            deadline = time.monotonic() + 5
+            while wb._error is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # Raised to the producer on the next write.
+            with self.assertRaises(ValueError):
+                self.view[1][0] = 'b'
+            self.assertEqual({0: {0: 'a'}}, self.view._queued_updates)
+            with self.assertRaises(ValueError):
+                wb.flush()
+        # Failed writes are retried by the next flush.
+        self.view[1][0] = 'b'
+        wb.close()
+        self.assertTrue(wb.closed)
+        self.assertEqual([['a'], ['b']],
+                         self.server.get_values(self.key, 'Sheet1'))
+
+    def test_close_error(self):
+        wb = self.view.write_behind(max_cells=None, max_age=None)
+        self.view[0][0] = 'a'
+        with mock.patch.object(
+                hyou.view.View, '_commit_chunk',
+                side_effect=ValueError('boom')):
+            with self.assertRaises(ValueError):
+                wb.close()
+        self.assertTrue(wb.closed)
+        self.assertIsNone(self.view._write_behind)
+        self.assertEqual({0: {0: 'a'}}, self.view._queued_updates)
+
+    def test_enabled_twice(self):
+        with self.view.write_behind():
+            with self.assertRaises(hyou.exception.HyouRuntimeError):
+                self.view.write_behind()
+
+    def test_invalid_threshold(self):
+        with self.assertRaises(ValueError):
+            self.view.write_behind(max_cells=0)
+        self.assertIsNone(self.view._write_behind)